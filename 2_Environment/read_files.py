@@ -3,9 +3,16 @@
 This animation demonstrates reading and processing files from the environment.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
 
-class FileReadAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.scene import ProjectScene
+
+class FileReadAnimation(ProjectScene):
     def construct(self):
         # Title
         title = Text("Environment: Reading Files", font_size=48)
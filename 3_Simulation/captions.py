@@ -0,0 +1,126 @@
+"""
+3_Simulation: Caption Track
+Burns the narration subtitles into a caption overlay for DaVinci Resolve.
+
+Cues are streamed from the SRT one at a time. Every word is drawn from the
+shared text outline cache, so a word is rendered by Pango once per project
+however many cues use it, and between cues only the words that changed are
+swapped in; words that repeat stay on screen. Each cue is a single static
+frame held for its duration, so the track renders in time linear in the
+number of cues while only the current line is kept in memory.
+"""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from manim import *
+
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.scene import ProjectScene
+from pipeline.subtitles import TIMELINE_START, iter_srt
+from pipeline.text_cache import cached_text
+
+SUBTITLES = "3_Simulation/input/source_subtitle.srt"
+
+# "|" spans ascender to descender, so words rendered between two of them
+# share one vertical frame (a common baseline) when centered
+STRUT = "|"
+
+
+class CaptionTrackAnimation(ProjectScene):
+    """
+    Caption track for the full video (00:00:00 - end of the SRT).
+    Set `start`/`end` (seconds) to render only part of the track.
+    """
+
+    # Hours at 1080p60: only rendered when named, e.g. by this file's __main__
+    render_by_default = False
+
+    start = 0.0
+    end = None
+    font_size = 36
+    line_spacing = 0.55
+    bottom = DOWN * 3.2
+
+    def construct(self):
+        self.words = []  # (word, mobject) currently on screen
+        self.space = cached_text(f"{STRUT} {STRUT}", font_size=self.font_size).width - \
+            cached_text(STRUT * 2, font_size=self.font_size).width
+
+        self.frames = 0  # frames written since `start`
+        # All cues render into one segment instead of a partial movie per wait
+        with self.timeline():
+            for cue in iter_srt(Path(__file__).resolve().parents[1] / SUBTITLES, TIMELINE_START):
+                if cue.end <= self.start:
+                    continue
+                if self.end is not None and cue.start >= self.end:
+                    break
+
+                # Silence before the cue: clear the line
+                if self.frame_at(cue.start) > self.frames:
+                    self.show([])
+                    self.hold(cue.start)
+
+                # Overlapping cues start where the previous one stopped
+                end = cue.end if self.end is None else min(cue.end, self.end)
+                if self.frame_at(end) <= self.frames:
+                    continue
+                self.show(cue.text.split("\n"))
+                self.hold(end)
+
+    def frame_at(self, t):
+        """Index of the track frame at SRT time `t`."""
+        return round((t - self.start) * config.frame_rate)
+
+    def hold(self, until):
+        """Keep the current frame on screen up to SRT time `until`."""
+        frames = self.frame_at(until) - self.frames
+        # Counted in whole frames so cue boundaries never drift. manim writes
+        # int(duration * fps) frames; the half frame stops n / fps from giving n - 1
+        self.wait((frames + 0.5) / config.frame_rate)
+        self.frames += frames
+
+    def word(self, word):
+        """Glyphs of one word, positioned in the shared strut frame."""
+        framed = cached_text(f"{STRUT}{word}{STRUT}", font_size=self.font_size)
+        glyphs = VGroup(*framed.submobjects[1:-1])
+        # Remember the word's offset inside the frame so it lines up on the baseline
+        glyphs.frame_offset = framed.get_center() - glyphs.get_center()
+        glyphs.word = word
+        return glyphs
+
+    def show(self, lines):
+        """Put `lines` on screen, reusing the mobjects of words already shown."""
+        reusable = defaultdict(list)
+        for word, mobject in self.words:
+            reusable[word].append(mobject)
+
+        placed = []
+        for row, line in enumerate(reversed(lines)):
+            words = [reusable[w].pop() if reusable[w] else self.word(w) for w in line.split()]
+            width = sum(w.width for w in words) + self.space * max(len(words) - 1, 0)
+            x = -width / 2
+            y = self.bottom + UP * row * self.line_spacing
+            for mobject in words:
+                # Place the strut frame's center, not the word's own center
+                target = y + RIGHT * (x + mobject.width / 2) - UP * mobject.frame_offset[1]
+                mobject.move_to(target)
+                x += mobject.width + self.space
+                placed.append((mobject.word, mobject))
+
+        kept = {id(m) for _, m in placed}
+        self.remove(*[m for _, m in self.words if id(m) not in kept])
+        self.add(*[m for _, m in placed if m not in self.mobjects])
+        self.words = placed
+
+
+# Render script
+if __name__ == "__main__":
+    # One encoder for the whole track, ProRes 4444 with alpha so the captions
+    # sit straight on the Resolve timeline (see pipeline/encoder.py)
+    from pipeline.orchestrator import main
+
+    output_dir = Path(__file__).resolve().parent / "output"
+    sys.exit(main(["-q", "h", "--output", "prores", "--media-dir", str(output_dir), "3_Simulation/captions.py"]))
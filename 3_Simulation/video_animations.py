@@ -4,10 +4,24 @@ This module contains animations created from the storyboard, graphics, and shot
 All animations are optimized for video production and DaVinci Resolve integration.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
-import numpy as np
 
-class StaticVsDynamicAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.animations import BatchTransform
+from pipeline.particles import ParticleSystem
+from pipeline.scene import ProjectScene
+from pipeline.subtitles import load_cues, scene_range
+from pipeline.templates import card_grid, color, load_rows, stat_grid
+from pipeline.text_cache import cached_text
+
+# Narration timing for the scenes (times relative to the start of the video)
+SUBTITLES = "3_Simulation/input/source_subtitle.srt"
+
+class StaticVsDynamicAnimation(ProjectScene):
     """
     Scene 3: Static vs. Dynamic (00:00:35 - 00:00:48)
     Visualizes the transformation from static rules to dynamic AI.
@@ -32,17 +46,17 @@ class StaticVsDynamicAnimation(Scene):
         ])
 
         # Dynamic side - Fluid mercury (represented by flowing particles)
-        dynamic_particles = VGroup(*[
-            Dot(color=BLUE, radius=0.08).shift(
-                RIGHT * 3.5 + UP * np.random.uniform(-2, 2) + LEFT * np.random.uniform(0, 1)
-            )
-            for _ in range(50)
-        ])
+        dynamic_particles = ParticleSystem.scatter(
+            50, x_range=(2.5, 3.5), y_range=(-2, 2), palette=[BLUE], radius=0.08
+        )
 
         # Show labels and elements
         self.play(Write(left_label), Write(right_label), run_time=0.8)
         self.play(FadeIn(static_blocks), run_time=1)
-        self.play(LaggedStart(*[FadeIn(p) for p in dynamic_particles], lag_ratio=0.02), run_time=1.5)
+        self.play(
+            UpdateFromAlphaFunc(dynamic_particles, lambda m, a: m.reveal(a, lag_ratio=0.02)),
+            run_time=1.5
+        )
         self.wait(0.5)
 
         # Breaking chains animation
@@ -67,15 +81,15 @@ class StaticVsDynamicAnimation(Scene):
 
         # Transformation - static blocks dissolve into dynamic particles
         self.play(
-            *[block.animate.scale(0.1).set_opacity(0) for block in static_blocks],
-            *[p.animate.shift(LEFT * 7 + np.random.randn(3) * 0.3) for p in dynamic_particles],
+            BatchTransform(static_blocks, scale=0.1, opacity=0),
+            dynamic_particles.animate.shift(LEFT * 7).random_walk(0.3),
             run_time=2
         )
 
         self.wait(1)
 
 
-class GitCloneAnimation(Scene):
+class GitCloneAnimation(ProjectScene):
     """
     Scene 4: Repository Cloning Animation (00:00:48 - 00:03:52)
     Visualizes the git clone process.
@@ -125,30 +139,39 @@ class GitCloneAnimation(Scene):
 
         self.play(Create(arrow), run_time=1)
 
-        # Clone command text
+        # Beats timed from the narration cues inside this scene's range
+        cues = load_cues(SUBTITLES)
+        start, end = scene_range(self.__doc__)
+        demo_cue = cues.find("terminal git clone demo", start, end)
+        clone_cue = cues.find("going to clone", start, end)
+
+        # Clone command text, written while the demo is announced
         command = Text("$ git clone https://github.com/...", font_size=28, color=YELLOW)
         command.next_to(arrow, RIGHT, buff=0.3)
-        self.play(Write(command), run_time=1.5)
+        self.play(Write(command), run_time=demo_cue.duration)
         self.wait(0.5)
 
-        # Files copying animation
-        for i, file in enumerate(files):
-            file_copy = file.copy().set_color(YELLOW)
-            self.play(
-                file_copy.animate.move_to(computer.get_center() + UP * (0.5 - i * 0.3)),
-                run_time=0.4
-            )
-            self.play(file_copy.animate.set_color(GREEN), run_time=0.2)
+        # Files copying animation, spread over the "going to clone" cue
+        # (the short per-file plays render as one segment)
+        per_file = clone_cue.duration / len(files)
+        with self.timeline():
+            for i, file in enumerate(files):
+                file_copy = file.copy().set_color(YELLOW)
+                self.play(
+                    file_copy.animate.move_to(computer.get_center() + UP * (0.5 - i * 0.3)),
+                    run_time=per_file * 2 / 3
+                )
+                self.play(file_copy.animate.set_color(GREEN), run_time=per_file / 3)
 
         # Success indicator
-        checkmark = Text("✓", font_size=72, color=GREEN)
+        checkmark = cached_text("✓", font_size=72, color=GREEN)
         checkmark.move_to(computer.get_center())
         self.play(FadeIn(checkmark, scale=2), run_time=0.6)
 
         self.wait(1.5)
 
 
-class SpeedMultiplierAnimation(Scene):
+class SpeedMultiplierAnimation(ProjectScene):
     """
     Scene 8: The Engine Room - Speed Multiplier (00:08:26 - 00:09:01)
     Shows 1000x speed improvement visualization.
@@ -212,7 +235,7 @@ class SpeedMultiplierAnimation(Scene):
         self.wait(1.5)
 
 
-class CICDPipelineAnimation(Scene):
+class CICDPipelineAnimation(ProjectScene):
     """
     Scene 11: CI/CD Pipeline Flow (00:13:15 - 00:17:24)
     Visualizes the continuous integration and deployment pipeline.
@@ -239,75 +262,77 @@ class CICDPipelineAnimation(Scene):
         start_x = -5
         spacing = 2.5
 
-        for i, stage in enumerate(stages):
-            # Stage box
-            box = RoundedRectangle(
-                height=1.2,
-                width=1.8,
-                corner_radius=0.2,
-                color=stage["color"],
-                fill_opacity=0.3,
-                stroke_width=3
-            )
-            box.shift(RIGHT * (start_x + i * spacing))
-
-            # Icon
-            icon = Text(stage["icon"], font_size=36, color=stage["color"])
-            icon.move_to(box.get_center() + UP * 0.2)
-
-            # Label
-            label = Text(stage["name"], font_size=24, color=WHITE)
-            label.move_to(box.get_center() + DOWN * 0.3)
-
-            stage_group = VGroup(box, icon, label)
-            stage_objects.add(stage_group)
-
-            # Create stage with animation
-            self.play(FadeIn(stage_group, shift=DOWN * 0.3), run_time=0.5)
-
-            # Arrow between stages (except for last stage)
-            if i < len(stages) - 1:
-                arrow = Arrow(
-                    box.get_right(),
-                    box.get_right() + RIGHT * (spacing - 1.8),
-                    buff=0,
-                    color=WHITE,
+        # Stages, arrows and data flow are many short plays: render them as one segment
+        with self.timeline():
+            for i, stage in enumerate(stages):
+                # Stage box
+                box = RoundedRectangle(
+                    height=1.2,
+                    width=1.8,
+                    corner_radius=0.2,
+                    color=stage["color"],
+                    fill_opacity=0.3,
                     stroke_width=3
                 )
-                self.play(Create(arrow), run_time=0.4)
-
-        self.wait(0.8)
+                box.shift(RIGHT * (start_x + i * spacing))
+
+                # Icon
+                icon = cached_text(stage["icon"], font_size=36, color=stage["color"])
+                icon.move_to(box.get_center() + UP * 0.2)
+
+                # Label
+                label = cached_text(stage["name"], font_size=24, color=WHITE)
+                label.move_to(box.get_center() + DOWN * 0.3)
+
+                stage_group = VGroup(box, icon, label)
+                stage_objects.add(stage_group)
+
+                # Create stage with animation
+                self.play(FadeIn(stage_group, shift=DOWN * 0.3), run_time=0.5)
+
+                # Arrow between stages (except for last stage)
+                if i < len(stages) - 1:
+                    arrow = Arrow(
+                        box.get_right(),
+                        box.get_right() + RIGHT * (spacing - 1.8),
+                        buff=0,
+                        color=WHITE,
+                        stroke_width=3
+                    )
+                    self.play(Create(arrow), run_time=0.4)
+
+            self.wait(0.8)
+
+            # Data flow animation (dot traveling through pipeline)
+            flow_dot = Dot(color=YELLOW, radius=0.15)
+            flow_dot.move_to(stage_objects[0].get_center())
+
+            self.play(FadeIn(flow_dot, scale=2), run_time=0.3)
+
+            for i in range(len(stages) - 1):
+                # Highlight current stage
+                self.play(
+                    stage_objects[i][0].animate.set_fill(opacity=0.6),
+                    run_time=0.3
+                )
 
-        # Data flow animation (dot traveling through pipeline)
-        flow_dot = Dot(color=YELLOW, radius=0.15)
-        flow_dot.move_to(stage_objects[0].get_center())
+                # Move dot to next stage
+                self.play(
+                    flow_dot.animate.move_to(stage_objects[i + 1].get_center()),
+                    run_time=0.6
+                )
 
-        self.play(FadeIn(flow_dot, scale=2), run_time=0.3)
+                # Add checkmark
+                check = cached_text("✓", font_size=32, color=GREEN)
+                check.next_to(stage_objects[i], UP, buff=0.2)
+                self.play(FadeIn(check, scale=1.5), run_time=0.3)
 
-        for i in range(len(stages) - 1):
-            # Highlight current stage
+            # Final stage highlight
             self.play(
-                stage_objects[i][0].animate.set_fill(opacity=0.6),
+                stage_objects[-1][0].animate.set_fill(opacity=0.6),
                 run_time=0.3
             )
 
-            # Move dot to next stage
-            self.play(
-                flow_dot.animate.move_to(stage_objects[i + 1].get_center()),
-                run_time=0.6
-            )
-
-            # Add checkmark
-            check = Text("✓", font_size=32, color=GREEN)
-            check.next_to(stage_objects[i], UP, buff=0.2)
-            self.play(FadeIn(check, scale=1.5), run_time=0.3)
-
-        # Final stage highlight
-        self.play(
-            stage_objects[-1][0].animate.set_fill(opacity=0.6),
-            run_time=0.3
-        )
-
         # Success message
         success = Text("✓ Deployment Successful!", font_size=36, color=GREEN)
         success.to_edge(DOWN, buff=0.5)
@@ -316,83 +341,28 @@ class CICDPipelineAnimation(Scene):
         self.wait(2)
 
 
-class LLMFeatureCardsAnimation(Scene):
+class LLMFeatureCardsAnimation(ProjectScene):
     """
     Scene 9: The Digital Feast - LLM Feature Cards (00:09:01 - 00:11:45)
     Shows comparison of different LLM options.
     """
+    # Card rows; weekly variants subclass with another file
+    data = "3_Simulation/input/llm_cards.yaml"
+
     def construct(self):
+        rows = load_rows(self.data)
+
         # Title
-        title = Text("Choose Your AI Assistant", font_size=48)
+        title = Text(rows["title"], font_size=48)
         title.to_edge(UP)
         self.play(Write(title), run_time=1)
         self.wait(0.5)
 
-        # LLM data
-        llms = [
-            {
-                "name": "Claude",
-                "tagline": "The Reasoning Layer",
-                "features": ["Sonnet 3.5, 4.5, 4.6", "Complex Problems", "Code Analysis"],
-                "color": ORANGE
-            },
-            {
-                "name": "ChatGPT",
-                "tagline": "The Versatile Leader",
-                "features": ["Search & Browse", "Plugins", "General Purpose"],
-                "color": GREEN
-            },
-            {
-                "name": "DeepSeek",
-                "tagline": "The Coding Disruptor",
-                "features": ["Free & Powerful", "Development Focus", "Open Source"],
-                "color": BLUE
-            },
-            {
-                "name": "Gemini",
-                "tagline": "The Versatile Platform",
-                "features": ["Multi-modal", "Images & Code", "Google Integration"],
-                "color": PURPLE
-            }
-        ]
-
-        # Create and display cards one by one
-        for i, llm in enumerate(llms):
-            # Card container
-            card = RoundedRectangle(
-                height=3.5,
-                width=3,
-                corner_radius=0.3,
-                color=llm["color"],
-                fill_opacity=0.2,
-                stroke_width=4
-            )
-            card.shift(LEFT * 4.5 + RIGHT * (i * 3.3))
-
-            # Name
-            name = Text(llm["name"], font_size=32, color=llm["color"], weight=BOLD)
-            name.move_to(card.get_top() + DOWN * 0.5)
-
-            # Tagline
-            tagline = Text(llm["tagline"], font_size=18, color=WHITE)
-            tagline.move_to(card.get_center() + UP * 0.5)
-
-            # Features
-            features_group = VGroup()
-            for j, feature in enumerate(llm["features"]):
-                feature_text = Text(f"• {feature}", font_size=16, color=GRAY)
-                feature_text.move_to(card.get_center() + DOWN * (0.2 + j * 0.4))
-                features_group.add(feature_text)
-
-            # Logo placeholder (circle with initial)
-            logo = Circle(radius=0.4, color=llm["color"], fill_opacity=0.5)
-            logo.move_to(card.get_center() + UP * 1.2)
-            logo_text = Text(llm["name"][0], font_size=36, color=WHITE)
-            logo_text.move_to(logo.get_center())
-
-            card_group = VGroup(card, logo, logo_text, name, tagline, features_group)
+        # Cards are laid out once and loaded from the template cache
+        cards = card_grid(rows["cards"])
 
-            # Animate card entrance
+        # Display cards one by one
+        for card_group in cards:
             self.play(
                 FadeIn(card_group, shift=UP * 0.5),
                 run_time=0.8
@@ -400,64 +370,33 @@ class LLMFeatureCardsAnimation(Scene):
             self.wait(0.3)
 
         # "100+ Options" text
-        options_text = Text("100+ AI Models Available", font_size=32, color=GOLD)
+        options_text = Text(rows["footer"], font_size=32, color=GOLD)
         options_text.to_edge(DOWN, buff=0.5)
         self.play(Write(options_text), run_time=1)
 
         self.wait(2)
 
 
-class NumberCounterAnimation(Scene):
+class NumberCounterAnimation(ProjectScene):
     """
     Animated number counter for statistics (37+ commits, 240 workflows, etc.)
     """
+    # Stat rows; weekly variants subclass with another file
+    data = "3_Simulation/input/stats.yaml"
+
     def construct(self):
+        rows = load_rows(self.data)
+
         # Title
-        title = Text("Project Evolution", font_size=48)
+        title = Text(rows["title"], font_size=48)
         title.to_edge(UP)
         self.play(Write(title), run_time=1)
         self.wait(0.5)
 
-        # Statistics
-        stats = [
-            {"label": "Workflows Built", "value": 240, "color": BLUE},
-            {"label": "Commits Made", "value": 37, "color": GREEN},
-            {"label": "Days Active", "value": 90, "color": PURPLE},
-            {"label": "Accuracy %", "value": 98, "color": GOLD}
-        ]
-
-        stat_objects = VGroup()
-
-        for i, stat in enumerate(stats):
-            # Container
-            box = RoundedRectangle(
-                height=1.5,
-                width=3,
-                corner_radius=0.2,
-                color=stat["color"],
-                fill_opacity=0.2,
-                stroke_width=3
-            )
-
-            # Position in 2x2 grid
-            row = i // 2
-            col = i % 2
-            box.shift(
-                LEFT * 2 + RIGHT * (col * 4.5) +
-                UP * 1.5 + DOWN * (row * 2.5)
-            )
-
-            # Number (will be animated)
-            number = Integer(0, font_size=48, color=stat["color"])
-            number.move_to(box.get_center() + UP * 0.3)
-
-            # Label
-            label = Text(stat["label"], font_size=22, color=WHITE)
-            label.move_to(box.get_center() + DOWN * 0.4)
-
-            stat_group = VGroup(box, number, label)
-            stat_objects.add(stat_group)
+        # Boxes, counters and labels come from the template cache
+        stat_objects = stat_grid(rows["stats"])
 
+        for stat, (box, number, label) in zip(rows["stats"], stat_objects):
             # Show box and label
             self.play(
                 FadeIn(box),
@@ -473,8 +412,8 @@ class NumberCounterAnimation(Scene):
             )
 
             # Add "+" if applicable
-            if stat["label"] in ["Workflows Built", "Commits Made"]:
-                plus = Text("+", font_size=36, color=stat["color"])
+            if stat.get("plus"):
+                plus = cached_text("+", font_size=36, color=color(stat["color"]))
                 plus.next_to(number, RIGHT, buff=0.1)
                 self.play(FadeIn(plus), run_time=0.2)
 
@@ -483,31 +422,9 @@ class NumberCounterAnimation(Scene):
 
 # Render script
 if __name__ == "__main__":
-    import os
-
-    # Output directory
-    output_dir = "/Users/rifaterdemsahin/projects/Manim/3_Simulation/output"
-    os.makedirs(output_dir, exist_ok=True)
-
-    scenes = [
-        "StaticVsDynamicAnimation",
-        "GitCloneAnimation",
-        "SpeedMultiplierAnimation",
-        "CICDPipelineAnimation",
-        "LLMFeatureCardsAnimation",
-        "NumberCounterAnimation"
-    ]
+    # Render all scenes of this module in parallel (see pipeline/orchestrator.py)
+    from pipeline.orchestrator import main
 
+    output_dir = Path(__file__).resolve().parent / "output"
     print("Rendering animations for video production...")
-    for scene in scenes:
-        print(f"\n{'='*50}")
-        print(f"Rendering: {scene}")
-        print(f"{'='*50}\n")
-
-        cmd = f'manim -pqh --format=mp4 --media_dir "{output_dir}" 3_Simulation/video_animations.py {scene}'
-        os.system(cmd)
-
-    print("\n" + "="*50)
-    print("All animations rendered successfully!")
-    print(f"Output location: {output_dir}")
-    print("="*50)
+    sys.exit(main(["-q", "h", "--media-dir", str(output_dir), "3_Simulation/video_animations.py"]))
@@ -14,9 +14,16 @@ Each animation can be rendered individually or all at once using the script at t
 See README.md for detailed information about each animation.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
 
-class FormulaAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.scene import ProjectScene
+
+class FormulaAnimation(ProjectScene):
     def construct(self):
         # Title
         title = Text("Mathematical Formulas", font_size=48)
@@ -81,7 +88,7 @@ class FormulaAnimation(Scene):
         self.wait(2)
 
 
-class QuadraticFormulaAnimation(Scene):
+class QuadraticFormulaAnimation(ProjectScene):
     """Quadratic formula visualization"""
     def construct(self):
         # Title
@@ -124,7 +131,7 @@ class QuadraticFormulaAnimation(Scene):
         self.wait(2)
 
 
-class EulerFormulaAnimation(Scene):
+class EulerFormulaAnimation(ProjectScene):
     """Euler's formula and identity visualization"""
     def construct(self):
         # Title
@@ -164,7 +171,7 @@ class EulerFormulaAnimation(Scene):
         self.wait(2)
 
 
-class DerivativeAnimation(Scene):
+class DerivativeAnimation(ProjectScene):
     """Derivative visualization"""
     def construct(self):
         # Title
@@ -215,7 +222,7 @@ class DerivativeAnimation(Scene):
         self.wait(2)
 
 
-class IntegralAnimation(Scene):
+class IntegralAnimation(ProjectScene):
     """Integral visualization"""
     def construct(self):
         # Title
@@ -273,7 +280,7 @@ class IntegralAnimation(Scene):
         self.wait(2)
 
 
-class TrigIdentityAnimation(Scene):
+class TrigIdentityAnimation(ProjectScene):
     """Trigonometric identities visualization"""
     def construct(self):
         # Title
@@ -325,25 +332,9 @@ class TrigIdentityAnimation(Scene):
 
 
 if __name__ == "__main__":
-    import os
-    # You can render any of these animations:
-    # os.system("manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py FormulaAnimation")
-    # os.system("manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py QuadraticFormulaAnimation")
-    # os.system("manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py EulerFormulaAnimation")
-    # os.system("manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py DerivativeAnimation")
-    # os.system("manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py IntegralAnimation")
-    # os.system("manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py TrigIdentityAnimation")
-    
-    # Render all animations
-    animations = [
-        "FormulaAnimation",
-        "QuadraticFormulaAnimation", 
-        "EulerFormulaAnimation",
-        "DerivativeAnimation",
-        "IntegralAnimation",
-        "TrigIdentityAnimation"
-    ]
-    
-    for anim in animations:
-        print(f"\nRendering {anim}...")
-        os.system(f"manim -pql --format=mp4 --media_dir ./media 4_Formula/formula.py {anim}")
+    # Render every animation in this module in parallel (see pipeline/orchestrator.py).
+    # A single animation can still be rendered directly, e.g.:
+    # manim -pqh --format=mp4 --media_dir ./media 4_Formula/formula.py FormulaAnimation
+    from pipeline.orchestrator import main
+
+    sys.exit(main(["-q", "l", "--media-dir", "./media", "4_Formula/formula.py"]))
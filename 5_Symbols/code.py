@@ -3,9 +3,16 @@
 This animation demonstrates programming concepts and code symbols.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
 
-class CodeAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.scene import ProjectScene
+
+class CodeAnimation(ProjectScene):
     def construct(self):
         # Title
         title = Text("Programming Symbols", font_size=48)
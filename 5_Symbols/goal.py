@@ -3,9 +3,16 @@
 This animation represents exploring unknown territories and setting goals.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
 
-class GoalAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.scene import ProjectScene
+
+class GoalAnimation(ProjectScene):
     def construct(self):
         # Title
         title = Text("Goal: Exploring the Unknown", font_size=48)
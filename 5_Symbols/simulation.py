@@ -3,9 +3,17 @@
 This animation demonstrates a simulation process with particles.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
 
-class SimulationAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.particles import ParticleSystem
+from pipeline.scene import ProjectScene
+
+class SimulationAnimation(ProjectScene):
     def construct(self):
         # Title
         title = Text("Simulation: Particle System", font_size=48)
@@ -19,38 +27,23 @@ class SimulationAnimation(Scene):
         self.wait(0.5)
         
         # Create particles
-        particles = VGroup()
         num_particles = 30
-        
-        for i in range(num_particles):
-            particle = Dot(
-                color=random.choice([RED, BLUE, GREEN, YELLOW, PURPLE]),
-                radius=0.1
-            )
-            particle.move_to([
-                np.random.uniform(-4.5, 4.5),
-                np.random.uniform(-2, 2),
-                0
-            ])
-            particles.add(particle)
-        
-        self.play(LaggedStart(*[FadeIn(p) for p in particles], lag_ratio=0.05))
+        particles = ParticleSystem.scatter(
+            num_particles,
+            x_range=(-4.5, 4.5),
+            y_range=(-2, 2),
+            palette=[RED, BLUE, GREEN, YELLOW, PURPLE],
+            radius=0.1
+        )
+        
+        self.play(UpdateFromAlphaFunc(particles, lambda m, a: m.reveal(a, lag_ratio=0.05)))
         self.wait(0.5)
         
         # Animate particles with random movement
-        animations = []
-        for particle in particles:
-            new_pos = [
-                np.random.uniform(-4.5, 4.5),
-                np.random.uniform(-2, 2),
-                0
-            ]
-            animations.append(particle.animate.move_to(new_pos))
-        
-        self.play(*animations, run_time=2)
+        self.play(particles.animate.randomize((-4.5, 4.5), (-2, 2)), run_time=2)
         
         # Cluster particles
-        self.play(*[p.animate.move_to(ORIGIN + np.random.randn(3) * 0.5) for p in particles], run_time=1.5)
+        self.play(particles.animate.cluster_to(ORIGIN, spread=0.5), run_time=1.5)
         
         # Statistics
         stats = Text("Simulation Complete\nParticles: 30\nTime: 3.5s", font_size=28, color=GREEN)
@@ -3,9 +3,17 @@
 This animation demonstrates error detection and handling processes.
 """
 
+import sys
+from pathlib import Path
+
 from manim import *
 
-class ErrorAnimation(Scene):
+# Make the shared pipeline package importable when rendered via `manim <file>`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from pipeline.scene import ProjectScene
+from pipeline.text_cache import cached_text
+
+class ErrorAnimation(ProjectScene):
     def construct(self):
         # Title
         title = Text("Error Handling & Debugging", font_size=48)
@@ -71,7 +79,7 @@ answer = divide(10, 0)  # Returns error message""",
         )
         
         # Success indicator
-        success_icon = Text("✓", font_size=72, color=GREEN)
+        success_icon = cached_text("✓", font_size=72, color=GREEN)
         success_icon.next_to(error_code, RIGHT, buff=1)
         
         success_text = Text("Error Handled", font_size=28, color=GREEN)
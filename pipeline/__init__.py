@@ -0,0 +1,8 @@
+"""
+pipeline: Render Tooling for the Manim Animation Project
+Shared helpers for discovering, scheduling and rendering the scenes that live
+in the numbered concept folders (1_Real_Unknown ... 7_Testing_known).
+
+Run the full project render with:
+    python -m pipeline.orchestrator
+"""
@@ -0,0 +1,625 @@
+"""
+Asset Generation Queue
+Runs the image/video generation queue in 3_Simulation/input/.
+
+    python -m pipeline.assets plan                        # queue order and cost estimate
+    python -m pipeline.assets run -j 8                    # generate on fal.ai (FAL_KEY)
+    python -m pipeline.assets stub &                      # local stand-in for fal.ai
+    python -m pipeline.assets run --backend http://127.0.0.1:8766
+
+The queue is read from batch_generation_data.yaml, assets_config.json and
+icons.json (the first entry with an id wins). Entries start in priority
+order (HIGH, MEDIUM, LOW, then file order) on a bounded pool of async
+workers, so N requests take about ceil(N / workers) times the slowest
+latency instead of the sum of all of them.
+
+Every entry is priced from MODEL_COSTS before it starts, and its estimate is
+reserved against the budget while it runs. An entry that would take the
+spend (this run plus earlier runs) over the budget is not started; cheaper
+entries after it still run. The budget defaults to the "Budget: $2.00" line
+of the first queue file.
+
+The spend is an append-only ledger in the manifest: every attempt is
+charged before it is sent, and only refunded when the provider certainly did
+not bill it (HTTP 429 or a rejected request). Timeouts and 5xx answers count,
+and so does a request interrupted by a crash. A retry needs room in the
+budget like a new entry.
+
+Failed requests are retried with exponential backoff when the error is
+transient (timeouts, HTTP 429 and 5xx). Results land in media/assets/:
+
+    images/<id>_<name>.png     videos/<id>_<name>.mp4
+    asset_manifest.json        what was generated, from which request, and the spend ledger
+    asset_report.json          status, attempts and time of every entry in the last run
+
+An entry whose request (model, prompt, seed, parameters) is unchanged and
+whose file exists is not generated again.
+
+A backend is any object with `generate(entry) -> (bytes, content_type)`,
+plain or async. FalBackend talks to fal.ai's synchronous endpoints; the
+stub answers the same API with placeholder files after a configurable
+delay and failure rate.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT
+from pipeline.seeding import resolve_seed
+
+INPUT_DIR = PROJECT_ROOT / "3_Simulation" / "input"
+SOURCES = [
+    INPUT_DIR / "batch_generation_data.yaml",
+    INPUT_DIR / "assets_config.json",
+    INPUT_DIR / "icons.json",
+]
+ASSETS_DIR = MEDIA_DIR / "assets"
+MANIFEST_NAME = "asset_manifest.json"
+REPORT_NAME = "asset_report.json"
+
+PRIORITIES = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+DEFAULT_BUDGET = 2.00
+BUDGET_PATTERN = re.compile(r"Budget:\s*\$([\d.]+)")
+
+# Estimated USD per request: images are priced per megapixel, videos per clip
+MODEL_COSTS = {
+    "fal-ai/flux/schnell": {"per_megapixel": 0.003},
+    "fal-ai/flux/dev": {"per_megapixel": 0.025},
+    "fal-ai/minimax/video-01": {"per_request": 0.25},
+}
+
+# fal.ai's named image sizes; landscape_4_3 is its default
+IMAGE_SIZES = {
+    "square_hd": (1024, 1024),
+    "square": (512, 512),
+    "portrait_4_3": (768, 1024),
+    "portrait_16_9": (576, 1024),
+    "landscape_4_3": (1024, 768),
+    "landscape_16_9": (1024, 576),
+}
+
+FAL_URL = "https://fal.run"
+STUB_PORT = 8766
+STUB_URL = f"http://127.0.0.1:{STUB_PORT}"
+
+EXTENSIONS = {"image/png": ".png", "image/jpeg": ".jpg", "image/webp": ".webp", "video/mp4": ".mp4"}
+
+
+@dataclass
+class AssetEntry:
+    """One generation request from the queue files."""
+
+    id: str
+    name: str
+    kind: str  # "image" or "video"
+    priority: str
+    prompt: str
+    model: str
+    seed: int
+    params: dict = field(default_factory=dict)
+    scene: str = ""
+    source: str = ""
+
+    @property
+    def rank(self):
+        return PRIORITIES.get(self.priority.upper(), len(PRIORITIES))
+
+    def payload(self):
+        """The request body sent to the model."""
+        return dict(prompt=self.prompt, seed=self.seed, **self.params)
+
+    @property
+    def request_hash(self):
+        material = json.dumps({"model": self.model, **self.payload()}, sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class AssetResult:
+    """Outcome of one queue entry."""
+
+    id: str
+    status: str  # ok, cached, failed, over_budget
+    cost: float = 0.0
+    attempts: int = 0
+    seconds: float = 0.0
+    path: str = ""
+    error: str = ""
+
+
+class BackendError(Exception):
+    """
+    A failed generation request; `retryable` when trying again may succeed,
+    `billed` unless the provider certainly did not charge for it.
+    """
+
+    def __init__(self, message, retryable=True, billed=True):
+        super().__init__(message)
+        self.retryable = retryable
+        self.billed = billed
+
+
+class OverBudget(BackendError):
+    """A retry that the remaining budget cannot pay for."""
+
+    def __init__(self, message):
+        super().__init__(message, retryable=False, billed=False)
+
+
+# The queue
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".json":
+            return json.load(f)
+        import yaml
+        return yaml.safe_load(f)
+
+
+def _entries_in(data):
+    """(kind, row) for every request in a queue file, whatever its layout."""
+    if isinstance(data, list):
+        return [("image", row) for row in data]
+    rows = []
+    for section, items in (data or {}).items():
+        kind = "video" if section.startswith("video") else "image"
+        rows += [(kind, row) for row in items or [] if isinstance(row, dict)]
+    return rows
+
+
+def _params(kind, row):
+    params = {}
+    if "image_size" in row:
+        params["image_size"] = row["image_size"]
+    if "num_inference_steps" in row:
+        params["num_inference_steps"] = row["num_inference_steps"]
+    if kind == "video":
+        if "duration_seconds" in row:
+            params["duration"] = row["duration_seconds"]
+        if "aspect_ratio" in row:
+            params["aspect_ratio"] = row["aspect_ratio"]
+    return params
+
+
+def load_queue(paths=SOURCES):
+    """Entries from the queue files, in the order they should start."""
+    entries, seen = [], set()
+    for path in map(Path, paths):
+        if not path.exists():
+            continue
+        for kind, row in _entries_in(_read(path)):
+            if "id" not in row or "prompt" not in row or row["id"] in seen:
+                continue
+            seen.add(row["id"])
+            # An explicit seed wins; otherwise the seed_key names a stable seed
+            seed = row.get("seed")
+            if seed is None:
+                seed = resolve_seed(row.get("seed_key") or row["id"])
+            entries.append(AssetEntry(
+                id=row["id"],
+                name=row.get("name", row["id"]),
+                kind=kind,
+                priority=row.get("priority", "LOW"),
+                prompt=row["prompt"],
+                model=row.get("model", ""),
+                seed=int(seed),
+                params=_params(kind, row),
+                scene=row.get("scene", ""),
+                source=path.name,
+            ))
+    # sorted() is stable: file order within a priority
+    return sorted(entries, key=lambda e: e.rank)
+
+
+def default_budget(paths=SOURCES):
+    """The "Budget: $X" noted in the first existing queue file, else DEFAULT_BUDGET."""
+    for path in map(Path, paths):
+        try:
+            match = BUDGET_PATTERN.search(path.read_text(encoding="utf-8"))
+        except OSError:
+            continue
+        return float(match.group(1)) if match else DEFAULT_BUDGET
+    return DEFAULT_BUDGET
+
+
+def _megapixels(entry):
+    size = entry.params.get("image_size", "landscape_4_3")
+    if isinstance(size, dict):
+        width, height = size.get("width", 1024), size.get("height", 768)
+    else:
+        width, height = IMAGE_SIZES.get(size, IMAGE_SIZES["landscape_4_3"])
+    return width * height / 1e6
+
+
+def estimate_cost(entry, costs=MODEL_COSTS):
+    """Estimated USD for one request, or None for a model without a price."""
+    price = costs.get(entry.model)
+    if price is None:
+        return None
+    if "per_megapixel" in price:
+        return round(price["per_megapixel"] * _megapixels(entry), 6)
+    return price["per_request"]
+
+
+# Backends
+
+def _fetch(url, timeout):
+    if url.startswith("data:"):
+        header, data = url.split(",", 1)
+        content_type = header[5:].split(";")[0]
+        return base64.b64decode(data), content_type
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read(), response.headers.get_content_type()
+
+
+class FalBackend:
+    """fal.ai's synchronous endpoints (POST <base_url>/<model>), or anything that answers like them."""
+
+    def __init__(self, base_url=FAL_URL, key=None, timeout=600):
+        self.base_url = base_url.rstrip("/")
+        self.key = key if key is not None else os.environ.get("FAL_KEY")
+        self.timeout = timeout
+
+    def generate(self, entry):
+        request = urllib.request.Request(
+            f"{self.base_url}/{entry.model}",
+            data=json.dumps(dict(entry.payload(), num_images=1) if entry.kind == "image" else entry.payload()).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        if self.key:
+            request.add_header("Authorization", f"Key {self.key}")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                result = json.load(response)
+            media = result["video"] if entry.kind == "video" else result["images"][0]
+            return _fetch(media["url"], self.timeout)
+        except urllib.error.HTTPError as exc:
+            # Rate limits and server errors pass; a rejected request will not.
+            # Only a server error may still have run (and been billed)
+            raise BackendError(
+                f"HTTP {exc.code}: {exc.reason}", retryable=exc.code == 429 or exc.code >= 500, billed=exc.code >= 500,
+            )
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as exc:
+            raise BackendError(str(exc))
+        except (KeyError, IndexError, ValueError) as exc:
+            raise BackendError(f"unexpected response: {exc!r}", retryable=False)
+
+
+# The runner
+
+def load_manifest(assets_dir=ASSETS_DIR):
+    """{"assets": {id: generated asset}, "ledger": [charge or refund of every attempt]}"""
+    path = Path(assets_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {"assets": {}, "ledger": []}
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if "assets" not in manifest:
+        # Manifests before the ledger were {id: asset}; their costs were paid
+        manifest = {"assets": manifest, "ledger": [
+            {"id": id, "request": item["request"], "cost": item.get("cost", 0.0), "outcome": "ok"}
+            for id, item in manifest.items()
+        ]}
+    return manifest
+
+
+def manifest_spent(manifest):
+    """Everything spent, or possibly spent, across runs."""
+    return round(sum(charge["cost"] for charge in manifest["ledger"]), 6)
+
+
+def save_manifest(manifest, assets_dir=ASSETS_DIR):
+    path = Path(assets_dir) / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".json.partial")
+    with open(partial, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(partial, path)
+
+
+def asset_path(entry, content_type, assets_dir=ASSETS_DIR):
+    extension = EXTENSIONS.get(content_type, ".mp4" if entry.kind == "video" else ".png")
+    return Path(assets_dir) / f"{entry.kind}s" / f"{entry.id}_{entry.name}{extension}"
+
+
+class AssetQueue:
+    """Priority queue of entries drained by a bounded pool of async workers."""
+
+    def __init__(self, backend, budget, assets_dir=ASSETS_DIR, workers=4, retries=3,
+                 backoff=2.0, costs=MODEL_COSTS, on_result=None):
+        self.backend = backend
+        self.assets_dir = Path(assets_dir)
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.costs = costs
+        self.on_result = on_result
+        self.manifest = load_manifest(self.assets_dir)
+        # Spend of earlier runs counts against the same budget
+        self.spent = manifest_spent(self.manifest)
+        self.budget = budget
+        self.reserved = 0.0
+        self.in_flight = 0
+
+    def cached(self, entry):
+        item = self.manifest["assets"].get(entry.id)
+        return item is not None and item["request"] == entry.request_hash and Path(item["path"]).exists()
+
+    def _fits(self, estimate):
+        return self.spent + self.reserved + estimate <= self.budget + 1e-9
+
+    def _record(self, entry, cost, attempt, outcome):
+        # Saved at once: a crash mid-request must not lose the charge
+        self.spent += cost
+        self.manifest["ledger"].append({
+            "id": entry.id, "request": entry.request_hash, "attempt": attempt,
+            "cost": cost, "outcome": outcome, "time": round(time.time(), 3),
+        })
+        save_manifest(self.manifest, self.assets_dir)
+
+    async def run(self, entries):
+        queue = asyncio.PriorityQueue()
+        # Created here, on the loop that runs the queue
+        self._settled = asyncio.Condition()
+        for order, entry in enumerate(entries):
+            queue.put_nowait((entry.rank, order, entry))
+        results = {}
+        workers = [asyncio.create_task(self._worker(queue, results)) for _ in range(self.workers)]
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        return [results[entry.id] for entry in entries]
+
+    async def _worker(self, queue, results):
+        while True:
+            _, _, entry = await queue.get()
+            try:
+                result = await self._process(entry)
+            except Exception as exc:  # keep the rest of the queue going
+                result = AssetResult(entry.id, "failed", error=f"{type(exc).__name__}: {exc}")
+            results[entry.id] = result
+            if self.on_result:
+                self.on_result(entry, result)
+            queue.task_done()
+
+    async def _process(self, entry):
+        if self.cached(entry):
+            return AssetResult(entry.id, "cached", path=self.manifest["assets"][entry.id]["path"])
+        estimate = estimate_cost(entry, self.costs)
+        if estimate is None:
+            return AssetResult(entry.id, "failed", error=f"no cost estimate for model {entry.model!r}")
+        # Hard stop: never start a request that could take the spend over budget.
+        # Room held by requests in flight may come back; wait for them to settle
+        async with self._settled:
+            await self._settled.wait_for(lambda: self._fits(estimate) or not self.in_flight)
+            if not self._fits(estimate):
+                return AssetResult(entry.id, "over_budget", cost=estimate,
+                                   error=f"${estimate:.3f} would exceed the ${self.budget:.2f} budget")
+            self.reserved += estimate
+            self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            data, content_type, attempts, charged = await self._generate(entry, estimate)
+        except BackendError as exc:
+            status = "over_budget" if isinstance(exc, OverBudget) else "failed"
+            return AssetResult(entry.id, status, cost=exc.cost, attempts=exc.attempts,
+                               seconds=time.perf_counter() - start, error=str(exc))
+        finally:
+            async with self._settled:
+                self.reserved -= estimate
+                self.in_flight -= 1
+                self._settled.notify_all()
+
+        path = asset_path(entry, content_type, self.assets_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.manifest["assets"][entry.id] = {
+            "request": entry.request_hash, "path": str(path), "cost": estimate,
+            "model": entry.model, "seed": entry.seed, "prompt": entry.prompt,
+        }
+        save_manifest(self.manifest, self.assets_dir)
+        return AssetResult(entry.id, "ok", cost=charged, attempts=attempts,
+                           seconds=time.perf_counter() - start, path=str(path))
+
+    async def _generate(self, entry, estimate):
+        """(data, content_type, attempts, cost); every attempt that may be billed is charged."""
+        generate = self.backend.generate
+        charged = 0.0
+        for attempt in range(1, self.retries + 2):
+            # The entry's reservation pays for this attempt; earlier ones are spent
+            if attempt > 1 and self.spent + self.reserved > self.budget + 1e-9:
+                exc = OverBudget(f"retry {attempt} would exceed the ${self.budget:.2f} budget")
+                exc.attempts, exc.cost = attempt - 1, charged
+                raise exc
+            self._record(entry, estimate, attempt, "sent")
+            charged += estimate
+            try:
+                if asyncio.iscoroutinefunction(generate):
+                    data, content_type = await generate(entry)
+                else:
+                    data, content_type = await asyncio.to_thread(generate, entry)
+                return data, content_type, attempt, charged
+            except BackendError as exc:
+                if not exc.billed:
+                    self._record(entry, -estimate, attempt, f"refund: {exc}")
+                    charged -= estimate
+                if not exc.retryable or attempt > self.retries:
+                    exc.attempts, exc.cost = attempt, charged
+                    raise
+                # Exponential backoff with jitter, so retries do not arrive together
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+
+
+def write_report(results, wall_seconds, assets_dir=ASSETS_DIR):
+    path = Path(assets_dir) / REPORT_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"wall_seconds": round(wall_seconds, 2), "assets": [asdict(r) for r in results]}, f, indent=2)
+    return path
+
+
+# The stub
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers POST /<model> like fal.ai, with a placeholder file as a data: URL."""
+
+    protocol_version = "HTTP/1.0"
+    latency = 1.0
+    jitter = 0.5
+    fail_rate = 0.0
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+        if random.random() < self.fail_rate:
+            self.send_error(503, "stub failure")
+            return
+        if "video" in self.path:
+            url = "data:video/mp4;base64," + base64.b64encode(b"stub video for " + request.get("prompt", "").encode("utf-8")).decode()
+            self._send_json({"video": {"url": url, "content_type": "video/mp4"}})
+        else:
+            url = "data:image/png;base64," + base64.b64encode(self._image(request)).decode()
+            self._send_json({"images": [{"url": url, "content_type": "image/png"}], "seed": request.get("seed")})
+
+    def _image(self, request):
+        from PIL import Image
+
+        size = request.get("image_size", "landscape_4_3")
+        width, height = (size["width"], size["height"]) if isinstance(size, dict) else IMAGE_SIZES.get(size, (1024, 768))
+        # One flat color per seed: the same request gives the same file
+        rng = random.Random(request.get("seed"))
+        image = Image.new("RGB", (width, height), tuple(rng.randrange(256) for _ in range(3)))
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_stub(host="127.0.0.1", port=STUB_PORT, latency=1.0, jitter=0.5, fail_rate=0.0):
+    handler = type("Stub", (StubHandler,), {"latency": latency, "jitter": jitter, "fail_rate": fail_rate})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    print(f"🧪 Stub generation backend on http://{host}:{port} ({latency:.1f}s ±{jitter:.1f}s, {fail_rate:.0%} failures)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# CLI
+
+def print_plan(entries, budget, costs=MODEL_COSTS, manifest=None):
+    spent = manifest_spent(manifest) if manifest else 0.0
+    total = spent
+    print(f"{'id':<16} {'priority':<8} {'model':<26} {'cost':>7} {'total':>7}")
+    for entry in entries:
+        cost = estimate_cost(entry, costs)
+        if cost is None:
+            mark = "no price"
+        elif total + cost > budget + 1e-9:
+            mark = "over budget"
+        else:
+            total += cost
+            mark = ""
+        price = f"${cost:.3f}" if cost is not None else "-"
+        print(f"{entry.id:<16} {entry.priority:<8} {entry.model:<26} {price:>7} ${total:>6.2f}  {mark}")
+    print(f"💰 Budget ${budget:.2f}, already spent ${spent:.2f}, this queue ${total - spent:.2f}")
+
+
+def print_summary(results, wall_seconds, spent, budget):
+    print("\n" + "=" * 60)
+    for status, icon in (("ok", "✅"), ("cached", "♻️ "), ("over_budget", "💸"), ("failed", "❌")):
+        count = sum(1 for r in results if r.status == status)
+        if count:
+            print(f"{icon} {status}: {count}")
+    serial = sum(r.seconds for r in results)
+    print(f"⏱️  {wall_seconds:.1f}s wall ({serial:.1f}s of requests)")
+    print(f"💰 ${spent:.2f} of ${budget:.2f} spent")
+    print("=" * 60)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run the image/video generation queue.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (("plan", "Show the queue order and cost estimate"), ("run", "Generate the queue")):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("sources", nargs="*", type=Path, default=SOURCES, help="Queue files (default: 3_Simulation/input/)")
+        sub.add_argument("--only", nargs="+", default=None, metavar="ID", help="Only these entry ids")
+        sub.add_argument("--budget", type=float, default=None, help="Maximum total USD (default: the queue file's Budget line)")
+        sub.add_argument("--assets-dir", type=Path, default=ASSETS_DIR)
+    run_parser = commands.choices["run"]
+    run_parser.add_argument("-j", "--jobs", type=int, default=4, help="Concurrent requests")
+    run_parser.add_argument("--retries", type=int, default=3, help="Retries of a transient failure")
+    run_parser.add_argument("--backend", default=FAL_URL, metavar="URL", help=f"fal.ai or a compatible server, e.g. the stub at {STUB_URL}")
+    run_parser.add_argument("--timeout", type=float, default=600, help="Seconds per request")
+
+    stub_parser = commands.add_parser("stub", help="Serve a local stand-in for fal.ai")
+    stub_parser.add_argument("--port", type=int, default=STUB_PORT)
+    stub_parser.add_argument("--latency", type=float, default=1.0, help="Seconds per request")
+    stub_parser.add_argument("--jitter", type=float, default=0.5, help="Random +/- seconds per request")
+    stub_parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of requests answered with HTTP 503")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "stub":
+        serve_stub(port=args.port, latency=args.latency, jitter=args.jitter, fail_rate=args.fail_rate)
+        return 0
+
+    entries = load_queue(args.sources)
+    if args.only:
+        entries = [e for e in entries if e.id in set(args.only)]
+    budget = args.budget if args.budget is not None else default_budget(args.sources)
+    if args.command == "plan":
+        print_plan(entries, budget, manifest=load_manifest(args.assets_dir))
+        return 0
+
+    if args.backend == FAL_URL and not os.environ.get("FAL_KEY"):
+        print(f"❌ FAL_KEY is not set (or pass --backend {STUB_URL} for the stub)")
+        return 1
+    queue = AssetQueue(
+        FalBackend(args.backend, timeout=args.timeout), budget, args.assets_dir,
+        workers=args.jobs, retries=args.retries,
+        on_result=lambda e, r: print(f"[{r.status}] {e.id} {e.name} ({r.seconds:.1f}s{', ' + r.error if r.error else ''})"),
+    )
+    print(f"🎨 Generating {len(entries)} assets with {args.jobs} workers, ${budget - queue.spent:.2f} of budget left")
+    start = time.perf_counter()
+    results = asyncio.run(queue.run(entries))
+    wall = time.perf_counter() - start
+    print_summary(results, wall, queue.spent, budget)
+    print(f"📁 Report: {write_report(results, wall, args.assets_dir)}")
+    return 1 if any(r.status == "failed" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
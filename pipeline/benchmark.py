@@ -0,0 +1,266 @@
+"""
+Render Benchmark
+Times a fixed set of the project's scenes and keeps a history of the results.
+
+    python -m pipeline.benchmark                  # run the suite at -ql
+    python -m pipeline.benchmark -q m -r 5        # 5 timed runs per scene at -qm
+    python -m pipeline.benchmark --history        # print the recorded runs
+
+The suite covers the workloads that dominate the project's renders:
+
+    StaticVsDynamicAnimation   particles
+    CICDPipelineAnimation      many short plays
+    CodeAnimation              Code / Pygments
+    FormulaAnimation           Tex
+    SimpleGraph                function plotting
+
+Every scene is rendered by a fresh headless manim process, with manim's
+per-play cache disabled, a fixed seed and the same quality, into a scratch
+media directory. One untimed run per scene warms the shared Text and Tex
+caches first, so every timed run sees the same cache state. The median of
+the timed runs is appended to media/benchmark_history.jsonl together with the
+manim version, Python version, machine and git commit.
+
+A run is compared with the median of the last runs recorded for the same
+quality on the same machine; a scene that got slower, hungrier or bigger
+than the thresholds is reported as a regression and the exit code is 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from pipeline.discovery import discover_scenes, select_scenes
+from pipeline.orchestrator import QUALITY_DIRS, MemoryBudget, RenderJob, run_job
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT
+from pipeline.scene_cache import manim_version
+from pipeline.seeding import SEED_ENV
+
+SUITE = [
+    "3_Simulation/video_animations.py:StaticVsDynamicAnimation",
+    "3_Simulation/video_animations.py:CICDPipelineAnimation",
+    "5_Symbols/code.py:CodeAnimation",
+    "4_Formula/formula.py:FormulaAnimation",
+    "5_Symbols/examples.py:SimpleGraph",
+]
+
+HISTORY_PATH = MEDIA_DIR / "benchmark_history.jsonl"
+SCRATCH_DIR = PROJECT_ROOT / ".cache" / "benchmark"
+BENCHMARK_SEED = "benchmark"
+
+# Allowed growth over the baseline before a metric counts as a regression
+THRESHOLDS = {"wall_seconds": 0.10, "peak_rss_mb": 0.15, "output_bytes": 0.20}
+BASELINE_RUNS = 5
+
+
+def machine():
+    """Identifies results that are comparable with each other."""
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def count_frames(path):
+    """Frames in a video, or None when PyAV is unavailable."""
+    try:
+        import av
+    except ImportError:
+        return None
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        if stream.frames:
+            return stream.frames
+        return sum(1 for packet in container.demux(stream) if packet.pts is not None)
+
+
+def run_scene(scene, quality, budget):
+    """One cold render of a scene; returns its metrics, or an error and the log."""
+    job = RenderJob(
+        scene=scene,
+        quality=quality,
+        media_dir=SCRATCH_DIR / "media",
+        extra_args=["--disable_caching", "--renderer=cairo"],
+        env={SEED_ENV: BENCHMARK_SEED},
+    )
+    if job.output_path.exists():
+        job.output_path.unlink()
+    result = run_job(job, budget)
+    if result.status != "ok" or not job.output_path.exists():
+        return {"error": "render failed", "log": str(job.log_path)}
+    frames = count_frames(job.output_path)
+    return {
+        "wall_seconds": result.wall_seconds,
+        "peak_rss_mb": result.peak_rss_mb,
+        "output_bytes": job.output_path.stat().st_size,
+        "frames": frames,
+        "fps": round(frames / result.wall_seconds, 2) if frames and result.wall_seconds else None,
+        "log": str(job.log_path),
+    }
+
+
+def run_suite(targets, quality="l", repeats=3, warmup=1):
+    """Benchmark each target; returns target -> median metrics (or an error)."""
+    scenes = select_scenes(discover_scenes(), targets)
+    # Memory is not limited; scenes run one at a time
+    budget = MemoryBudget(total_mb=sys.maxsize)
+    results = {}
+    for scene in scenes:
+        print(f"⏱️  {scene.target}")
+        for _ in range(warmup):
+            run_scene(scene, quality, budget)
+        runs = []
+        for i in range(repeats):
+            metrics = run_scene(scene, quality, budget)
+            if "error" in metrics:
+                break
+            runs.append(metrics)
+            print(f"   run {i + 1}: {metrics['wall_seconds']:.2f}s")
+        if len(runs) < repeats:
+            results[scene.target] = metrics
+            print(f"   ❌ failed, see {metrics['log']}")
+            continue
+        results[scene.target] = {
+            key: statistics.median(r[key] for r in runs) if runs[0][key] is not None else None
+            for key in ("wall_seconds", "peak_rss_mb", "output_bytes", "frames", "fps")
+        }
+        results[scene.target]["runs"] = [r["wall_seconds"] for r in runs]
+    return results
+
+
+def load_history(path=HISTORY_PATH):
+    if not Path(path).exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(record, path=HISTORY_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def baseline(history, quality, target, runs=BASELINE_RUNS):
+    """Median metrics of the last comparable runs of a target."""
+    same = [
+        r["results"][target] for r in history
+        if r["quality"] == quality and r["machine"] == machine()
+        and "error" not in r["results"].get(target, {"error": True})
+    ][-runs:]
+    if not same:
+        return None
+    return {key: statistics.median(r[key] for r in same) for key in THRESHOLDS}
+
+
+def regressions(results, history, quality, thresholds=THRESHOLDS):
+    """(target, metric, baseline, value, change) for every metric over its threshold."""
+    found = []
+    for target, metrics in results.items():
+        base = baseline(history, quality, target)
+        if base is None or "error" in metrics:
+            continue
+        for metric, limit in thresholds.items():
+            if base[metric] and metrics[metric] is not None:
+                change = metrics[metric] / base[metric] - 1
+                if change > limit:
+                    found.append((target, metric, base[metric], metrics[metric], change))
+    return found
+
+
+def print_results(results, history, quality):
+    print("\n" + "=" * 60)
+    for target, m in results.items():
+        if "error" in m:
+            print(f"❌ {target:<58} failed")
+            continue
+        base = baseline(history, quality, target)
+        change = f"{m['wall_seconds'] / base['wall_seconds'] - 1:+.0%}" if base and base["wall_seconds"] else "new"
+        fps = f"{m['fps']:.1f}" if m["fps"] else "-"
+        print(
+            f"✅ {target:<58} {m['wall_seconds']:>7.2f}s {fps:>7} fps "
+            f"{m['peak_rss_mb']:>6.0f} MB {m['output_bytes'] / 1e6:>6.2f} MB out  {change}"
+        )
+    print("=" * 60)
+
+
+def print_history(history):
+    for record in history:
+        total = sum(r.get("wall_seconds", 0) for r in record["results"].values())
+        print(f"{record['timestamp']}  {record.get('commit') or '-':>9}  -q{record['quality']}  "
+              f"manim {record['manim']}  {total:>7.1f}s")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark renders of the project's own scenes.")
+    parser.add_argument("targets", nargs="*", default=SUITE, help="Scenes to benchmark (default: the suite)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    parser.add_argument("-r", "--repeats", type=int, default=3, help="Timed runs per scene")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per scene first")
+    parser.add_argument("--history-file", type=Path, default=HISTORY_PATH)
+    parser.add_argument("--history", action="store_true", help="Print the recorded runs and exit")
+    parser.add_argument("--no-record", action="store_true", help="Do not append this run to the history")
+    parser.add_argument("--max-wall", dest="wall_seconds", type=float, default=THRESHOLDS["wall_seconds"], help="Allowed wall time growth (default 0.10)")
+    parser.add_argument("--max-rss", dest="peak_rss_mb", type=float, default=THRESHOLDS["peak_rss_mb"], help="Allowed peak RSS growth (default 0.15)")
+    parser.add_argument("--max-size", dest="output_bytes", type=float, default=THRESHOLDS["output_bytes"], help="Allowed output size growth (default 0.20)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    history = load_history(args.history_file)
+    if args.history:
+        print_history(history)
+        return 0
+
+    shutil.rmtree(SCRATCH_DIR / "media", ignore_errors=True)
+    start = time.perf_counter()
+    results = run_suite(args.targets, args.quality, args.repeats, args.warmup)
+    print_results(results, history, args.quality)
+    print(f"Suite wall time: {time.perf_counter() - start:.1f}s")
+
+    thresholds = {metric: getattr(args, metric) for metric in THRESHOLDS}
+    found = regressions(results, history, args.quality, thresholds)
+    for target, metric, base, value, change in found:
+        print(f"📉 {target}: {metric} {base:.2f} -> {value:.2f} ({change:+.0%}, limit {thresholds[metric]:.0%})")
+
+    if not args.no_record:
+        append_history({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "manim": manim_version(),
+            "quality": args.quality,
+            "repeats": args.repeats,
+            "seed": BENCHMARK_SEED,
+            "machine": machine(),
+            "results": results,
+        }, args.history_file)
+        print(f"📁 History: {args.history_file}")
+    failed = any("error" in m for m in results.values())
+    return 1 if found or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
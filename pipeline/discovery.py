@@ -0,0 +1,138 @@
+"""
+Scene Discovery
+Finds every Scene subclass across the numbered modules without importing
+manim, so the orchestrator can plan a render before any worker starts.
+
+A scene that should only render when asked for (the full-length caption
+track, say) sets `render_by_default = False` in its class body; runs
+without targets skip it, and naming it or its module selects it.
+"""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+
+from pipeline.paths import PROJECT_ROOT, module_dirs, relative_to_root
+
+# Base classes that make a class renderable by manim
+SCENE_BASES = {
+    "Scene",
+    "MovingCameraScene",
+    "ThreeDScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+
+@dataclass(frozen=True)
+class SceneRef:
+    """A renderable scene class located in one of the project modules."""
+
+    module: Path
+    name: str
+    lineno: int
+    end_lineno: int
+    docstring: str = ""
+    project: bool = False  # derives from pipeline.scene.ProjectScene
+    default: bool = True  # rendered by runs without targets
+
+    @property
+    def target(self):
+        """The "path:Scene" form used by render_all.sh."""
+        return f"{self.module.as_posix()}:{self.name}"
+
+    @property
+    def module_name(self):
+        """Module name manim uses for the video folder."""
+        return self.module.stem
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _renders_by_default(node):
+    for statement in node.body:
+        if (
+            isinstance(statement, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "render_by_default" for t in statement.targets)
+            and isinstance(statement.value, ast.Constant)
+        ):
+            return bool(statement.value.value)
+    return True
+
+
+def scenes_in_file(path, root=PROJECT_ROOT):
+    """List the Scene subclasses defined in a single Python file."""
+    path = Path(path)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    known = set(SCENE_BASES)
+    project = {"ProjectScene"}
+    found = []
+
+    # Top-level classes only; later classes may subclass earlier scenes
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = {_base_name(base) for base in node.bases}
+        if bases & known or any(b and b.endswith("Scene") for b in bases):
+            known.add(node.name)
+            found.append(SceneRef(
+                module=relative_to_root(path, root),
+                name=node.name,
+                lineno=node.lineno,
+                end_lineno=node.end_lineno,
+                docstring=ast.get_docstring(node) or "",
+                project=bool(bases & project),
+                default=_renders_by_default(node),
+            ))
+            if bases & project:
+                project.add(node.name)
+    return found
+
+
+def discover_scenes(root=PROJECT_ROOT):
+    """Walk the numbered modules and return every scene, in folder order."""
+    scenes = []
+    for folder in module_dirs(root):
+        for path in sorted(folder.glob("*.py")):
+            scenes.extend(scenes_in_file(path, root))
+    return scenes
+
+
+def _module_key(module):
+    # Accept paths relative to the project root from any working directory
+    path = Path(module)
+    if not path.is_absolute() and not path.exists():
+        path = PROJECT_ROOT / path
+    return relative_to_root(path)
+
+
+def select_scenes(scenes, targets):
+    """
+    Filter discovered scenes by target strings.
+    A target may be a scene name, a module path, or "module.py:Scene".
+    Without targets, every scene that renders by default.
+    """
+    if not targets:
+        return [s for s in scenes if s.default]
+
+    selected = []
+    for target in targets:
+        module, _, name = target.rpartition(":") if ":" in target else ("", "", target)
+        if not module and target.endswith(".py"):
+            module, name = target, ""
+        matches = [
+            s for s in scenes
+            if (not name or s.name == name)
+            and (not module or s.module == _module_key(module))
+        ]
+        if not matches:
+            raise ValueError(f"No scene matches '{target}'")
+        selected.extend(m for m in matches if m not in selected)
+    return selected
@@ -0,0 +1,560 @@
+"""
+Streaming Encoder
+One long-lived encoder per scene instead of one per play().
+
+manim's SceneFileWriter opens a new encoder for every play(), writes it to
+its own file under partial_movie_files/ and concatenates the files at the
+end. StreamingFileWriter opens a single in-process (PyAV) encoder on the
+first play and streams every frame of the scene into it. A keyframe is
+forced at each play boundary, and an index of markers is written next to
+the movie:
+
+    media/videos/<module>/<quality>/<Scene>.index.json
+
+    {"fps": 60, "frames": 1830, "markers": [
+        {"play": 0, "hash": "...", "section": "autocreated", "section_index": 0,
+         "start_frame": 0, "end_frame": 60, "start": 0.0, "end": 1.0}, ...]}
+
+Because every play starts on a keyframe, section videos are cut from the
+stream without re-encoding.
+
+Re-renders resume after the last unchanged play. Each marker records the
+play's hash (manim's hash of the camera, the animations and every mobject
+in the scene) and a fingerprint of the random state before the play. On
+the next render, plays whose hash and random state still match the
+previous index are skipped the way manim skips cached plays: construct()
+runs, but no frames are drawn or encoded. At the first play that differs
+the encoder starts, and when the scene ends the unchanged head of the
+previous movie is spliced in front of the new tail, again without
+re-encoding. Changing the end of a long scene re-encodes only the end.
+
+Overlays for Resolve can keep their alpha channel instead of being keyed
+off black: with PIPELINE_OUTPUT=prores (ProRes 4444), qtrle (QuickTime
+Animation) or png (one RGBA PNG per frame, in a folder named after the
+scene) the background is transparent and the intermediate codec decodes
+cheaply on the timeline. Frames are written on the encoder thread either way;
+if it fails (a full disk, an encoder error), the next frame or the end of the
+scene raises its error on the render thread.
+
+One render can also write the lower qualities. With PIPELINE_TIERS=l (or
+`--tiers l` in the orchestrator) a -qh render writes the 480p15 review copy
+next to the 1080p60 movie, where manim -ql would put it. construct() and
+every updater run once; each tier's encoder takes every frame it needs
+(every fourth of 60 fps for 15 fps), scaled down with an area filter, which
+costs a fraction of drawing the frame again. Tiers larger than the render
+are skipped: render at the largest quality and list the smaller ones.
+
+Enable it with PIPELINE_ENCODER=stream (or `--encoder stream` in the
+orchestrator); ProjectScene then builds its renderer with this writer. An
+alpha output (`--output prores`) always uses it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from fractions import Fraction
+from pathlib import Path
+from queue import Full, Queue
+
+import av
+from manim import config, logger
+from PIL import Image
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+from pipeline.seeding import rng_fingerprint
+from pipeline.settings import alpha_output, output_tiers
+
+
+def stream_codec():
+    """(codec, pix_fmt, options) for the configured output, as manim picks them."""
+    output = alpha_output()
+    if output == "prores":
+        # The 4444 profile carries the alpha channel
+        return "prores_ks", "yuva444p10le", {"profile": "4444", "vendor": "apl0"}
+    if output == "qtrle":
+        return "qtrle", "argb", {}
+    if config.movie_file_extension == ".webm":
+        return "libvpx-vp9", "yuva420p" if config.transparent else "yuv420p", {"an": "1"}
+    if config.transparent and config.movie_file_extension == ".mov":
+        return "qtrle", "argb", {"an": "1"}
+    # forced-idr: the keyframe at each play boundary starts a closed GOP
+    return "libx264", "yuv420p", {"an": "1", "crf": "23", "forced-idr": "1"}
+
+
+def add_video_stream(container, rate, width, height):
+    """The configured codec's video stream (see stream_codec) in an open container."""
+    codec, pix_fmt, options = stream_codec()
+    stream = container.add_stream(codec, rate=rate, options=options)
+    stream.pix_fmt = pix_fmt
+    stream.width = width
+    stream.height = height
+    if codec == "qtrle":
+        # qtrle ignores forced keyframes and only starts a new one every gop_size
+        # frames; every frame a keyframe lets splices and section cuts start anywhere
+        stream.gop_size = 1
+    return stream
+
+
+def _mark_keyframe(av_frame):
+    try:
+        av_frame.pict_type = av.video.frame.PictureType.I
+    except AttributeError:
+        # PyAV < 12 takes the picture type as a string
+        av_frame.pict_type = "I"
+
+
+def _add_stream_like(container, template):
+    # PyAV 14 renamed add_stream(template=...) to add_stream_from_template
+    if hasattr(container, "add_stream_from_template"):
+        return container.add_stream_from_template(template)
+    return container.add_stream(template=template)
+
+
+def cut_frames(source_path, target_path, start_frame, end_frame, fps):
+    """Copy frames [start_frame, end_frame) of a stream into a new file without re-encoding."""
+    with av.open(str(source_path)) as source, av.open(str(target_path), mode="w") as target:
+        in_stream = source.streams.video[0]
+        out_stream = _add_stream_like(target, in_stream)
+        offset = None
+        for packet in source.demux(in_stream):
+            if packet.pts is None:
+                continue
+            frame = round(float(packet.pts * in_stream.time_base) * fps)
+            if not start_frame <= frame < end_frame:
+                continue
+            if offset is None:
+                offset = packet.dts if packet.dts is not None else packet.pts
+            packet.pts -= offset
+            if packet.dts is not None:
+                packet.dts -= offset
+            packet.stream = out_stream
+            target.mux(packet)
+
+
+def splice_frames(parts, target_path, fps):
+    """
+    Join frame ranges of streams encoded with the same settings, without re-encoding.
+    `parts` is a list of (path, start_frame, end_frame or None); every range
+    must start on a keyframe.
+    """
+    fps = Fraction(fps)
+    with av.open(str(target_path), mode="w") as target:
+        out_stream = None
+        written = 0
+        for path, start_frame, end_frame in parts:
+            with av.open(str(path)) as source:
+                in_stream = source.streams.video[0]
+                if out_stream is None:
+                    out_stream = _add_stream_like(target, in_stream)
+                time_base = in_stream.time_base
+                origin = in_stream.start_time or 0
+                # Move frame `start_frame` of this part to frame `written` of the target
+                shift = round(Fraction(written - start_frame) / fps / time_base)
+                for packet in source.demux(in_stream):
+                    if packet.pts is None:
+                        continue
+                    frame = round((packet.pts - origin) * time_base * fps)
+                    if frame < start_frame or (end_frame is not None and frame >= end_frame):
+                        continue
+                    packet.pts += shift
+                    if packet.dts is not None:
+                        packet.dts += shift
+                    packet.stream = out_stream
+                    target.mux(packet)
+                    written += 1
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class OutputTier:
+    """An extra movie at a lower resolution and frame rate, fed from the scene's frames."""
+
+    def __init__(self, path, width, height, fps, source_fps):
+        self.path = Path(path)
+        self.width = width
+        self.height = height
+        self.fps = Fraction(fps)
+        self.source_fps = source_fps
+        self.frames = 0
+        self._keyframe = False
+        self._container = None
+
+    def open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._partial = self.path.with_name(f"{self.path.stem}_tier{self.path.suffix}")
+        self._container = av.open(str(self._partial), mode="w")
+        self._stream = add_video_stream(self._container, self.fps, self.width, self.height)
+
+    def encode(self, av_frame, source_index, keyframe):
+        """Take frame `source_index` of the scene if this tier shows it."""
+        self._keyframe = self._keyframe or keyframe
+        # The tier's next frame starts at or before this source frame
+        if source_index * self.fps < self.frames * self.source_fps:
+            return
+        scaled = av_frame.reformat(
+            width=self.width, height=self.height, format=self._stream.pix_fmt, interpolation="AREA",
+        )
+        scaled.pts = self.frames
+        if self._keyframe:
+            _mark_keyframe(scaled)
+            self._keyframe = False
+        self._container.mux(self._stream.encode(scaled))
+        self.frames += 1
+
+    def close(self):
+        if self._container is None:
+            return
+        self._container.mux(self._stream.encode())
+        self._container.close()
+        self._container = None
+        os.replace(self._partial, self.path)
+
+
+class StreamingFileWriter(SceneFileWriter):
+    """SceneFileWriter that encodes the whole scene through one encoder."""
+
+    # Tells TimelineSegment that plays are already merged
+    streams_whole_scene = True
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.fps = Fraction(config.frame_rate).limit_denominator(1001)
+        self.output = alpha_output()
+        if self.output in ("prores", "qtrle") and write_to_movie():
+            # manim.cfg's output_file names an .mp4; these codecs need a QuickTime container
+            self.movie_file_path = Path(self.movie_file_path).with_suffix(".mov")
+        self.stream_path = None
+        self.stream_frames = 0
+        self.markers = []
+        self._container = None
+        self._writer = None
+        self._writer_error = None
+        self._current = None
+        self._pending_hash = None
+        self._pending_rng = None
+        self._keyframe_next = False
+        self.tiers = self._make_tiers()
+        # Markers of the previous render, by play, while its plays still match;
+        # tiers need every frame, so they always render from the start
+        self.previous = None if self.tiers else self._load_previous()
+        self.reused_frames = 0
+
+    def _make_tiers(self):
+        if not write_to_movie() or self.output == "png" or not output_tiers():
+            return []
+        from manim.constants import QUALITIES
+
+        movie = Path(self.movie_file_path)
+        tiers = []
+        for flag in output_tiers():
+            quality = next((q for q in QUALITIES.values() if q["flag"] == flag), None)
+            if quality is None:
+                logger.warning(f"Unknown tier -q{flag}, skipped")
+                continue
+            width, height, fps = quality["pixel_width"], quality["pixel_height"], quality["frame_rate"]
+            if (width, height) == (config.pixel_width, config.pixel_height) and fps == self.fps:
+                continue  # the render itself
+            if width > config.pixel_width or height > config.pixel_height or fps > self.fps:
+                logger.warning(f"Tier -q{flag} is larger than the render, skipped; render at -q{flag} instead")
+                continue
+            # Where manim would write this quality: .../<module>/480p15/<Scene>.mp4
+            path = movie.parent.parent / f"{height}p{fps:g}" / movie.name
+            tiers.append(OutputTier(path, width, height, fps, self.fps))
+        return tiers
+
+    def _load_previous(self):
+        if config.disable_caching or not write_to_movie() or self.output == "png":
+            return None
+        movie = Path(self.movie_file_path)
+        if not (self.index_path.exists() and movie.exists()):
+            return None
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Only resume from the exact movie this index describes, at the same settings
+        if (
+            index.get("fps") != float(self.fps)
+            or index.get("size") != [config.pixel_width, config.pixel_height]
+            or index.get("movie_sha256") != _file_sha256(movie)
+        ):
+            return None
+        return {m["play"]: m for m in index.get("markers", [])}
+
+    # Per-play bookkeeping
+
+    def add_partial_movie_file(self, hash_animation):
+        if not write_to_movie():
+            return
+        # One (empty) entry per play keeps manim's play indexes aligned
+        self.partial_movie_files.append(None)
+        self.sections[-1].partial_movie_files.append(None)
+        self._pending_hash = hash_animation
+        self._pending_rng = rng_fingerprint()
+        if hash_animation is None:
+            # Skipped by manim itself (e.g. -n): frame numbers no longer line up
+            self.previous = None
+
+    def is_already_cached(self, hash_invocation):
+        # Reuse the previous render's frames for the unchanged leading plays
+        if not self.previous:
+            return False
+        old = self.previous.get(self.renderer.num_plays)
+        if (
+            old is not None
+            and old["hash"] == hash_invocation
+            and old.get("rng") == rng_fingerprint()
+            and old["start_frame"] == self.stream_frames
+        ):
+            self.markers.append(dict(
+                old, reused=True, section=self.sections[-1].name, section_index=len(self.sections) - 1,
+            ))
+            self.stream_frames = self.reused_frames = old["end_frame"]
+            return True
+        # Everything from here on is rendered again
+        if self.reused_frames:
+            logger.info(f"Resuming {self.output_name} at play {self.renderer.num_plays}")
+        self.previous = None
+        return False
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if not (write_to_movie() and allow_write):
+            return
+        if self._container is None:
+            self._open_stream()
+        self._current = {
+            "play": self.renderer.num_plays,
+            "hash": self._pending_hash,
+            "section": self.sections[-1].name,
+            "section_index": len(self.sections) - 1,
+            "rng": self._pending_rng,
+            "start_frame": self.stream_frames,
+        }
+        self._keyframe_next = True
+
+    def end_animation(self, allow_write=False):
+        if self._current is None:
+            return
+        marker = self._current
+        marker["end_frame"] = self.stream_frames
+        marker["start"] = round(marker["start_frame"] / float(self.fps), 4)
+        marker["end"] = round(marker["end_frame"] / float(self.fps), 4)
+        self.markers.append(marker)
+        self._current = None
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if not write_to_movie():
+            super().write_frame(frame_or_renderer, num_frames)
+            return
+        if self._current is None:
+            return
+        # The OpenGL renderer passes itself instead of a frame
+        if hasattr(frame_or_renderer, "get_frame"):
+            frame = frame_or_renderer.get_frame()
+        else:
+            frame = frame_or_renderer
+        self._put((frame, num_frames, self._keyframe_next))
+        self._keyframe_next = False
+        self.stream_frames += num_frames
+
+    # The encoder
+
+    def _stream_file(self):
+        return Path(self.partial_movie_directory) / f"{self.output_name}_stream{Path(self.movie_file_path).suffix}"
+
+    @property
+    def frames_dir(self):
+        """Where PIL writes the PNG sequence (PIPELINE_OUTPUT=png)."""
+        return Path(self.movie_file_path).with_suffix("")
+
+    def _open_stream(self):
+        if self.output == "png":
+            self.frames_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.frames_dir.glob(f"{self.output_name}_*.png"):
+                stale.unlink()
+        else:
+            self.stream_path = self._stream_file()
+            self._container = av.open(str(self.stream_path), mode="w")
+            self._stream = add_video_stream(self._container, self.fps, config.pixel_width, config.pixel_height)
+            for tier in self.tiers:
+                tier.open()
+
+        # Encoding runs on its own thread while the renderer draws the next frame
+        self._queue = Queue(maxsize=64)
+        self._writer_error = None
+        self._writer = threading.Thread(target=self._encode_frames, daemon=True)
+        self._writer.start()
+
+    def _put(self, item):
+        # A failed writer stops taking frames; raise its error instead of blocking
+        while True:
+            self._raise_writer_error()
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except Full:
+                if not self._writer.is_alive():
+                    self._raise_writer_error()
+                    raise RuntimeError(f"the encoder thread of {self.output_name} stopped")
+
+    def drain(self):
+        """Wait until every queued frame is encoded (frame_parallel forks after this)."""
+        if self._writer is None:
+            return
+        done = self._queue.all_tasks_done
+        while True:
+            self._raise_writer_error()
+            with done:
+                if not self._queue.unfinished_tasks:
+                    return
+                done.wait(0.5)
+            if not self._writer.is_alive():
+                self._raise_writer_error()
+                raise RuntimeError(f"the encoder thread of {self.output_name} stopped")
+
+    def _raise_writer_error(self):
+        # Kept, so every later frame fails too instead of queuing for nobody
+        if self._writer_error is not None:
+            raise self._writer_error
+
+    def _encode_frames(self):
+        try:
+            self._encode_queued_frames()
+        except BaseException as exc:  # re-raised on the render thread
+            self._writer_error = exc
+
+    def _encode_queued_frames(self):
+        pts = 0
+        while True:
+            frame, num_frames, keyframe = self._queue.get()
+            try:
+                if frame is None:
+                    break
+                if self.output == "png":
+                    pts = self._write_pngs(frame, num_frames, pts)
+                    continue
+                for i in range(num_frames):
+                    av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+                    av_frame.pts = pts
+                    if keyframe and i == 0:
+                        _mark_keyframe(av_frame)
+                    self._container.mux(self._stream.encode(av_frame))
+                    for tier in self.tiers:
+                        tier.encode(av_frame, pts, keyframe and i == 0)
+                    pts += 1
+            finally:
+                self._queue.task_done()
+
+    def _write_pngs(self, frame, num_frames, pts):
+        first = self.frames_dir / f"{self.output_name}_{pts:06d}.png"
+        # Speed over size: these are intermediates for the edit
+        Image.fromarray(frame, "RGBA").save(first, compress_level=1)
+        # A held frame is the same image; link it instead of compressing it again
+        for i in range(1, num_frames):
+            target = self.frames_dir / f"{self.output_name}_{pts + i:06d}.png"
+            try:
+                os.link(first, target)
+            except OSError:
+                Image.fromarray(frame, "RGBA").save(target, compress_level=1)
+        return pts + num_frames
+
+    def close_stream(self):
+        tail = None
+        if self._writer is not None:
+            try:
+                self._put((None, 0, False))
+                self._writer.join()
+            finally:
+                self._writer = None
+            self._raise_writer_error()
+        if self._container is not None:
+            self._container.mux(self._stream.encode())
+            self._container.close()
+            self._container = None
+            tail = self.stream_path
+        for tier in self.tiers:
+            tier.close()
+        if self.reused_frames:
+            self._splice_previous(tail)
+
+    def _splice_previous(self, tail):
+        # Head: the reused frames of the previous movie; tail: what was encoded now
+        self.stream_path = self._stream_file()
+        self.stream_path.parent.mkdir(parents=True, exist_ok=True)
+        parts = [(self.movie_file_path, 0, self.reused_frames)]
+        if tail is not None:
+            parts.append((tail, 0, None))
+        spliced = self.stream_path.with_name(f"{self.stream_path.stem}_spliced{self.stream_path.suffix}")
+        splice_frames(parts, spliced, self.fps)
+        os.replace(spliced, self.stream_path)
+        self.reused_frames = 0
+
+    @property
+    def index_path(self):
+        return Path(self.movie_file_path).with_suffix(".index.json")
+
+    def write_index(self):
+        movie = Path(self.movie_file_path)
+        index = {
+            "scene": self.output_name,
+            "fps": float(self.fps),
+            "size": [config.pixel_width, config.pixel_height],
+            "frames": self.stream_frames,
+            "output": self.output or "video",
+            "tiers": [str(tier.path) for tier in self.tiers],
+            "stream": str(self.frames_dir if self.output == "png" else self.stream_path),
+            "movie_sha256": _file_sha256(movie) if movie.exists() else None,
+            "markers": self.markers,
+        }
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+
+    # Output
+
+    def combine_to_movie(self):
+        self.close_stream()
+        if self.output == "png":
+            self.write_index()
+            logger.info(f"PNG sequence ready at {self.frames_dir}")
+            return
+        if self.stream_path is None:
+            logger.info("No animations are contained in this scene.")
+            return
+        # Let manim mux the single stream (and any sound) into the movie
+        saved = self.partial_movie_files
+        self.partial_movie_files = [str(self.stream_path)]
+        try:
+            super().combine_to_movie()
+        finally:
+            self.partial_movie_files = saved
+        # Written after the movie, whose hash the next render checks before resuming
+        self.write_index()
+
+    def combine_to_section_videos(self):
+        self.finish_last_section()
+        self.close_stream()
+        if self.output == "png":
+            # Sections are frame ranges of the sequence; see the index markers
+            return
+        sections_index = []
+        for number, section in enumerate(self.sections):
+            markers = [m for m in self.markers if m["section_index"] == number]
+            if section.video is None or not markers:
+                continue
+            logger.info(f"Cutting section '{section.name}' from the scene stream")
+            cut_frames(
+                self.stream_path, self.sections_output_dir / section.video,
+                markers[0]["start_frame"], markers[-1]["end_frame"], float(self.fps),
+            )
+            sections_index.append(section.get_dict(self.sections_output_dir))
+        with (self.sections_output_dir / f"{self.output_name}.json").open("w") as file:
+            json.dump(sections_index, file, indent=4)
@@ -0,0 +1,214 @@
+"""
+Frame-Parallel Plays
+Split the frames of one long play() across forked worker processes.
+
+Set PIPELINE_FRAME_WORKERS=4 (or `--frame-workers 4` in the orchestrator) and
+ProjectScene draws eligible plays with 4 workers. A play is eligible when
+each of its frames depends on its time alone:
+
+    - the Cairo renderer is drawing frames (not skipping them)
+    - no updaters on the scene, on its mobjects or on the animated mobjects
+    - no stop condition (wait_until)
+    - every animation is one of manim's own, minus those running user code
+      per frame or starting other animations mid-play (PER_FRAME_CODE), or
+      declares `frame_parallel_safe = True`
+    - at least MIN_FRAMES_PER_WORKER frames for every worker
+
+`Rotate(clock_hands, angle=20 * PI)` or a 2-second `Create(ax.plot(...))`
+qualify; plays with always_redraw or ValueTracker updaters render as usual.
+
+The workers are forked once the play has begun, so each starts from the same
+snapshot of the scene (copy-on-write: nothing is pickled, and lambdas such
+as a path_func work). The encoder queue is drained first, so its threads are
+idle when the scene process forks; the workers never touch the encoder. Worker k draws frames k, k + N, k + 2N, ... and streams
+the pixels back through its pipe; the scene process takes them in order and
+hands them to the file writer, so encoding, the stream index and manim's
+progress bar work as usual. If a worker fails, the scene process draws the
+remaining frames itself.
+"""
+
+import os
+import signal
+import sys
+import time
+import traceback
+
+import numpy as np
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+MIN_FRAMES_PER_WORKER = 15
+
+# manim animations that call user code every frame or begin animations mid-play
+PER_FRAME_CODE = ("UpdateFromFunc", "UpdateFromAlphaFunc", "MaintainPositionRelativeTo", "Succession", "ChangeSpeed")
+
+
+class WorkerFailed(Exception):
+    pass
+
+
+def animation_tree(animation):
+    """The animation and every animation nested in it (AnimationGroup, LaggedStart...)."""
+    yield animation
+    for sub in getattr(animation, "animations", None) or []:
+        yield from animation_tree(sub)
+
+
+def pure_animation(animation):
+    """Whether the animation only sets its own mobject from alpha."""
+    cls = type(animation)
+    if getattr(cls, "frame_parallel_safe", False):
+        return True
+    if not cls.__module__.startswith("manim."):
+        return False
+    return not any(base.__name__ in PER_FRAME_CODE for base in cls.__mro__)
+
+
+def splittable(scene):
+    """Whether every frame of the scene's current play is a function of its time."""
+    renderer = scene.renderer
+    if not hasattr(os, "fork") or not isinstance(renderer, CairoRenderer):
+        return False
+    if renderer.skip_animations or scene.stop_condition is not None or scene.updaters:
+        return False
+    animations = [a for top in scene.animations for a in animation_tree(top)]
+    if not all(pure_animation(a) for a in animations):
+        return False
+    mobjects = list(scene.mobjects) + [a.mobject for a in animations if a.mobject is not None]
+    return not any(m.updaters for mob in mobjects for m in mob.get_family())
+
+
+class FramePool:
+    """Forked workers drawing interleaved frames of one play."""
+
+    def __init__(self, scene, times, workers):
+        self.workers = workers
+        self.shape = scene.renderer.camera.pixel_array.shape
+        self.dtype = scene.renderer.camera.pixel_array.dtype
+        # Forking while the encoder thread holds a lock would leave it locked
+        # in the children; with the queue drained its threads are idle
+        drain = getattr(scene.renderer.file_writer, "drain", None)
+        if drain is not None:
+            drain()
+        pipes = [os.pipe() for _ in range(workers)]
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self.pids = []
+        for k in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                _worker(scene, times[k::workers], pipes, k)
+            self.pids.append(pid)
+        self.readers = []
+        for read, write in pipes:
+            os.close(write)
+            self.readers.append(open(read, "rb", buffering=0))
+
+    def frame(self, index):
+        """Frame `index` of the play, read from the worker that drew it."""
+        frame = np.empty(self.shape, dtype=self.dtype)
+        view = memoryview(frame).cast("B")
+        reader = self.readers[index % self.workers]
+        got = 0
+        while got < len(view):
+            n = reader.readinto(view[got:])
+            if not n:
+                raise WorkerFailed(f"frame worker {index % self.workers} exited before frame {index}")
+            got += n
+        return frame
+
+    def close(self, abort=False):
+        for reader in self.readers:
+            reader.close()
+        for pid in self.pids:
+            if abort:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            os.waitpid(pid, 0)
+
+
+def _worker(scene, times, pipes, k):
+    """Body of worker k; never returns."""
+    status = 1
+    try:
+        for index, (read, write) in enumerate(pipes):
+            os.close(read)
+            if index != k:
+                os.close(write)
+        renderer = scene.renderer
+        out = pipes[k][1]
+        for t in times:
+            scene.update_to_time(t)
+            renderer.update_frame(scene, scene.moving_mobjects)
+            view = memoryview(np.ascontiguousarray(renderer.get_frame())).cast("B")
+            while view:
+                view = view[os.write(out, view):]
+        os.close(out)
+        status = 0
+    except BrokenPipeError:
+        pass  # the scene process stopped reading
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        os._exit(status)
+
+
+def play_in_parallel(scene, workers):
+    """
+    Run the scene's current play like Scene.play_internal, with its frames
+    drawn by `workers` processes. Returns False, having changed nothing, when
+    the play is not eligible.
+    """
+    if not splittable(scene):
+        return False
+    duration = scene.get_run_time(scene.animations)
+    # The frame times manim's progress bar iterates over
+    times = np.arange(0, duration, 1 / config["frame_rate"])
+    workers = min(workers, len(times) // MIN_FRAMES_PER_WORKER)
+    if workers < 2:
+        return False
+
+    renderer = scene.renderer
+    scene.duration = duration
+    scene.time_progression = scene._get_animation_time_progression(scene.animations, duration)
+    pool = FramePool(scene, times, workers)
+    aborted = True
+    waited = 0.0
+    try:
+        for index, t in enumerate(scene.time_progression):
+            frame = None
+            if pool is not None:
+                start = time.perf_counter()
+                try:
+                    frame = pool.frame(index)
+                except WorkerFailed as exc:
+                    logger.warning(f"{exc}; drawing the rest of the play in the scene process")
+                    pool.close(abort=True)
+                    pool = None
+                finally:
+                    waited += time.perf_counter() - start
+            if frame is None:
+                scene.update_to_time(t)
+                renderer.render(scene, t, scene.moving_mobjects)
+            else:
+                renderer.add_frame(frame)
+        aborted = False
+    finally:
+        if pool is not None:
+            pool.close(abort=aborted)
+
+    # The rest of Scene.play_internal
+    scene.last_t = times[-1]
+    for animation in scene.animations:
+        animation.finish()
+        animation.clean_up_from_scene(scene)
+    scene.update_mobjects(0)
+    renderer.static_image = None
+    scene.time_progression.close()
+    profiler = getattr(scene, "profiler", None)
+    if profiler is not None:
+        # The workers' drawing time is not seen by the scene process's profiler
+        profiler.mark_parallel(workers, waited)
+    return True
@@ -0,0 +1,136 @@
+"""
+Layered Cairo Renderer
+Keep static mobjects drawn above the animated ones as cached layers.
+
+manim already paints the mobjects below the first moving one into a static
+background once per play(). Everything after it in the scene's drawing order
+is drawn again on every frame, moving or not: animating the first box of
+CICDPipelineAnimation redraws the title, the later boxes and every arrow
+for every frame.
+
+LayeredCairoRenderer splits that list into runs. Runs of moving mobjects are
+drawn every frame as before. Each run of static mobjects between or above
+them is rasterized once per play onto a transparent layer, and that layer is
+composited OVER the frame by Cairo where the run would have been drawn. The
+drawing order, and so the image, stays the same, while the per-frame cost
+follows the number of moving mobjects instead of the size of the scene.
+
+A mobject counts as moving when an animation of the play targets it (or a
+parent of it) or it is a foreground mobject. The renderer only layers plays
+where that is the whole story: no updaters in the scene and only animations
+that set their own mobject (see pipeline/frame_parallel.py). Other plays,
+and runs with images, point clouds or background-image fills (composited by
+PIL, not Cairo), are drawn as usual.
+
+ProjectScene uses this renderer for Cairo renders; PIPELINE_LAYERS=0 turns
+it off.
+"""
+
+import itertools
+
+import cairo
+import numpy as np
+from manim import VMobject
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from pipeline.frame_parallel import animation_tree, pure_animation
+
+# Fewer static mobjects than this are cheaper to draw than to composite
+MIN_LAYER_MOBJECTS = 4
+
+
+def _cairo_drawn(mobject):
+    # Images, point clouds and background-image fills are blended by PIL
+    # without premultiplied alpha, so a Cairo OVER of their layer would differ
+    return isinstance(mobject, VMobject) and not mobject.get_background_image()
+
+
+def moving_ids(scene):
+    """ids of the mobjects the current play changes, or None if that cannot be told."""
+    if scene.updaters or scene.stop_condition is not None:
+        return None
+    if any(m.updaters for mob in scene.mobjects for m in mob.get_family()):
+        return None
+    animations = [a for top in scene.animations for a in animation_tree(top)]
+    if not all(pure_animation(a) for a in animations):
+        return None
+    moving = set()
+    for mob in [a.mobject for a in animations if a.mobject is not None] + list(scene.foreground_mobjects):
+        moving.update(id(m) for m in mob.get_family())
+    return moving
+
+
+class LayeredCairoRenderer(CairoRenderer):
+    """CairoRenderer that caches the static mobjects drawn above moving ones."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layer_plan = None
+
+    def play(self, scene, *args, **kwargs):
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            self.layer_plan = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        image = super().save_static_frame_data(scene, static_mobjects)
+        self.layer_plan = None if self.skip_animations else self._plan_layers(scene)
+        return image
+
+    def _plan_layers(self, scene):
+        """[(mobjects to draw, include_submobjects) or (layer surface, None)] in drawing order."""
+        moving = moving_ids(scene)
+        if moving is None:
+            return None
+        plan, layers = [], 0
+        for is_moving, run in itertools.groupby(scene.moving_mobjects, lambda m: id(m) in moving):
+            run = list(run)
+            if is_moving:
+                # Families of moving mobjects are moving too; points may appear mid-play
+                plan.append((run, True))
+                continue
+            # Flattened families: a static parent must not draw its moving children
+            visible = [m for m in run if m.has_points()]
+            if len(visible) >= MIN_LAYER_MOBJECTS and all(_cairo_drawn(m) for m in visible):
+                plan.append((self._rasterize_layer(visible), None))
+                layers += 1
+            elif visible:
+                plan.append((visible, False))
+        return plan if layers else None
+
+    def _rasterize_layer(self, mobjects):
+        camera = self.camera
+        # Drawn in place, so the camera's cached Cairo context stays valid
+        camera.set_pixel_array(np.zeros_like(camera.pixel_array))
+        camera.capture_mobjects(mobjects, include_submobjects=False)
+        layer = camera.pixel_array.copy()
+        surface = cairo.ImageSurface.create_for_data(
+            layer, cairo.FORMAT_ARGB32, camera.pixel_width, camera.pixel_height,
+        )
+        return surface
+
+    def _composite(self, surface):
+        ctx = self.camera.get_cairo_context(self.camera.pixel_array)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        # Only the play's own frames follow the plan; other captures are drawn as usual
+        if self.layer_plan is None or mobjects is not scene.moving_mobjects or kwargs:
+            return super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        if self.skip_animations and not ignore_skipping:
+            return
+        # No static image when the play's first mobject is already a moving one
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        for content, submobjects in self.layer_plan:
+            if submobjects is None:
+                self._composite(content)
+            else:
+                self.camera.capture_mobjects(content, include_submobjects=submobjects)
@@ -0,0 +1,26 @@
+"""
+File Locks
+Advisory locks that let parallel manim processes share the project caches.
+"""
+
+import fcntl
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def file_lock(path, shared=False):
+    """
+    Hold an flock on `path` (created if missing) for the duration of a with-block.
+    Exclusive by default; shared=True lets several readers in at once.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
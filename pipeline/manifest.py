@@ -0,0 +1,204 @@
+"""
+Render Manifest
+Turns the edit documents in 3_Simulation/input/ into a typed list of scenes.
+
+source_edl.md and source_chapter_markers.txt both carry the scene table
+
+    | **04** | 01:00:48 | **The Clone Lab** | Terminal screen capture ... |
+
+and source_edl.md adds timed edit decisions ("**[01:02:26] SCREEN CAPTURE:**").
+Each scene row becomes a ManifestEntry with its in/out time (the next
+scene's start), the edit decisions that fall inside it, and the scene classes
+whose docstring says "Scene 4: ...". Every entry carries a hash of its rows,
+so the orchestrator can render only scenes whose EDL rows changed
+(`--changed-only`).
+
+    python -m pipeline.manifest    # print the manifest
+"""
+
+import hashlib
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pipeline.discovery import discover_scenes
+from pipeline.paths import PROJECT_ROOT
+from pipeline.subtitles import TIMELINE_START, format_timestamp, parse_timestamp
+
+INPUT_DIR = PROJECT_ROOT / "3_Simulation" / "input"
+
+# Later sources only fill in scenes the earlier ones do not list
+EDIT_SOURCES = (INPUT_DIR / "source_edl.md", INPUT_DIR / "source_chapter_markers.txt")
+
+MANIFEST_STATE = "render_manifest.json"
+
+SCENE_ROW = re.compile(r"^\|\s*\*\*(\d+)\*\*\s*\|\s*(\d+:\d{2}:\d{2})\s*\|\s*\*\*(.+?)\*\*\s*\|(.*)$")
+DECISION = re.compile(r"\*\*\[(\d+:\d{2}:\d{2})\]\s*([^:*]+):\*\*\s*(.*)")
+DOCSTRING_SCENE = re.compile(r"^\s*Scene\s+(\d+)\s*:", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class EditDecision:
+    """One timed line of the EDL, e.g. [01:02:26] SCREEN CAPTURE."""
+
+    time: float
+    kind: str
+    text: str
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One scene of the video and the classes that render it."""
+
+    scene_id: int
+    title: str
+    in_time: float
+    out_time: float = None
+    description: str = ""
+    decisions: tuple = ()
+    scenes: tuple = ()
+    row_hash: str = ""
+
+    @property
+    def expected_duration(self):
+        return None if self.out_time is None else self.out_time - self.in_time
+
+    @property
+    def targets(self):
+        return [scene.target for scene in self.scenes]
+
+    @property
+    def modules(self):
+        return sorted({scene.module.as_posix() for scene in self.scenes})
+
+
+@dataclass
+class _Row:
+    scene_id: int
+    timestamp: str
+    title: str
+    description: list = field(default_factory=list)
+
+
+def _clean(text):
+    text = re.sub(r"<br\s*/?>", " ", text)
+    return " ".join(text.replace("|", " ").split())
+
+
+def parse_scene_rows(path):
+    """Scene table rows of one document; descriptions may wrap onto following lines."""
+    rows, current = [], None
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        match = SCENE_ROW.match(line.strip())
+        if match:
+            scene_id, timestamp, title, rest = match.groups()
+            current = _Row(int(scene_id), timestamp, title.strip(), [rest])
+            rows.append(current)
+        elif current is not None:
+            current.description.append(line)
+        # A row ends at its closing pipe
+        if current is not None and current.description[-1].rstrip().endswith("|"):
+            current = None
+    return [(r.scene_id, r.timestamp, r.title, _clean(" ".join(r.description))) for r in rows]
+
+
+def parse_decisions(path):
+    """Timed edit decisions in a document."""
+    decisions = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        match = DECISION.search(line)
+        if match:
+            timestamp, kind, text = match.groups()
+            decisions.append(EditDecision(parse_timestamp(timestamp) - TIMELINE_START, kind.strip(), _clean(text)))
+    return decisions
+
+
+def scene_classes(scenes=None):
+    """Scene number -> SceneRefs whose docstring starts with "Scene N:"."""
+    mapping = {}
+    for scene in scenes if scenes is not None else discover_scenes():
+        match = DOCSTRING_SCENE.search(scene.docstring)
+        if match:
+            mapping.setdefault(int(match.group(1)), []).append(scene)
+    return mapping
+
+
+def build_manifest(sources=EDIT_SOURCES, scenes=None):
+    """ManifestEntries in timeline order."""
+    rows, decisions = {}, []
+    for source in sources:
+        if not Path(source).exists():
+            continue
+        for scene_id, timestamp, title, description in parse_scene_rows(source):
+            rows.setdefault(scene_id, (timestamp, title, description))
+        decisions.extend(parse_decisions(source))
+
+    ordered = sorted(rows.items(), key=lambda item: parse_timestamp(item[1][0]))
+    classes = scene_classes(scenes)
+    entries = []
+    for i, (scene_id, (timestamp, title, description)) in enumerate(ordered):
+        in_time = parse_timestamp(timestamp) - TIMELINE_START
+        out_time = parse_timestamp(ordered[i + 1][1][0]) - TIMELINE_START if i + 1 < len(ordered) else None
+        inside = tuple(
+            d for d in decisions
+            if d.time >= in_time and (out_time is None or d.time < out_time)
+        )
+        row_hash = hashlib.sha256(json.dumps(
+            [scene_id, timestamp, title, description, [[d.time, d.kind, d.text] for d in inside], out_time],
+        ).encode("utf-8")).hexdigest()[:16]
+        entries.append(ManifestEntry(
+            scene_id=scene_id,
+            title=title,
+            in_time=in_time,
+            out_time=out_time,
+            description=description,
+            decisions=inside,
+            scenes=tuple(classes.get(scene_id, ())),
+            row_hash=row_hash,
+        ))
+    return entries
+
+
+def load_state(media_dir):
+    """target -> row hash it was last rendered from."""
+    path = Path(media_dir) / MANIFEST_STATE
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(media_dir, rendered):
+    """Record the row hashes of targets that rendered successfully."""
+    path = Path(media_dir) / MANIFEST_STATE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = load_state(media_dir)
+    state.update(rendered)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    return path
+
+
+def changed_entries(manifest, media_dir):
+    """Entries with classes whose rows changed since those classes last rendered."""
+    state = load_state(media_dir)
+    return [
+        entry for entry in manifest
+        if entry.scenes and any(state.get(target) != entry.row_hash for target in entry.targets)
+    ]
+
+
+def main(argv=None):
+    for entry in build_manifest():
+        out = format_timestamp(entry.out_time)[:8] if entry.out_time is not None else "end"
+        classes = ", ".join(s.name for s in entry.scenes) or "-"
+        print(f"{entry.scene_id:02d}  {format_timestamp(entry.in_time)[:8]} - {out}  {entry.title:<22} {classes}")
+        for decision in entry.decisions:
+            print(f"      [{format_timestamp(decision.time)[:8]}] {decision.kind}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
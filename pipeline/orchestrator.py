@@ -0,0 +1,471 @@
+"""
+Render Orchestrator
+Renders the project's scenes in parallel instead of one manim call at a time.
+
+Every scene is rendered by its own manim process. Processes are scheduled
+longest-first on a bounded pool, and a memory budget keeps the pool from
+starting more scenes than the machine can hold at once. Scenes whose
+content key is already in the scene cache are restored without running manim.
+
+Usage:
+    python -m pipeline.orchestrator                       # every scene
+    python -m pipeline.orchestrator 4_Formula/formula.py  # one module
+    python -m pipeline.orchestrator GitCloneAnimation -q l
+    python -m pipeline.orchestrator --server http://127.0.0.1:8765  # via a warm render server
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from pipeline.discovery import discover_scenes, select_scenes
+from pipeline.manifest import build_manifest, changed_entries, save_state
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT
+from pipeline.profiler import load_profile
+from pipeline.profiler import print_summary as print_profile
+from pipeline.profiler import summarize as summarize_profiles
+from pipeline.scene_cache import SceneCache, scene_key
+from pipeline.seeding import SEED_ENV
+from pipeline.server import submit
+from pipeline.settings import (
+    ALPHA_OUTPUTS, ENCODER_ENV, FRAME_WORKERS_ENV, OUTPUT_ENV, PROFILE_ENV, PROJECT_SCENE_ENVS, STREAM_MODE,
+    TIERS_ENV,
+)
+from pipeline.tex_batch import precompile_modules
+from pipeline.tex_cache import TEX_CACHE
+
+# manim quality flag -> video folder name
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+
+DEFAULT_SCENE_MEMORY_MB = 1024
+REPORT_NAME = "render_report.json"
+
+
+@dataclass
+class RenderJob:
+    """One scene to render, with its scheduling hints."""
+
+    scene: object
+    quality: str = "h"
+    media_dir: Path = MEDIA_DIR
+    memory_mb: int = DEFAULT_SCENE_MEMORY_MB
+    estimated_seconds: float = 0.0
+    extra_args: list = field(default_factory=list)
+    env: dict = field(default_factory=dict)
+    cache_key: str = ""
+
+    @property
+    def output_path(self):
+        folder = Path(self.media_dir) / "videos" / self.scene.module_name / QUALITY_DIRS[self.quality]
+        output = self.pipeline_env.get(OUTPUT_ENV, "").lower()
+        if output == "png":
+            return folder / self.scene.name  # a folder of frames
+        return folder / f"{self.scene.name}{'.mov' if output in ALPHA_OUTPUTS else '.mp4'}"
+
+    @property
+    def tier_paths(self):
+        """{flag: path} of the lower qualities written by the same render (PIPELINE_TIERS)."""
+        if self.pipeline_env.get(OUTPUT_ENV, "").lower() == "png":
+            return {}
+        name = self.output_path.name
+        flags = [f.strip() for f in self.pipeline_env.get(TIERS_ENV, "").lower().split(",")]
+        return {
+            flag: Path(self.media_dir) / "videos" / self.scene.module_name / QUALITY_DIRS[flag] / name
+            for flag in flags if flag in QUALITY_DIRS and flag != self.quality
+        }
+
+    @property
+    def pipeline_env(self):
+        """PIPELINE_* settings this render runs with; they are part of the cache key."""
+        merged = dict(os.environ, **self.env)
+        return {
+            k: v for k, v in merged.items()
+            if k.startswith("PIPELINE_") and (self.scene.project or k not in PROJECT_SCENE_ENVS)
+        }
+
+    @property
+    def log_path(self):
+        return Path(self.media_dir) / "logs" / "pipeline" / f"{self.scene.module_name}_{self.scene.name}.log"
+
+    def command(self):
+        return [
+            sys.executable, "-m", "manim",
+            f"-q{self.quality}",
+            "--format=mp4",
+            "--media_dir", str(self.media_dir),
+            *self.extra_args,
+            self.scene.module.as_posix(),
+            self.scene.name,
+        ]
+
+
+@dataclass
+class RenderResult:
+    """Outcome of one scene render."""
+
+    target: str
+    status: str
+    wall_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    returncode: int = 0
+    output: str = ""
+    log: str = ""
+
+
+class MemoryBudget:
+    """Counting semaphore over megabytes instead of slots."""
+
+    def __init__(self, total_mb):
+        self.total_mb = total_mb
+        self.in_use_mb = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, mb):
+        with self._cond:
+            # An oversized job still runs, but only when nothing else does
+            while self.in_use_mb and self.in_use_mb + mb > self.total_mb:
+                self._cond.wait()
+            self.in_use_mb += mb
+
+    def release(self, mb):
+        with self._cond:
+            self.in_use_mb -= mb
+            self._cond.notify_all()
+
+
+def system_memory_mb():
+    """Physical memory of this machine, or None when it cannot be read."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _maxrss_mb(rusage):
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(rusage.ru_maxrss / scale, 1)
+
+
+def run_job(job, budget):
+    """Render one scene in a fresh manim process and wait for it."""
+    budget.acquire(job.memory_mb)
+    try:
+        job.log_path.parent.mkdir(parents=True, exist_ok=True)
+        env = dict(os.environ, **job.env)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+
+        start = time.perf_counter()
+        with open(job.log_path, "w", encoding="utf-8") as log:
+            process = subprocess.Popen(
+                job.command(), cwd=PROJECT_ROOT, env=env,
+                stdout=log, stderr=subprocess.STDOUT,
+            )
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+        wall = time.perf_counter() - start
+    finally:
+        budget.release(job.memory_mb)
+
+    return RenderResult(
+        target=job.scene.target,
+        status="ok" if process.returncode == 0 else "failed",
+        wall_seconds=round(wall, 2),
+        peak_rss_mb=_maxrss_mb(rusage),
+        returncode=process.returncode,
+        output=str(job.output_path),
+        log=str(job.log_path),
+    )
+
+
+def run_job_on_server(job, url):
+    """Render one scene on a warm render server (pipeline/server.py) and wait for it."""
+    if job.extra_args:
+        # The server renders through manim's config, not its command line
+        return RenderResult(
+            target=job.scene.target, status="failed", returncode=1, output=str(job.output_path),
+            log=f"the render server does not take manim arguments ({' '.join(job.extra_args)})",
+        )
+    start = time.perf_counter()
+    try:
+        final = submit(
+            job.scene.target, job.quality, job.media_dir, env=job.env, url=url,
+        )
+    except OSError as exc:  # server not running or connection dropped
+        final = {"event": "failed", "error": str(exc)}
+    wall = time.perf_counter() - start
+    return RenderResult(
+        target=job.scene.target,
+        status="ok" if final["event"] == "done" else "failed",
+        # Time spent rendering, not waiting in the server's queue
+        wall_seconds=final.get("wall_seconds", round(wall, 2)),
+        returncode=0 if final["event"] == "done" else 1,
+        output=final.get("output", str(job.output_path)),
+        log=final.get("error", ""),
+    )
+
+
+def load_report(media_dir=MEDIA_DIR):
+    """
+    Read timing estimates from the previous run, keyed by target.
+    Estimates survive cached runs, so they always reflect a real render.
+    """
+    path = Path(media_dir) / REPORT_NAME
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("estimates", {})
+
+
+def write_report(results, wall_seconds, media_dir=MEDIA_DIR):
+    path = Path(media_dir) / REPORT_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    estimates = load_report(media_dir)
+    for r in results:
+        if r.status == "ok":
+            estimates[r.target] = {"wall_seconds": r.wall_seconds, "peak_rss_mb": r.peak_rss_mb}
+    report = {
+        "wall_seconds": round(wall_seconds, 2),
+        "scene_seconds": round(sum(r.wall_seconds for r in results), 2),
+        "results": [asdict(r) for r in results],
+        "estimates": estimates,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def render_jobs(jobs, max_workers=None, memory_budget_mb=None, on_result=None, server=None):
+    """
+    Render jobs on a bounded pool and return their results in job order.
+    Jobs with the longest expected run time start first. With `server`, jobs
+    are sent to that render server instead of starting manim processes.
+    """
+    if server:
+        results = []
+        for job in jobs:  # the server renders one scene at a time anyway
+            results.append(run_job_on_server(job, server))
+            if on_result:
+                on_result(results[-1])
+        return results
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if memory_budget_mb is None:
+        memory_budget_mb = int((system_memory_mb() or max_workers * DEFAULT_SCENE_MEMORY_MB) * 0.75)
+    budget = MemoryBudget(memory_budget_mb)
+
+    ordered = sorted(jobs, key=lambda j: j.estimated_seconds, reverse=True)
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(run_job, job, budget): job for job in ordered}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # keep the rest of the batch going
+                result = RenderResult(target=job.scene.target, status="failed", log=str(exc))
+            results[id(job)] = result
+            if on_result:
+                on_result(result)
+    return [results[id(job)] for job in jobs]
+
+
+def print_summary(results, wall_seconds):
+    print("\n" + "=" * 60)
+    for r in results:
+        icon = {"ok": "✅", "failed": "❌", "cached": "♻️ "}.get(r.status, "⏭️ ")
+        print(f"{icon} {r.target:<55} {r.wall_seconds:>7.1f}s {r.peak_rss_mb:>7.0f} MB")
+    scene_seconds = sum(r.wall_seconds for r in results)
+    failed = sum(r.status == "failed" for r in results)
+    cached = sum(r.status == "cached" for r in results)
+    print("=" * 60)
+    print(f"Scenes: {len(results)}  Cached: {cached}  Failed: {failed}")
+    print(f"Wall time: {wall_seconds:.1f}s  (serial would be ~{scene_seconds:.1f}s)")
+    tex = TEX_CACHE.stats()
+    print(f"Tex cache: {tex['hits']} hits, {tex['misses']} misses, {tex['entries']} SVGs ({tex['size_mb']} MB)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Render project scenes in parallel.")
+    parser.add_argument("targets", nargs="*", help="Scene names, module paths or module.py:Scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Concurrent manim processes (default: CPU count)")
+    parser.add_argument("--memory-budget", type=int, default=None, help="Total MB available to renders (default: 75%% of RAM)")
+    parser.add_argument("--scene-memory", type=int, default=DEFAULT_SCENE_MEMORY_MB, help="Expected MB per scene")
+    parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    parser.add_argument("--seed", default=None, help="Seed override mixed into every scene's seed")
+    parser.add_argument(
+        "--encoder", choices=["partial", STREAM_MODE], default="partial",
+        help="partial: manim's file per play; stream: one encoder per scene with an index of play markers",
+    )
+    parser.add_argument(
+        "--output", choices=["mp4", *ALPHA_OUTPUTS], default="mp4",
+        help="mp4: H.264 on black; prores/qtrle: .mov with alpha; png: RGBA frame sequence",
+    )
+    parser.add_argument(
+        "--tiers", default=None, metavar="FLAGS",
+        help="Also write these lower qualities from the same render, e.g. l or l,m (implies --encoder stream)",
+    )
+    parser.add_argument(
+        "--frame-workers", type=int, default=1, metavar="N",
+        help="Draw long plays that depend on time alone with N processes per scene",
+    )
+    parser.add_argument("--changed-only", action="store_true", help="Only scenes whose EDL/chapter rows changed since they last rendered")
+    parser.add_argument("--profile", action="store_true", help="Record per-play timings and rank the rendered scenes by cost")
+    parser.add_argument("--no-cache", action="store_true", help="Render every scene even if its output is cached")
+    parser.add_argument("--no-tex-batch", action="store_true", help="Skip the one-run LaTeX prepass over the modules to render")
+    parser.add_argument("--server", default=None, metavar="URL", help="Render on a warm render server (python -m pipeline.server serve)")
+    parser.add_argument("--list", action="store_true", help="List discovered scenes and exit")
+    return parser
+
+
+def make_jobs(scenes, args):
+    previous = load_report(args.media_dir)
+    env = {SEED_ENV: str(args.seed)} if args.seed is not None else {}
+    if args.encoder == STREAM_MODE:
+        env[ENCODER_ENV] = STREAM_MODE
+    if args.profile:
+        env[PROFILE_ENV] = "1"
+    if args.output != "mp4":
+        env[OUTPUT_ENV] = args.output
+    if args.tiers:
+        env[TIERS_ENV] = args.tiers
+    if args.frame_workers > 1:
+        env[FRAME_WORKERS_ENV] = str(args.frame_workers)
+    jobs = []
+    for scene in scenes:
+        last = previous.get(scene.target, {})
+        jobs.append(RenderJob(
+            scene=scene,
+            quality=args.quality,
+            media_dir=args.media_dir,
+            # Learn from the last run: its peak memory and duration
+            memory_mb=max(args.scene_memory, int(last.get("peak_rss_mb", 0))),
+            estimated_seconds=last.get("wall_seconds", 0.0),
+            env=dict(env),
+        ))
+
+    # --encoder/--output/--tiers/... are read by ProjectScene; plain Scenes render manim's mp4
+    requested = sorted(k for k in dict(os.environ, **env) if k in PROJECT_SCENE_ENVS)
+    plain = sorted({scene.module.as_posix() for scene in scenes if not scene.project})
+    if requested and plain:
+        print(f"⚠️  {', '.join(requested)} ignored for the plain manim Scenes in {', '.join(plain)}")
+    return jobs
+
+
+def restore_cached(jobs, cache, restore=True):
+    """
+    Key every job and restore cache hits in place.
+    Returns (results for hits, jobs that still need rendering).
+    """
+    hits, pending = [], []
+    for job in jobs:
+        extra = dict(job.pipeline_env, extra_args=" ".join(job.extra_args))
+        job.cache_key = scene_key(job.scene, job.quality, extra=extra)
+        if restore and cache.restore(job.cache_key, job.output_path, job.tier_paths):
+            hits.append(RenderResult(target=job.scene.target, status="cached", output=str(job.output_path)))
+        else:
+            pending.append(job)
+    return hits, pending
+
+
+def store_rendered(jobs, results, cache):
+    for job, result in zip(jobs, results):
+        if result.status == "ok" and job.cache_key:
+            cache.store(job.cache_key, job.output_path, job.scene, tiers=job.tier_paths)
+
+
+def report_profiles(jobs, results, media_dir):
+    """Aggregate the profiles written by this run's renders."""
+    reports = {}
+    # Cache hits come first in `results` and were not rendered (or profiled) now
+    for job, result in zip(jobs, results[-len(jobs):] if jobs else []):
+        if result.status == "ok":
+            report = load_profile(job.media_dir, job.scene.module_name, job.scene.name)
+            if report is not None:
+                reports[job.scene.target] = report
+    if not reports:
+        print("🔬 No profiles recorded (cached scenes are not re-rendered; add --no-cache)")
+        return
+    print_profile(summarize_profiles(reports, media_dir), set(reports))
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    discovered = discover_scenes()
+    scenes = select_scenes(discovered, args.targets)
+    manifest = build_manifest(scenes=discovered)
+
+    if args.changed_only:
+        changed = {t for entry in changed_entries(manifest, args.media_dir) for t in entry.targets}
+        scenes = [scene for scene in scenes if scene.target in changed]
+        print(f"📝 {len(scenes)} scenes with changed EDL rows")
+
+    if args.list:
+        for scene in scenes:
+            print(scene.target)
+        return 0
+
+    jobs = make_jobs(scenes, args)
+    start = time.perf_counter()
+    # Each scene may use --frame-workers cores; keep the total near the CPU count
+    max_workers = args.jobs or max(1, (os.cpu_count() or 1) // max(1, args.frame_workers))
+
+    cache = SceneCache()
+    hits, jobs = restore_cached(jobs, cache, restore=not args.no_cache)
+    if hits:
+        print(f"♻️  {len(hits)} scenes unchanged, restored from cache")
+    if jobs and not args.no_tex_batch:
+        modules = sorted({PROJECT_ROOT / job.scene.module for job in jobs})
+        try:
+            compiled = precompile_modules(modules)
+        except Exception as exc:  # the scenes can still compile their own formulas
+            print(f"⚠️  Tex prepass skipped: {exc}")
+        else:
+            if compiled:
+                print(f"🧮 Precompiled {compiled} Tex strings in one LaTeX run")
+    if args.server:
+        print(f"🔥 Rendering {len(jobs)} scenes on {args.server}")
+    else:
+        print(f"🎬 Rendering {len(jobs)} scenes with up to {max_workers} workers")
+
+    results = render_jobs(
+        jobs,
+        max_workers=max_workers,
+        memory_budget_mb=args.memory_budget,
+        on_result=lambda r: print(f"[{r.status}] {r.target} ({r.wall_seconds:.1f}s)"),
+        server=args.server,
+    )
+    store_rendered(jobs, results, cache)
+    results = hits + results
+
+    # Remember which EDL rows each scene was rendered from
+    row_hashes = {t: entry.row_hash for entry in manifest for t in entry.targets}
+    save_state(args.media_dir, {
+        r.target: row_hashes[r.target] for r in results
+        if r.status in ("ok", "cached") and r.target in row_hashes
+    })
+    wall = time.perf_counter() - start
+
+    print_summary(results, wall)
+    if args.profile:
+        report_profiles(jobs, results, args.media_dir)
+    print(f"📁 Report: {write_report(results, wall, args.media_dir)}")
+    return 1 if any(r.status == "failed" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Particle System
+A swarm of dots backed by NumPy arrays instead of one Dot mobject per particle.
+
+All particles of one color share a single VMobject whose points hold every
+particle outline back to back, so a 50-particle swarm is one or a few
+mobjects for manim to transform, copy and rasterize. Particle centers and
+radii are read straight from those points, which keeps shift/scale,
+`.animate` and manim's point interpolation fully vectorized.
+
+    particles = ParticleSystem.scatter(50, x_range=(2.5, 3.5), y_range=(-2, 2), palette=[BLUE])
+    self.play(particles.animate.cluster_to(ORIGIN, spread=0.5))
+"""
+
+import numpy as np
+from manim import WHITE, ManimColor, VGroup, VMobject
+
+# Cubic segments per particle outline, matching manim's Circle
+SEGMENTS = 8
+POINTS_PER_PARTICLE = SEGMENTS * 4
+
+GRAVITY = 9.8
+
+
+def _unit_circle_template(segments=SEGMENTS):
+    """Cubic Bezier control points of a unit circle, shape (segments * 4, 3)."""
+    angles = np.linspace(0, 2 * np.pi, segments + 1)
+    a0, a1 = angles[:-1], angles[1:]
+    handle = 4 / 3 * np.tan((a1 - a0) / 4)
+
+    start = np.stack([np.cos(a0), np.sin(a0)], axis=1)
+    end = np.stack([np.cos(a1), np.sin(a1)], axis=1)
+    start_tangent = np.stack([-np.sin(a0), np.cos(a0)], axis=1)
+    end_tangent = np.stack([-np.sin(a1), np.cos(a1)], axis=1)
+
+    curves = np.stack([
+        start,
+        start + handle[:, None] * start_tangent,
+        end - handle[:, None] * end_tangent,
+        end,
+    ], axis=1).reshape(-1, 2)
+    return np.hstack([curves, np.zeros((len(curves), 1))])
+
+
+UNIT_CIRCLE = _unit_circle_template()
+
+
+def _as_points(values, count=None):
+    """Coerce (N, 2) or (N, 3) input to float (N, 3) points."""
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = np.tile(values, (count or 1, 1))
+    if values.shape[1] == 2:
+        values = np.hstack([values, np.zeros((len(values), 1))])
+    return values
+
+
+class ParticleSystem(VGroup):
+    """Many filled circles rendered as one VMobject per color."""
+
+    def __init__(self, positions, colors=WHITE, radii=0.08, fill_opacity=1.0, **kwargs):
+        super().__init__(**kwargs)
+        positions = _as_points(positions)
+        count = len(positions)
+
+        if isinstance(colors, (list, tuple, np.ndarray)):
+            keys = [ManimColor(c).to_hex() for c in colors]
+        else:
+            keys = [ManimColor(colors).to_hex()] * count
+
+        self.base_radii = np.broadcast_to(np.asarray(radii, dtype=float), (count,)).copy()
+        self.velocities = np.zeros((count, 3))
+
+        # One batch (VMobject) per distinct color, remembering particle indices
+        self._indices = []
+        for key in dict.fromkeys(keys):
+            indices = np.array([i for i, k in enumerate(keys) if k == key])
+            batch = VMobject(fill_color=key, fill_opacity=fill_opacity, stroke_width=0)
+            batch.points = self._outline(positions[indices], self.base_radii[indices])
+            self._indices.append(indices)
+            self.add(batch)
+
+    @classmethod
+    def scatter(cls, count, x_range, y_range, palette=(WHITE,), radius=0.08, rng=None, **kwargs):
+        """Place particles uniformly in a box, coloring each from the palette."""
+        rng = rng if rng is not None else np.random
+        positions = np.column_stack([
+            rng.uniform(*x_range, size=count),
+            rng.uniform(*y_range, size=count),
+            np.zeros(count),
+        ])
+        picks = np.minimum(rng.uniform(0, len(palette), size=count).astype(int), len(palette) - 1)
+        return cls(positions, colors=[palette[i] for i in picks], radii=radius, **kwargs)
+
+    @staticmethod
+    def _outline(centers, radii):
+        return (centers[:, None, :] + radii[:, None, None] * UNIT_CIRCLE[None]).reshape(-1, 3)
+
+    def _batches(self):
+        return zip(self.submobjects, self._indices)
+
+    @property
+    def num_particles(self):
+        return len(self.base_radii)
+
+    @property
+    def positions(self):
+        """Particle centers, shape (N, 3)."""
+        out = np.zeros((self.num_particles, 3))
+        for batch, indices in self._batches():
+            out[indices] = batch.points.reshape(-1, POINTS_PER_PARTICLE, 3).mean(axis=1)
+        return out
+
+    @property
+    def radii(self):
+        """Current particle radii, shape (N,)."""
+        out = np.zeros(self.num_particles)
+        for batch, indices in self._batches():
+            outlines = batch.points.reshape(-1, POINTS_PER_PARTICLE, 3)
+            out[indices] = np.linalg.norm(outlines[:, 0] - outlines.mean(axis=1), axis=1)
+        return out
+
+    def set_positions(self, positions):
+        """Move every particle center at once, keeping each outline's shape."""
+        positions = _as_points(positions, self.num_particles)
+        for batch, indices in self._batches():
+            outlines = batch.points.reshape(-1, POINTS_PER_PARTICLE, 3)
+            outlines += (positions[indices] - outlines.mean(axis=1))[:, None, :]
+            batch.points = outlines.reshape(-1, 3)
+        return self
+
+    def set_radii(self, radii):
+        radii = np.broadcast_to(np.asarray(radii, dtype=float), (self.num_particles,))
+        centers = self.positions
+        for batch, indices in self._batches():
+            batch.points = self._outline(centers[indices], radii[indices])
+        return self
+
+    # Batched updates; each returns self so they chain inside `.animate`
+
+    def random_walk(self, step=0.05, rng=None):
+        """Jitter every particle by a Gaussian step in the plane."""
+        rng = rng if rng is not None else np.random
+        jitter = rng.normal(0, step, size=(self.num_particles, 3))
+        jitter[:, 2] = 0
+        return self.set_positions(self.positions + jitter)
+
+    def randomize(self, x_range, y_range, rng=None):
+        """Move every particle to a fresh uniform position in a box."""
+        rng = rng if rng is not None else np.random
+        return self.set_positions(np.column_stack([
+            rng.uniform(*x_range, size=self.num_particles),
+            rng.uniform(*y_range, size=self.num_particles),
+        ]))
+
+    def cluster_to(self, point, spread=0.5, rng=None):
+        """Gather particles into a Gaussian cloud around a point."""
+        rng = rng if rng is not None else np.random
+        offsets = rng.normal(0, spread, size=(self.num_particles, 3))
+        offsets[:, 2] = 0
+        return self.set_positions(np.asarray(point, dtype=float) + offsets)
+
+    def gravity_fall(self, dt, gravity=GRAVITY):
+        """Advance a free fall by dt seconds; use from an updater."""
+        self.velocities[:, 1] -= gravity * dt
+        return self.set_positions(self.positions + self.velocities * dt)
+
+    def reveal(self, alpha, lag_ratio=0.02):
+        """
+        Grow particles in one after another, like LaggedStart over FadeIn.
+        Drive it with UpdateFromAlphaFunc(particles, lambda m, a: m.reveal(a)).
+        """
+        count = self.num_particles
+        total = 1 + lag_ratio * max(count - 1, 0)
+        local = np.clip(alpha * total - lag_ratio * np.arange(count), 0, 1)
+        return self.set_radii(self.base_radii * local)
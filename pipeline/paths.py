@@ -0,0 +1,39 @@
+"""
+Project Paths
+Locations shared by the render tooling.
+"""
+
+import re
+from pathlib import Path
+
+# Repository root (the folder holding manim.cfg and the numbered modules)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Default media directory, matching render_all.sh and manim.cfg
+MEDIA_DIR = PROJECT_ROOT / "media"
+
+# Numbered concept folders such as "3_Simulation" or "7_Testing_known"
+MODULE_DIR_PATTERN = re.compile(r"^\d+_")
+
+
+def module_dirs(root=PROJECT_ROOT):
+    """Return the numbered concept folders in order."""
+    root = Path(root)
+    return sorted(
+        (p for p in root.iterdir() if p.is_dir() and MODULE_DIR_PATTERN.match(p.name)),
+        key=lambda p: (int(p.name.split("_", 1)[0]), p.name),
+    )
+
+
+def relative_to_root(path, root=PROJECT_ROOT):
+    """Express a path relative to the project root when possible."""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(Path(root).resolve())
+    except ValueError:
+        return path
+
+
+def inside_root(path, root=PROJECT_ROOT):
+    """Whether a path (after resolving symlinks and ..) lies inside the project root."""
+    return not relative_to_root(path, root).is_absolute()
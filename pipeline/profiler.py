@@ -0,0 +1,300 @@
+"""
+Render Profiler
+Where a scene's render time goes, per play().
+
+Set PIPELINE_PROFILE=1 (or pass `--profile` to the orchestrator) and every
+ProjectScene records, for each play()/wait():
+
+    build    construct() code since the previous play (creating mobjects)
+    text     of which constructing Text/MarkupText/MathTex/Tex/Code
+    begin    Animation.begin() (e.g. Create/Write computing their start state)
+    update   per-frame interpolation and updaters
+    raster   drawing frames with Cairo
+    encode   handing frames to the encoder
+    other    the rest of play() (hashing, static frame capture, copies)
+
+plus frames, run time, resident and peak memory. Plays drawn by frame
+workers (PIPELINE_FRAME_WORKERS) record "frame_workers", and the time spent
+waiting for their frames counts as raster. Two files are written per
+scene under <media_dir>/profiles/:
+
+    <module>_<Scene>.json     the report
+    <module>_<Scene>.folded   folded stacks for flamegraph.pl / speedscope
+
+The orchestrator collects the reports of a run into profile_summary.json,
+ranks the scenes by cost and compares them with the previous run.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+PROFILE_DIR = "profiles"
+SUMMARY_NAME = "profile_summary.json"
+
+BUCKETS = ("build", "text", "begin", "update", "raster", "encode", "other")
+
+# Constructors timed as "text"; only the outermost call counts when they nest
+TEXT_CLASSES = ("Text", "MarkupText", "Paragraph", "MathTex", "Tex", "Code")
+
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_mb():
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / (1024 * 1024)
+
+
+def profile_paths(media_dir, module_name, scene_name):
+    """(report, folded stacks) paths for one scene."""
+    base = Path(media_dir) / PROFILE_DIR / f"{module_name}_{scene_name}"
+    return base.with_suffix(".json"), base.with_suffix(".folded")
+
+
+class RenderProfiler:
+    """Times one scene's render by wrapping its renderer, file writer and text classes."""
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.plays = []
+        self.current = self._new_play()
+        self.text_depth = 0
+        self.in_play = False
+        self.mark = time.perf_counter()
+        self.started = self.mark
+        self.finish_seconds = 0.0
+        self._restore = []
+
+    def _new_play(self):
+        return dict(dict.fromkeys(BUCKETS, 0.0), frames=0)
+
+    def _wrap(self, owner, name, wrapper):
+        original = getattr(owner, name)
+        # Methods already patched on the instance are put back as they were
+        own = isinstance(owner, type) or name in vars(owner)
+        setattr(owner, name, wrapper(original))
+        self._restore.append((owner, name, original, own))
+
+    def _timed(self, bucket):
+        def wrapper(original):
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    self.current[bucket] += time.perf_counter() - start
+            return timed
+        return wrapper
+
+    def install(self):
+        import manim
+
+        scene, renderer = self.scene, self.scene.renderer
+        self._wrap(renderer, "play", self._play_wrapper)
+        self._wrap(renderer, "update_frame", self._timed("raster"))
+        self._wrap(renderer.file_writer, "write_frame", self._frame_wrapper)
+        self._wrap(renderer, "scene_finished", self._finish_wrapper)
+        self._wrap(scene, "begin_animations", self._timed("begin"))
+        self._wrap(scene, "update_to_time", self._timed("update"))
+        for name in TEXT_CLASSES:
+            cls = getattr(manim, name, None)
+            if cls is not None and "__init__" in vars(cls):
+                self._wrap(cls, "__init__", self._text_wrapper)
+        return self
+
+    def uninstall(self):
+        for owner, name, original, own in reversed(self._restore):
+            if own:
+                setattr(owner, name, original)
+            else:
+                vars(owner).pop(name, None)
+        self._restore = []
+
+    def _text_wrapper(self, original):
+        def init(obj, *args, **kwargs):
+            self.text_depth += 1
+            start = time.perf_counter()
+            try:
+                return original(obj, *args, **kwargs)
+            finally:
+                self.text_depth -= 1
+                # Text built during a play (counters, updaters) is update time
+                if self.text_depth == 0 and not self.in_play:
+                    self.current["text"] += time.perf_counter() - start
+        return init
+
+    def _frame_wrapper(self, original):
+        timed = self._timed("encode")(original)
+
+        def write_frame(frame, num_frames=1):
+            self.current["frames"] += num_frames
+            return timed(frame, num_frames)
+        return write_frame
+
+    def mark_parallel(self, workers, waited):
+        """The current play's frames were drawn by forked workers."""
+        self.current["frame_workers"] = workers
+        self.current["raster"] += waited
+
+    def _play_wrapper(self, original):
+        def play(scene, *args, **kwargs):
+            start = time.perf_counter()
+            # Everything since the last play was construct() code
+            self.current["build"] = start - self.mark
+            self.in_play = True
+            try:
+                return original(scene, *args, **kwargs)
+            finally:
+                self.in_play = False
+                end = time.perf_counter()
+                self._close_play(scene, end - start)
+                self.mark = end
+        return play
+
+    def _close_play(self, scene, wall):
+        play = self.current
+        timed = play["begin"] + play["update"] + play["raster"] + play["encode"]
+        play["other"] = max(0.0, wall - timed)
+        play.update({
+            "play": len(self.plays),
+            "animations": [type(a).__name__ for a in getattr(scene, "animations", None) or []],
+            "run_time": round(getattr(scene, "duration", 0.0), 4),
+            "wall": wall,
+            "rss_mb": _rss_mb(),
+            "peak_rss_mb": _peak_rss_mb(),
+        })
+        for key in BUCKETS + ("wall",):
+            play[key] = round(play[key], 6)
+        self.plays.append(play)
+        self.current = self._new_play()
+
+    def _finish_wrapper(self, original):
+        def scene_finished(scene):
+            start = time.perf_counter()
+            try:
+                return original(scene)
+            finally:
+                # Closing the encoder and combining the movie
+                self.finish_seconds = time.perf_counter() - start
+                self.uninstall()
+                self.write()
+        return scene_finished
+
+    def report(self):
+        from manim import config
+
+        totals = {key: round(sum(p[key] for p in self.plays), 6) for key in BUCKETS}
+        totals["finish"] = round(self.finish_seconds, 6)
+        file_writer = self.scene.renderer.file_writer
+        return {
+            "scene": type(self.scene).__name__,
+            "module": Path(config.input_file).stem if config.input_file else "",
+            "resolution": [config.pixel_width, config.pixel_height],
+            "fps": config.frame_rate,
+            "encoder": type(file_writer).__name__,
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "frames": sum(p["frames"] for p in self.plays),
+            "peak_rss_mb": round(_peak_rss_mb(), 1),
+            "totals": totals,
+            "plays": self.plays,
+        }
+
+    def folded(self, report):
+        """Folded stacks ("scene;play;bucket microseconds"), one line per non-zero bucket."""
+        lines = []
+        scene = report["scene"]
+        for play in report["plays"]:
+            label = f"play_{play['play']:03d}:{'+'.join(play['animations']) or 'wait'}"
+            if play.get("frame_workers"):
+                label += f"[{play['frame_workers']} workers]"
+            for bucket in BUCKETS:
+                # text time is part of build time; show it as a child frame
+                stack = f"{scene};{label};build;text" if bucket == "text" else f"{scene};{label};{bucket}"
+                micros = round((play[bucket] - (play["text"] if bucket == "build" else 0)) * 1e6)
+                if micros > 0:
+                    lines.append(f"{stack} {micros}")
+        if report["totals"]["finish"]:
+            lines.append(f"{scene};finish {round(report['totals']['finish'] * 1e6)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        from manim import config
+
+        report = self.report()
+        report_path, folded_path = profile_paths(config.media_dir, report["module"], report["scene"])
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        folded_path.write_text(self.folded(report), encoding="utf-8")
+        return report_path
+
+
+# Aggregation (used by the orchestrator; no manim needed)
+
+def load_profile(media_dir, module_name, scene_name):
+    report_path, _ = profile_paths(media_dir, module_name, scene_name)
+    if not report_path.exists():
+        return None
+    with open(report_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def summarize(reports, media_dir):
+    """
+    Rank scenes by wall time and compare with the previous summary.
+    Writes <media_dir>/profile_summary.json and returns the summary.
+    """
+    path = Path(media_dir) / SUMMARY_NAME
+    previous = {}
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            previous = {s["target"]: s for s in json.load(f).get("scenes", [])}
+
+    scenes = []
+    for target, report in reports.items():
+        last = previous.get(target)
+        scenes.append({
+            "target": target,
+            "wall_seconds": report["wall_seconds"],
+            "frames": report["frames"],
+            "plays": len(report["plays"]),
+            "peak_rss_mb": report["peak_rss_mb"],
+            "totals": report["totals"],
+            # Slowest play, the usual place to start looking
+            "slowest_play": max(report["plays"], key=lambda p: p["wall"], default=None),
+            "previous_wall_seconds": last["wall_seconds"] if last else None,
+            "change": round(report["wall_seconds"] / last["wall_seconds"] - 1, 4) if last and last["wall_seconds"] else None,
+        })
+    # Scenes not profiled this run keep their last numbers
+    scenes += [s for target, s in previous.items() if target not in reports]
+    scenes.sort(key=lambda s: s["wall_seconds"], reverse=True)
+
+    summary = {"scenes": scenes}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def print_summary(summary, targets, top=10):
+    """Cost ranking of the scenes profiled in this run."""
+    print("\n🔬 Profile (seconds)")
+    print(f"{'scene':<48} {'wall':>7} {'build':>6} {'text':>6} {'update':>7} {'raster':>7} {'encode':>7}  change")
+    shown = [s for s in summary["scenes"] if s["target"] in targets][:top]
+    for s in shown:
+        t = s["totals"]
+        change = f"{s['change']:+.0%}" if s["change"] is not None else "-"
+        print(
+            f"{s['target']:<48} {s['wall_seconds']:>7.1f} {t['build']:>6.1f} {t['text']:>6.1f} "
+            f"{t['update']:>7.1f} {t['raster']:>7.1f} {t['encode']:>7.1f}  {change}"
+        )
@@ -0,0 +1,81 @@
+"""
+Project Scene
+Base class for the project's production scenes.
+
+Use it exactly like manim's Scene:
+
+    from pipeline.scene import ProjectScene
+
+    class MyAnimation(ProjectScene):
+        seed = None  # optional override mixed into the per-scene seed
+
+        def construct(self):
+            with self.timeline():  # many short plays -> one partial movie
+                ...
+"""
+
+from manim import Camera, Scene, config
+from manim.constants import RendererType
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from pipeline.encoder import StreamingFileWriter
+from pipeline.layers import LayeredCairoRenderer
+from pipeline.seeding import resolve_seed, seed_everything
+from pipeline.settings import (
+    alpha_output, frame_workers, layers_enabled, output_tiers, profile_enabled, stream_mode_enabled,
+)
+from pipeline.tex_cache import install as install_tex_cache
+from pipeline.timeline import TimelineSegment
+
+# MathTex/Tex in every project scene compile through the shared .cache/tex
+install_tex_cache()
+
+
+class ProjectScene(Scene):
+    """Scene with the project's shared render behaviour."""
+
+    # Optional seed override; PIPELINE_SEED in the environment takes priority
+    seed = None
+
+    def __init__(self, renderer=None, camera_class=Camera, skip_animations=False, **kwargs):
+        alpha = alpha_output()
+        if alpha:
+            # PIPELINE_OUTPUT=prores/qtrle/png: transparent background, set
+            # before the camera and the file writer read the config
+            config.transparent = True
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            # Static mobjects above the animated ones are cached as layers, and
+            # one encoder writes the whole scene when streaming (also the alpha
+            # formats and tiers)
+            streaming = stream_mode_enabled() or alpha or output_tiers()
+            renderer_class = LayeredCairoRenderer if layers_enabled() else CairoRenderer
+            renderer = renderer_class(
+                file_writer_class=StreamingFileWriter if streaming else SceneFileWriter,
+                camera_class=camera_class,
+                skip_animations=skip_animations,
+            )
+        super().__init__(renderer=renderer, camera_class=camera_class, skip_animations=skip_animations, **kwargs)
+
+    def setup(self):
+        # Seed random and NumPy right before construct() runs
+        self.random_seed = seed_everything(resolve_seed(type(self).__name__, self.seed))
+        if profile_enabled():
+            # PIPELINE_PROFILE=1: per-play timings in <media_dir>/profiles/
+            from pipeline.profiler import RenderProfiler
+            self.profiler = RenderProfiler(self).install()
+        super().setup()
+
+    def play_internal(self, skip_rendering=False):
+        workers = frame_workers()
+        if workers > 1 and not (skip_rendering or self.skip_animation_preview):
+            # PIPELINE_FRAME_WORKERS: long plays that depend on time alone are
+            # drawn by forked workers
+            from pipeline.frame_parallel import play_in_parallel
+            if play_in_parallel(self, workers):
+                return
+        super().play_internal(skip_rendering)
+
+    def timeline(self):
+        """Merge the play()/wait() calls in a with-block into one partial movie."""
+        return TimelineSegment(self)
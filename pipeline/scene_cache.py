@@ -0,0 +1,254 @@
+"""
+Scene Cache
+A project-level, content-addressed cache of finished scene videos.
+
+A scene's key hashes everything that can change its output:
+- the scene class source (including local base classes),
+- the module-level code it runs with (imports, helpers, helper classes such
+  as custom Mobjects or Animations, constants); other scenes in the module
+  are left out,
+- the source of project modules it imports (e.g. pipeline helpers),
+- any input files referenced by string literals,
+- the render settings in manim.cfg, the quality and the manim version.
+
+A hit copies the stored {scene_name}.mp4 into place without starting manim,
+together with the lower-quality tiers (PIPELINE_TIERS) written by the same
+render.
+"""
+
+import ast
+import configparser
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from pipeline.discovery import scenes_in_file
+from pipeline.paths import PROJECT_ROOT, relative_to_root
+
+CACHE_DIR = PROJECT_ROOT / ".cache" / "scenes"
+CONFIG_FILE = PROJECT_ROOT / "manim.cfg"
+
+# manim.cfg keys that never change the rendered frames
+IGNORED_CONFIG_KEYS = {"preview", "show_in_file_browser", "log_dir"}
+
+# Bump to invalidate every entry after a change to the key layout
+KEY_VERSION = "2"
+
+
+def manim_version():
+    try:
+        from importlib.metadata import version
+        return version("manim")
+    except Exception:
+        return "unknown"
+
+
+def _hash_file(path, digest):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+
+def _config_items(path=CONFIG_FILE):
+    if not Path(path).exists():
+        return []
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path, encoding="utf-8")
+    return sorted(
+        (section, key, value)
+        for section in parser.sections()
+        for key, value in parser.items(section)
+        if key not in IGNORED_CONFIG_KEYS
+    )
+
+
+def _is_main_guard(node):
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def _local_module_files(node, root):
+    """Resolve project-local imports (e.g. "from pipeline.x import y") to files."""
+    names = []
+    if isinstance(node, ast.Import):
+        names = [alias.name for alias in node.names]
+    elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+        names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+
+    files = []
+    for name in names:
+        base = Path(root, *name.split("."))
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                files.append(candidate)
+    return files
+
+
+def _string_constants(nodes):
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Constant) and isinstance(child.value, str):
+                yield child.value
+
+
+def _referenced_files(nodes, module_dir, root):
+    files = set()
+    for value in _string_constants(nodes):
+        if not value or len(value) > 255 or "\n" in value:
+            continue
+        for base in (root, module_dir):
+            try:
+                candidate = (Path(base) / value).resolve()
+                if candidate.is_file():
+                    files.add(candidate)
+            except (OSError, ValueError):
+                continue
+    return files
+
+
+def _local_sources(start_files, root):
+    """Follow project-local imports transitively and return their paths."""
+    seen, pending = set(), list(start_files)
+    while pending:
+        path = Path(pending.pop()).resolve()
+        if path in seen:
+            continue
+        seen.add(path)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            pending.extend(_local_module_files(node, root))
+    return seen
+
+
+def _module_nodes(scene, root):
+    """Top-level nodes of the scene's module that its render depends on."""
+    path = Path(root) / scene.module
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+
+    classes = {n.name: n for n in tree.body if isinstance(n, ast.ClassDef)}
+    other_scenes = {s.name for s in scenes_in_file(path, root)} - {scene.name}
+
+    # The scene class plus any base classes defined in the same module
+    scene_nodes, pending = [], [scene.name]
+    while pending:
+        node = classes.get(pending.pop())
+        if node is None or node in scene_nodes:
+            continue
+        scene_nodes.append(node)
+        pending.extend(b.id for b in node.bases if isinstance(b, ast.Name))
+
+    # Module-level code the scene runs with; other scenes and __main__ excluded
+    return [
+        n for n in tree.body
+        if not (isinstance(n, ast.ClassDef) and n.name in other_scenes and n not in scene_nodes)
+        and not _is_main_guard(n)
+    ]
+
+
+def scene_dependencies(scene, root=PROJECT_ROOT):
+    """Files a scene's render reads: its module, imported project modules, referenced inputs, manim.cfg."""
+    root = Path(root)
+    path = root / scene.module
+    module_nodes = _module_nodes(scene, root)
+    imports = [f for n in module_nodes for f in _local_module_files(n, root)]
+    files = {path.resolve()} | _local_sources(imports, root) | _referenced_files(module_nodes, path.parent, root)
+    if (root / CONFIG_FILE.name).is_file():
+        files.add((root / CONFIG_FILE.name).resolve())
+    return files
+
+
+def scene_key(scene, quality="h", extra=None, root=PROJECT_ROOT):
+    """Content hash identifying one scene render."""
+    root = Path(root)
+    path = root / scene.module
+    module_nodes = _module_nodes(scene, root)
+
+    digest = hashlib.sha256()
+    digest.update(f"v{KEY_VERSION}|{quality}|{manim_version()}\n".encode())
+    for node in module_nodes:
+        digest.update(ast.dump(node, include_attributes=False).encode())
+
+    imports = [f for n in module_nodes for f in _local_module_files(n, root)]
+    for local in sorted(_local_sources(imports, root)):
+        digest.update(str(relative_to_root(local, root)).encode())
+        _hash_file(local, digest)
+
+    for ref in sorted(_referenced_files(module_nodes, path.parent, root)):
+        digest.update(str(relative_to_root(ref, root)).encode())
+        _hash_file(ref, digest)
+
+    for item in _config_items(root / CONFIG_FILE.name):
+        digest.update("|".join(item).encode())
+    for key, value in sorted((extra or {}).items()):
+        digest.update(f"{key}={value}".encode())
+    return digest.hexdigest()
+
+
+def _copy_atomic(src, dst):
+    # Always a real copy: manim rewrites outputs in place, which would
+    # corrupt a hard-linked cache entry
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.name + ".tmp")
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+
+class SceneCache:
+    """Finished scene videos stored by content key."""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = Path(directory)
+
+    def video_path(self, key):
+        return self.directory / f"{key}.mp4"
+
+    def tier_path(self, key, flag):
+        return self.directory / f"{key}.{flag}.mp4"
+
+    def lookup(self, key):
+        """Return the cached video for a key, or None on a miss."""
+        path = self.video_path(key)
+        return path if path.exists() else None
+
+    def restore(self, key, output_path, tiers=None):
+        """
+        Place the cached video at output_path and each tier ({flag: path}) at
+        its path. Returns False on a miss, or if a tier is not cached.
+        """
+        tiers = tiers or {}
+        cached = self.lookup(key)
+        if cached is None or not all(self.tier_path(key, flag).exists() for flag in tiers):
+            return False
+        for flag, path in tiers.items():
+            _copy_atomic(self.tier_path(key, flag), path)
+        _copy_atomic(cached, output_path)
+        return True
+
+    def store(self, key, output_path, scene=None, tiers=None):
+        """Add a freshly rendered video, and the tiers ({flag: path}) it wrote, to the cache."""
+        output_path = Path(output_path)
+        tiers = tiers or {}
+        # Frame sequences (a directory) are not cached, nor renders missing a tier
+        if not output_path.is_file() or not all(Path(p).is_file() for p in tiers.values()):
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for flag, path in tiers.items():
+            _copy_atomic(path, self.tier_path(key, flag))
+        _copy_atomic(output_path, self.video_path(key))
+        meta = {
+            "scene": getattr(scene, "target", None),
+            "source": str(output_path),
+            "tiers": {flag: str(path) for flag, path in tiers.items()},
+            "stored_at": time.time(),
+        }
+        with open(self.directory / f"{key}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        return True
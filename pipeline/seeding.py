@@ -0,0 +1,48 @@
+"""
+Deterministic Seeding
+Per-scene random seeds so scenes that use random numbers render the same
+frames every time, which keeps manim's partial-movie cache and the scene
+cache valid across runs.
+
+The seed is derived from the scene name, optionally mixed with an override
+taken from the scene's `seed` attribute or the PIPELINE_SEED environment
+variable (the environment wins, so a whole render can be re-rolled at once).
+"""
+
+import hashlib
+import os
+import random
+
+import numpy as np
+
+SEED_ENV = "PIPELINE_SEED"
+
+
+def scene_seed(scene_name, override=None):
+    """Stable 32-bit seed for a scene (NumPy only accepts seeds below 2**32)."""
+    material = scene_name if override is None else f"{scene_name}:{override}"
+    return int.from_bytes(hashlib.sha256(material.encode("utf-8")).digest()[:4], "big")
+
+
+def resolve_seed(scene_name, override=None):
+    """Seed for a scene, honouring PIPELINE_SEED over the scene's own override."""
+    env_override = os.environ.get(SEED_ENV)
+    if env_override:
+        override = env_override
+    return scene_seed(scene_name, override)
+
+
+def seed_everything(seed):
+    """Seed both the stdlib and the global NumPy random generators."""
+    random.seed(seed)
+    np.random.seed(seed)
+    return seed
+
+
+def rng_fingerprint():
+    """Short digest of the current random state, handy for spotting drift."""
+    digest = hashlib.sha256(repr(random.getstate()).encode())
+    _, keys, pos, has_gauss, cached = np.random.get_state()
+    digest.update(keys.tobytes())
+    digest.update(f"{pos}|{has_gauss}|{cached}".encode())
+    return digest.hexdigest()[:16]
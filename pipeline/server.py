@@ -0,0 +1,341 @@
+"""
+Render Server
+A long-lived local render daemon that keeps manim and the caches warm.
+
+    python -m pipeline.server serve                       # start it (127.0.0.1:8765)
+    python -m pipeline.server render 4_Formula/formula.py:FormulaAnimation -q l
+    python -m pipeline.orchestrator --server http://127.0.0.1:8765 -q l
+
+The server imports manim, reads manim.cfg and discovers fonts once. Jobs
+("render module.py:Scene with these options") are queued and rendered one
+at a time by a single render thread, because manim's config is global.
+Every job re-imports its scene module from disk, so edits to a scene are
+picked up without a restart; the Text outline, Tex and template caches stay
+in memory across jobs. Changes to pipeline/ itself need a restart.
+
+Only the project's own scenes are rendered: the target must be a scene
+found by discovery, env may only set PIPELINE_* switches, media_dir must be
+inside the project and options are limited to SAFE_OPTIONS. Requests must
+be sent as application/json and without an Origin header, so a web page
+cannot post jobs from a browser.
+
+HTTP API (JSON in, newline-delimited JSON out):
+
+    POST /render   {"target": "...py:Scene", "quality": "l", "media_dir": "...",
+                    "env": {"PIPELINE_ENCODER": "stream"}, "options": {...}}
+                   -> streams {"event": "queued" | "started" | "play" | "done" | "failed", ...}
+    GET  /status   -> queue length, jobs rendered, cache statistics
+"""
+
+import argparse
+import itertools
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pipeline.discovery import discover_scenes
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT, inside_root
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+FINAL_EVENTS = ("done", "failed")
+
+# manim config values a request may set; none of them name a file or a directory
+SAFE_OPTIONS = {
+    "disable_caching", "renderer", "frame_rate", "pixel_width", "pixel_height",
+    "background_color", "background_opacity", "transparent", "save_last_frame",
+    "from_animation_number", "upto_animation_number", "write_all", "save_sections",
+}
+
+
+def validate_request(request):
+    """
+    The job a /render request describes, restricted to the project's scenes.
+    Raises ValueError for anything else.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    target = request.get("target")
+    if not isinstance(target, str) or ":" not in target:
+        raise ValueError("target must be module.py:SceneName")
+    module, _, name = target.rpartition(":")
+    module = Path(module)
+    if not module.is_absolute():
+        module = PROJECT_ROOT / module
+    module = module.resolve()
+    matches = [s for s in discover_scenes() if (PROJECT_ROOT / s.module).resolve() == module and s.name == name]
+    if not matches:
+        raise ValueError(f"{target} is not a scene of this project")
+
+    env = request.get("env") or {}
+    if not isinstance(env, dict) or not all(isinstance(v, str) for v in env.values()):
+        raise ValueError("env must map names to strings")
+    refused = sorted(k for k in env if not k.startswith("PIPELINE_"))
+    if refused:
+        raise ValueError(f"only PIPELINE_* variables may be set, not {', '.join(refused)}")
+
+    media_dir = Path(request.get("media_dir") or MEDIA_DIR).resolve()
+    if not inside_root(media_dir):
+        raise ValueError(f"media_dir must be inside {PROJECT_ROOT}")
+
+    options = request.get("options") or {}
+    if not isinstance(options, dict):
+        raise ValueError("options must be an object")
+    refused = sorted(set(options) - SAFE_OPTIONS)
+    if refused:
+        raise ValueError(f"options not accepted: {', '.join(refused)}")
+
+    quality = request.get("quality", "h")
+    if quality not in ("l", "m", "h", "p", "k"):
+        raise ValueError(f"unknown quality {quality!r}")
+    return {
+        "target": matches[0].target,
+        "quality": quality,
+        "media_dir": str(media_dir),
+        "env": env,
+        "options": options,
+    }
+
+
+class RenderQueue:
+    """Jobs waiting for the render thread, each with its own event queue."""
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.ids = itertools.count(1)
+        self.current = None
+        self.rendered = 0
+        self.failed = 0
+
+    def submit(self, request):
+        job = {"id": next(self.ids), "request": request, "events": queue.Queue()}
+        job["events"].put({"event": "queued", "job": job["id"], "position": self.jobs.qsize() + (self.current is not None)})
+        self.jobs.put(job)
+        return job
+
+    def run_forever(self):
+        """Render jobs in arrival order; called on the render thread."""
+        from pipeline.warm import warm_up
+
+        try:
+            warm_up()
+            broken = None
+        except Exception:
+            broken = traceback.format_exc()
+        while True:
+            job = self.jobs.get()
+            if broken:
+                # Nothing can render here; fail every job instead of leaving it queued
+                self.failed += 1
+                job["events"].put({"event": "failed", "job": job["id"], "target": job["request"]["target"], "error": broken})
+                continue
+            self.current = job
+            try:
+                self._render(job)
+            finally:
+                self.current = None
+
+    def _render(self, job):
+        from pipeline.warm import load_module, render_scene
+
+        events, request = job["events"], job["request"]
+        target = request["target"]
+        events.put({"event": "started", "job": job["id"], "target": target})
+        module_path, _, scene_name = target.rpartition(":")
+        saved = {k: os.environ.get(k) for k in request["env"]}
+        try:
+            os.environ.update(request["env"])
+            # A fresh import per job, so the scene's latest source is rendered
+            scene_class = getattr(load_module(module_path), scene_name)
+            output, wall = render_scene(
+                scene_class, module_path,
+                quality=request["quality"],
+                media_dir=request["media_dir"],
+                options=request["options"],
+                progress=events.put,
+            )
+        except Exception:
+            self.failed += 1
+            events.put({"event": "failed", "job": job["id"], "target": target, "error": traceback.format_exc()})
+        else:
+            self.rendered += 1
+            events.put({"event": "done", "job": job["id"], "target": target, "output": str(output), "wall_seconds": round(wall, 2)})
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    def status(self):
+        from pipeline.tex_cache import TEX_CACHE
+
+        # Only loaded (and only meaningful) once a scene has used it
+        text_cache = sys.modules.get("pipeline.text_cache")
+        return {
+            "queued": self.jobs.qsize(),
+            "current": self.current["request"]["target"] if self.current else None,
+            "rendered": self.rendered,
+            "failed": self.failed,
+            "text_cache": dict(text_cache.TEXT_CACHE.stats) if text_cache else {},
+            "tex_cache": TEX_CACHE.stats(),
+        }
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    # HTTP/1.0: the response body ends when the connection closes, so
+    # progress lines can be streamed without a Content-Length
+    protocol_version = "HTTP/1.0"
+
+    def do_GET(self):
+        if self.path != "/status":
+            self.send_error(404)
+            return
+        self._send_json(self.server.render_queue.status())
+
+    def do_POST(self):
+        if self.path != "/render":
+            self.send_error(404)
+            return
+        # Browsers send an Origin, and need a CORS preflight we never answer for JSON
+        if self.headers.get("Origin") is not None:
+            self.send_error(403, "cross-origin requests are not accepted")
+            return
+        if self.headers.get_content_type() != "application/json":
+            self.send_error(415, "send the job as application/json")
+            return
+        try:
+            request = validate_request(json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0)))))
+        except (ValueError, TypeError) as exc:
+            self.send_error(400, str(exc))
+            return
+
+        job = self.server.render_queue.submit(request)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        while True:
+            event = job["events"].get()
+            try:
+                self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return  # client went away; the job still finishes
+            if event["event"] in FINAL_EVENTS:
+                return
+
+    def _send_json(self, payload):
+        body = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # progress goes to the client, not stderr
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    render_queue = RenderQueue()
+    renderer = threading.Thread(target=render_queue.run_forever, name="render", daemon=True)
+    renderer.start()
+
+    httpd = ThreadingHTTPServer((host, port), RenderHandler)
+    httpd.daemon_threads = True
+    httpd.render_queue = render_queue
+    print(f"🔥 Render server listening on http://{host}:{port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+    return 0
+
+
+# Client side
+
+def submit(target, quality="h", media_dir=MEDIA_DIR, env=None, options=None, url=DEFAULT_URL, on_event=None):
+    """Send one job to a running server and return its final event."""
+    body = json.dumps({
+        "target": target,
+        "quality": quality,
+        "media_dir": str(Path(media_dir).resolve()),
+        "env": env or {},
+        "options": options or {},
+    }).encode("utf-8")
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/render", data=body, headers={"Content-Type": "application/json"},
+    )
+    event = {"event": "failed", "target": target, "error": "server closed the connection"}
+    with urllib.request.urlopen(request) as response:
+        for line in response:
+            event = json.loads(line)
+            if on_event:
+                on_event(event)
+    return event
+
+
+def server_status(url=DEFAULT_URL):
+    with urllib.request.urlopen(f"{url.rstrip('/')}/status", timeout=5) as response:
+        return json.load(response)
+
+
+def _print_event(event):
+    if event["event"] == "queued":
+        print(f"⏳ Queued (position {event['position']})")
+    elif event["event"] == "started":
+        print(f"🎬 Rendering {event['target']}")
+    elif event["event"] == "play":
+        print(f"   play {event['play']:>4}  t={event['time']:.2f}s", end="\r", flush=True)
+    elif event["event"] == "done":
+        print(f"\n✅ {event['output']} ({event['wall_seconds']:.1f}s)")
+    else:
+        print(f"\n❌ {event['target']}\n{event['error']}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Warm local render server.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Start the server")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    render_parser = commands.add_parser("render", help="Render module.py:Scene on a running server")
+    render_parser.add_argument("target")
+    render_parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"], default="h")
+    render_parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    render_parser.add_argument("--url", default=DEFAULT_URL)
+
+    status_parser = commands.add_parser("status", help="Show the server's queue and cache statistics")
+    status_parser.add_argument("--url", default=DEFAULT_URL)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "serve":
+        return serve(args.host, args.port)
+    if args.command == "status":
+        print(json.dumps(server_status(args.url), indent=2))
+        return 0
+
+    start = time.perf_counter()
+    final = submit(args.target, args.quality, args.media_dir, url=args.url, on_event=_print_event)
+    print(f"⏱️  {time.perf_counter() - start:.1f}s including queue time")
+    return 0 if final["event"] == "done" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Pipeline Settings
+PIPELINE_* environment switches shared by the orchestrator and the scenes.
+
+The orchestrator passes them to each manim process through the environment,
+and they are part of the scene cache key (see RenderJob.pipeline_env).
+"""
+
+import os
+
+# Output encoder: unset/"partial" keeps manim's file per play()
+ENCODER_ENV = "PIPELINE_ENCODER"
+STREAM_MODE = "stream"
+
+
+def stream_mode_enabled():
+    return os.environ.get(ENCODER_ENV, "").lower() == STREAM_MODE
+
+
+# Output with an alpha channel for compositing overlays in Resolve:
+#   prores  ProRes 4444 (.mov)   qtrle  QuickTime Animation (.mov)
+#   png     one RGBA PNG per frame
+OUTPUT_ENV = "PIPELINE_OUTPUT"
+ALPHA_OUTPUTS = ("prores", "qtrle", "png")
+
+
+def alpha_output():
+    """The requested alpha output format, or None for manim's usual video."""
+    value = os.environ.get(OUTPUT_ENV, "").lower()
+    return value if value in ALPHA_OUTPUTS else None
+
+
+# Disk budget of the shared Tex cache (.cache/tex), in MB
+TEX_CACHE_MB_ENV = "PIPELINE_TEX_CACHE_MB"
+
+# Disk budget of the shared Text outline cache (.cache/text), in MB
+TEXT_CACHE_MB_ENV = "PIPELINE_TEXT_CACHE_MB"
+
+
+# Per-play render profile (see pipeline/profiler.py)
+PROFILE_ENV = "PIPELINE_PROFILE"
+
+
+def profile_enabled():
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+# Extra outputs from the same render, as manim quality flags ("l" or "l,m"):
+# frames are scaled down and thinned to each tier's resolution and frame rate
+TIERS_ENV = "PIPELINE_TIERS"
+
+
+def output_tiers():
+    value = os.environ.get(TIERS_ENV, "").lower()
+    return [flag.strip() for flag in value.split(",") if flag.strip()]
+
+
+# Worker processes drawing the frames of one long play() (see pipeline/frame_parallel.py)
+FRAME_WORKERS_ENV = "PIPELINE_FRAME_WORKERS"
+
+
+def frame_workers():
+    try:
+        return max(1, int(os.environ.get(FRAME_WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+# Static mobjects above the moving ones cached as layers (see pipeline/layers.py); "0" turns it off
+LAYERS_ENV = "PIPELINE_LAYERS"
+
+
+def layers_enabled():
+    return os.environ.get(LAYERS_ENV, "1").lower() not in ("0", "false", "no")
+
+
+# Only ProjectScene reads these; plain manim Scenes render as if they were unset
+PROJECT_SCENE_ENVS = (ENCODER_ENV, OUTPUT_ENV, PROFILE_ENV, TIERS_ENV, FRAME_WORKERS_ENV, LAYERS_ENV)
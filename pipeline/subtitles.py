@@ -0,0 +1,175 @@
+"""
+Subtitles
+Read the video's SRT and look up cues by time.
+
+iter_srt() is a generator that reads one cue at a time, so memory stays flat
+however long the transcript is. CueIndex sorts the cues once and answers
+"which cues overlap [start, end)?" with two binary searches:
+
+    cues = load_cues("3_Simulation/input/source_subtitle.srt")
+    start, end = scene_range(GitCloneAnimation.__doc__)  # (48.0, 232.0)
+    cues.overlapping(start, end)             # every cue of Scene 4
+    cue = cues.find("going to clone", start, end)
+    cue.duration                             # seconds, for run_time/wait
+
+The project's SRT, EDL and chapter markers use a timeline that starts at
+01:00:00 (DaVinci's default); times are shifted by TIMELINE_START so they
+read like the "(00:00:48 - 00:03:52)" ranges in the scene docstrings.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from pipeline.paths import PROJECT_ROOT
+
+TIMELINE_START = 3600.0
+
+TIMESTAMP = re.compile(r"(\d+):(\d{2}):(\d{2})(?:[,.](\d{1,3}))?")
+ARROW = "-->"
+
+# "(00:00:48 - 00:03:52)" in a scene docstring
+SCENE_RANGE = re.compile(r"\((\d+:\d{2}:\d{2}(?:[,.]\d+)?)\s*-\s*(\d+:\d{2}:\d{2}(?:[,.]\d+)?)\)")
+
+
+def parse_timestamp(value):
+    """'01:00:03,250' -> 3603.25 (seconds)."""
+    match = TIMESTAMP.search(value)
+    if not match:
+        raise ValueError(f"Not an SRT timestamp: {value!r}")
+    hours, minutes, seconds, millis = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int((millis or "0").ljust(3, "0")) / 1000
+
+
+def format_timestamp(seconds, separator=","):
+    """3603.25 -> '01:00:03,250'."""
+    millis = round(seconds * 1000)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def scene_range(docstring):
+    """(start, end) seconds from a "Scene N: Title (00:00:48 - 00:03:52)" docstring."""
+    match = SCENE_RANGE.search(docstring or "")
+    if not match:
+        raise ValueError("Docstring has no (HH:MM:SS - HH:MM:SS) range")
+    return parse_timestamp(match.group(1)), parse_timestamp(match.group(2))
+
+
+@dataclass(frozen=True)
+class Cue:
+    """One subtitle cue, times in seconds."""
+
+    index: int
+    start: float
+    end: float
+    text: str
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+def iter_srt(source, offset=0.0):
+    """
+    Yield Cues from an SRT path or any iterable of lines, one block at a time.
+    `offset` is subtracted from every time (e.g. TIMELINE_START).
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, encoding="utf-8-sig") as lines:
+            yield from iter_srt(lines, offset)
+        return
+
+    def cue(index, times, text):
+        # SRT times are whole milliseconds; round away the float noise of the offset
+        return Cue(index, round(times[0] - offset, 3), round(times[1] - offset, 3), "\n".join(text))
+
+    index, times, text = None, None, []
+    for raw in source:
+        line = raw.strip("\r\n").strip()
+        if not line:
+            if times is not None:
+                yield cue(index, times, text)
+            index, times, text = None, None, []
+        elif times is None and ARROW in line:
+            start, _, end = line.partition(ARROW)
+            times = (parse_timestamp(start), parse_timestamp(end))
+        elif times is None and line.isdigit():
+            index = int(line)
+        elif times is not None:
+            text.append(line)
+    if times is not None:
+        # No blank line after the last cue
+        yield cue(index, times, text)
+
+
+class CueIndex:
+    """Cues sorted by start time, with O(log n) range lookups."""
+
+    def __init__(self, cues):
+        self.cues = sorted(cues, key=lambda c: (c.start, c.end))
+        self.starts = [c.start for c in self.cues]
+        # Running maximum of end times: non-decreasing, so it can be bisected
+        # even when cues overlap
+        self.max_ends = []
+        latest = float("-inf")
+        for cue in self.cues:
+            latest = max(latest, cue.end)
+            self.max_ends.append(latest)
+
+    def __len__(self):
+        return len(self.cues)
+
+    def __iter__(self):
+        return iter(self.cues)
+
+    def overlapping(self, start, end):
+        """Cues that are on screen at any point in [start, end)."""
+        lo = bisect_right(self.max_ends, start)
+        hi = bisect_left(self.starts, end)
+        return [c for c in self.cues[lo:hi] if c.end > start]
+
+    def at(self, time):
+        """Cues on screen at one instant."""
+        lo = bisect_right(self.max_ends, time)
+        hi = bisect_right(self.starts, time)
+        return [c for c in self.cues[lo:hi] if c.end > time]
+
+    def within(self, start, end):
+        """Cues that start and end inside [start, end]."""
+        return [c for c in self.overlapping(start, end) if c.start >= start and c.end <= end]
+
+    def find(self, phrase, start=float("-inf"), end=float("inf")):
+        """First cue in a range whose text contains a phrase (case-insensitive)."""
+        phrase = phrase.lower()
+        for cue in self.cues[bisect_left(self.starts, start):bisect_left(self.starts, end)]:
+            if phrase in cue.text.lower():
+                return cue
+        raise LookupError(f"No cue contains {phrase!r}")
+
+    def span(self, start, end):
+        """(first start, last end) of the cues overlapping a range, or None."""
+        cues = self.overlapping(start, end)
+        if not cues:
+            return None
+        return cues[0].start, max(c.end for c in cues)
+
+    def gap_after(self, cue):
+        """Silence between a cue and the next one to start."""
+        i = bisect_right(self.starts, cue.start)
+        if i >= len(self.cues):
+            return 0.0
+        return max(0.0, self.cues[i].start - cue.end)
+
+
+@lru_cache(maxsize=None)
+def load_cues(path, offset=TIMELINE_START):
+    """CueIndex for an SRT file (paths are relative to the project root)."""
+    path = Path(path)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    return CueIndex(iter_srt(path, offset))
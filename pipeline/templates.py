@@ -0,0 +1,208 @@
+"""
+Scene Templates
+Card and stat layouts built from YAML/JSON rows, cached on disk.
+
+LLMFeatureCardsAnimation and NumberCounterAnimation used to hardcode their
+rows and rebuild every box and label on each render. Here the rows come
+from a data file, the grid layout is computed once, and the finished
+mobject tree is pickled to .cache/templates/. A later render with the same
+rows (and the same template code) loads the tree instead of rebuilding it:
+
+    data = load_rows("3_Simulation/input/llm_cards.yaml")
+    cards = card_grid(data["cards"])    # VGroup, one VGroup per card
+    for card in cards:
+        self.play(FadeIn(card, shift=UP * 0.5))
+
+Weekly variants with 20-50 cards just point at another data file. Up to
+four cells keep the hand-tuned layouts; larger grids take the column count
+that shows their cells largest in the grid area (which has the frame's
+aspect ratio), centered and scaled to fit.
+"""
+
+import hashlib
+import json
+import math
+import os
+import pickle
+from pathlib import Path
+
+import manim
+from manim import (
+    BOLD, DOWN, GRAY, LEFT, RIGHT, UP, WHITE,
+    Circle, Integer, ManimColor, RoundedRectangle, VGroup,
+)
+
+from pipeline.paths import PROJECT_ROOT
+from pipeline.scene_cache import manim_version
+from pipeline.text_cache import cached_text
+
+TEMPLATE_CACHE_DIR = PROJECT_ROOT / ".cache" / "templates"
+
+# Area the grids may use between the title and the footer
+MAX_GRID_WIDTH = 13.0
+MAX_GRID_HEIGHT = 5.6
+
+
+def load_rows(path):
+    """
+    Read a template data file (.yaml/.yml or .json, relative to the project root).
+    Rows given inline (a dict, e.g. from a variant spec) are returned as-is.
+    """
+    if isinstance(path, dict):
+        return path
+    path = Path(path)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".json":
+            return json.load(f)
+        import yaml
+        return yaml.safe_load(f)
+
+
+def color(value):
+    """A manim color name ("ORANGE") or hex code ("#FF8800")."""
+    if isinstance(value, str):
+        # Only color constants: "left" must not resolve to manim.LEFT
+        named = getattr(manim, value.upper(), None)
+        if isinstance(named, ManimColor):
+            return named
+    return ManimColor(value)
+
+
+def grid_positions(count, columns, dx, dy, origin):
+    """Cell positions row by row, starting at `origin` (the first cell)."""
+    return [origin + RIGHT * (i % columns) * dx + DOWN * (i // columns) * dy for i in range(count)]
+
+
+def grid_columns(count, dx, dy, cell_width, cell_height):
+    """The column count that shows `count` cells largest within the grid area."""
+    def scale(columns):
+        rows = math.ceil(count / columns)
+        width = (columns - 1) * dx + cell_width
+        height = (rows - 1) * dy + cell_height
+        return min(1.0, MAX_GRID_WIDTH / width, MAX_GRID_HEIGHT / height)
+
+    # Ties go to the fuller last row, then to fewer columns
+    return max(range(1, count + 1), key=lambda c: (round(scale(c), 6), -(-count % c), -c))
+
+
+def centered_origin(count, columns, dx, dy):
+    """First cell position of a grid centered in the grid area."""
+    rows = math.ceil(count / columns)
+    return LEFT * (columns - 1) * dx / 2 + UP * (rows - 1) * dy / 2 + DOWN * 0.2
+
+
+def _fit(group):
+    # Grids that fit keep their hand-tuned positions; larger ones are shrunk and centered
+    scale = min(MAX_GRID_WIDTH / group.width, MAX_GRID_HEIGHT / group.height)
+    if scale < 1:
+        group.scale(scale).move_to(DOWN * 0.2)
+    return group
+
+
+def _template_key(kind, rows):
+    digest = hashlib.sha256()
+    digest.update(f"{kind}|{manim_version()}\n".encode())
+    # Changing this module's code invalidates every cached tree
+    digest.update(Path(__file__).read_bytes())
+    digest.update(json.dumps(rows, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def cached_tree(kind, rows, build, directory=TEMPLATE_CACHE_DIR):
+    """Load the mobject tree for (kind, rows) from disk, or build and store it."""
+    path = Path(directory) / f"{kind}_{_template_key(kind, rows)}.pkl"
+    if path.exists():
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass  # stale or truncated entry; rebuild it below
+
+    tree = build(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        tmp.unlink(missing_ok=True)
+    return tree
+
+
+# LLM feature cards
+
+def _build_card(row, position):
+    tint = color(row["color"])
+    card = RoundedRectangle(height=3.5, width=3, corner_radius=0.3, color=tint, fill_opacity=0.2, stroke_width=4)
+    card.shift(position)
+
+    name = cached_text(row["name"], font_size=32, color=tint, weight=BOLD)
+    name.move_to(card.get_top() + DOWN * 0.5)
+
+    tagline = cached_text(row["tagline"], font_size=18, color=WHITE)
+    tagline.move_to(card.get_center() + UP * 0.5)
+
+    features = VGroup()
+    for j, feature in enumerate(row.get("features", [])):
+        feature_text = cached_text(f"• {feature}", font_size=16, color=GRAY)
+        feature_text.move_to(card.get_center() + DOWN * (0.2 + j * 0.4))
+        features.add(feature_text)
+
+    # Logo placeholder (circle with initial)
+    logo = Circle(radius=0.4, color=tint, fill_opacity=0.5)
+    logo.move_to(card.get_center() + UP * 1.2)
+    logo_text = cached_text(row.get("initial", row["name"][0]), font_size=36, color=WHITE)
+    logo_text.move_to(logo.get_center())
+
+    return VGroup(card, logo, logo_text, name, tagline, features)
+
+
+def _build_cards(rows):
+    dx, dy = 3.3, 3.8
+    if len(rows) <= 4:
+        columns, origin = 4, LEFT * 4.5
+    else:
+        columns = grid_columns(len(rows), dx, dy, cell_width=3, cell_height=3.5)
+        origin = centered_origin(len(rows), columns, dx, dy)
+    positions = grid_positions(len(rows), columns=columns, dx=dx, dy=dy, origin=origin)
+    return _fit(VGroup(*[_build_card(row, pos) for row, pos in zip(rows, positions)]))
+
+
+def card_grid(rows):
+    """One VGroup(card, logo, logo_text, name, tagline, features) per row, in one row for up to four."""
+    return cached_tree("cards", rows, _build_cards)
+
+
+# Stat counters
+
+def _build_stat(row, position):
+    tint = color(row["color"])
+    box = RoundedRectangle(height=1.5, width=3, corner_radius=0.2, color=tint, fill_opacity=0.2, stroke_width=3)
+    box.shift(position)
+
+    # Starts at 0; the scene counts it up to row["value"]
+    number = Integer(0, font_size=48, color=tint)
+    number.move_to(box.get_center() + UP * 0.3)
+
+    label = cached_text(row["label"], font_size=22, color=WHITE)
+    label.move_to(box.get_center() + DOWN * 0.4)
+    return VGroup(box, number, label)
+
+
+def _build_stats(rows):
+    dx, dy = 4.5, 2.5
+    if len(rows) <= 4:
+        columns, origin = 2, LEFT * 2 + UP * 1.5
+    else:
+        columns = grid_columns(len(rows), dx, dy, cell_width=3, cell_height=1.5)
+        origin = centered_origin(len(rows), columns, dx, dy)
+    positions = grid_positions(len(rows), columns=columns, dx=dx, dy=dy, origin=origin)
+    return _fit(VGroup(*[_build_stat(row, pos) for row, pos in zip(rows, positions)]))
+
+
+def stat_grid(rows):
+    """One VGroup(box, number, label) per row, in a 2x2 grid for four stats."""
+    return cached_tree("stats", rows, _build_stats)
@@ -0,0 +1,189 @@
+"""
+Tex Batch Precompiler
+Compile every literal MathTex/Tex string of a module in one LaTeX run.
+
+On a cold cache each MathTex launches its own latex + dvisvgm pair (plus
+one more per substring of a multi-part MathTex). This prepass reads the
+module's source, collects the literal strings statically, puts them on one
+page each of a single document, runs latex and dvisvgm once, and files the
+pages as entries of the shared Tex cache (pipeline/tex_cache.py). The scenes
+then find every formula already compiled.
+
+    python -m pipeline.tex_batch 4_Formula/formula.py
+
+The orchestrator runs it for the modules it is about to render. Strings
+built at runtime (f-strings, Axes numbers) are not seen here and still
+compile on first use.
+"""
+
+import argparse
+import ast
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from pipeline.tex_cache import TEX_CACHE, tex_code, tex_key
+
+# Class name -> (default environment, default arg separator)
+TEX_CLASSES = {
+    "MathTex": ("align*", " "),
+    "Tex": ("center", ""),
+    "SingleStringMathTex": ("align*", ""),
+}
+
+# Keywords that make manim split the strings differently at runtime
+SPLITTING_KEYWORDS = {"substrings_to_isolate", "tex_to_color_map", "isolate"}
+
+PAGE_BREAK = "\n\\newpage\n"
+
+
+def _constant(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _call_name(call):
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def collect_tex(path):
+    """(expression, environment) pairs for every literal Tex/MathTex call in a module."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or _call_name(node) not in TEX_CLASSES:
+            continue
+        environment, separator = TEX_CLASSES[_call_name(node)]
+        strings = [_constant(arg) for arg in node.args]
+        if not strings or None in strings:
+            continue
+        keywords = {kw.arg: kw.value for kw in node.keywords if kw.arg}
+        environment = _constant(keywords.get("tex_environment")) or environment
+        if "arg_separator" in keywords:
+            separator = _constant(keywords["arg_separator"])
+            if separator is None:
+                continue
+
+        # manim compiles the joined string, then each part to split it up
+        parts = [s for s in strings if s]
+        found.append((separator.join(parts), environment))
+        if not SPLITTING_KEYWORDS & set(keywords) and not any("{{" in s for s in parts):
+            found.extend((s.strip(), environment) for s in parts if s.strip())
+    return list(dict.fromkeys(found))
+
+
+def _modified_expression(expression):
+    """The expression exactly as SingleStringMathTex hands it to the compiler."""
+    from manim import SingleStringMathTex
+
+    probe = object.__new__(SingleStringMathTex)
+    modify = getattr(probe, "_get_modified_expression", None)
+    return modify(expression) if modify else expression.strip()
+
+
+def _split_document(code):
+    head, _, rest = code.partition("\\begin{document}")
+    body, _, _ = rest.partition("\\end{document}")
+    return head, body
+
+
+def precompile(expressions, cache=TEX_CACHE, tex_template=None):
+    """
+    Compile every missing (expression, environment) into the cache in one run.
+    Returns the number of SVGs added; 0 when nothing was missing or batching failed.
+    """
+    from manim import config, logger
+
+    tex_template = tex_template or config["tex_template"]
+    if tex_template.output_format not in (".dvi", ".xdv"):
+        return 0
+
+    pending = {}
+    for expression, environment in expressions:
+        code, _ = tex_code(_modified_expression(expression), environment, tex_template)
+        key = tex_key(code, tex_template)
+        if not cache.svg_path(key).exists():
+            pending[key] = code
+    if not pending:
+        return 0
+
+    # One article document, one page per formula; every formula shares the preamble
+    head, _ = _split_document(next(iter(pending.values())))
+    head = head.replace("\\documentclass[preview]{standalone}", "\\documentclass{article}")
+    pages = [_split_document(code)[1] for code in pending.values()]
+    document = f"{head}\\pagestyle{{empty}}\n\\begin{{document}}\n{PAGE_BREAK.join(pages)}\n\\end{{document}}\n"
+
+    cache.directory.mkdir(parents=True, exist_ok=True)
+    workdir = Path(tempfile.mkdtemp(prefix="batch-", dir=cache.directory))
+    try:
+        tex_file = workdir / "batch.tex"
+        tex_file.write_text(document, encoding="utf-8")
+        latex = subprocess.run(
+            [tex_template.tex_compiler, "-interaction=batchmode", "-halt-on-error",
+             f"-output-directory={workdir}", str(tex_file)],
+            cwd=workdir, capture_output=True,
+        )
+        dvi_file = tex_file.with_suffix(tex_template.output_format)
+        if latex.returncode != 0 or not dvi_file.exists():
+            logger.warning("Tex batch failed; formulas will compile one by one")
+            return 0
+
+        dvisvgm = subprocess.run(
+            ["dvisvgm", str(dvi_file), "--page=1-", "--bbox=min", "--no-fonts",
+             "--verbosity=0", f"--output={workdir / 'page-%p.svg'}"],
+            cwd=workdir, capture_output=True,
+        )
+        if dvisvgm.returncode != 0:
+            logger.warning("dvisvgm batch failed; formulas will compile one by one")
+            return 0
+
+        svgs = sorted(workdir.glob("page-*.svg"), key=lambda p: int(p.stem.rpartition("-")[2]))
+        if len(svgs) != len(pending):
+            # A formula without output would shift every later page onto the wrong key
+            logger.warning("Tex batch page count mismatch; formulas will compile one by one")
+            return 0
+        for page, key in zip(svgs, pending):
+            os.replace(page, cache.svg_path(key))
+        added = len(svgs)
+        cache.misses += added
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    cache.evict()
+    return added
+
+
+def precompile_modules(modules, cache=TEX_CACHE):
+    """Run the prepass over several modules as one batch."""
+    expressions = []
+    for module in modules:
+        expressions.extend(collect_tex(module))
+    if not expressions:
+        return 0
+    added = precompile(list(dict.fromkeys(expressions)), cache)
+    cache.flush_stats()
+    return added
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompile a module's MathTex/Tex strings in one LaTeX run.")
+    parser.add_argument("modules", nargs="+", type=Path)
+    args = parser.parse_args(argv)
+
+    total = sum(len(collect_tex(m)) for m in args.modules)
+    added = precompile_modules(args.modules)
+    print(f"🧮 {total} Tex strings found, {added} compiled in one batch")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
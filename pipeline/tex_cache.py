@@ -0,0 +1,226 @@
+"""
+Shared Tex Cache
+One project-wide store of compiled LaTeX SVGs for every render process.
+
+manim compiles each MathTex/Tex string into <media_dir>/Tex/<hash>.svg, so
+renders into different media dirs compile the same formulas again and the
+directories grow forever. With the cache installed (ProjectScene does this),
+manim's tex_to_svg_file is served from .cache/tex/ instead:
+
+- compiles happen in a private temp dir and are published with an atomic
+  rename, under a per-entry lock so concurrent renders compile a string once;
+- hits and misses are counted per process and added to .cache/tex/stats.json;
+- after a compile, the least recently used SVGs are evicted until the cache
+  fits PIPELINE_TEX_CACHE_MB (default 256); SVGs used in the last minute
+  are kept.
+
+    python -m pipeline.tex_cache           # statistics
+    python -m pipeline.tex_cache --gc 64   # evict down to 64 MB
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pipeline.locks import file_lock
+from pipeline.paths import PROJECT_ROOT
+from pipeline.settings import TEX_CACHE_MB_ENV
+
+TEX_CACHE_DIR = PROJECT_ROOT / ".cache" / "tex"
+DEFAULT_BUDGET_MB = 256
+# SVGs used this recently are never evicted: a render may be about to read them
+MIN_EVICT_AGE = 60
+STATS_NAME = "stats.json"
+
+
+def budget_bytes():
+    return int(float(os.environ.get(TEX_CACHE_MB_ENV) or DEFAULT_BUDGET_MB) * 1024 * 1024)
+
+
+def tex_code(expression, environment=None, tex_template=None):
+    """The full .tex document manim would compile for an expression."""
+    from manim import config
+
+    tex_template = tex_template or config["tex_template"]
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment), tex_template
+    return tex_template.get_texcode_for_expression(expression), tex_template
+
+
+def tex_key(code, tex_template):
+    material = f"{tex_template.tex_compiler}|{tex_template.output_format}|{code}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+class TexCache:
+    """Locked, size-bounded directory of compiled SVGs."""
+
+    def __init__(self, directory=TEX_CACHE_DIR, budget=None):
+        self.directory = Path(directory)
+        self.budget = budget
+        self.hits = 0
+        self.misses = 0
+
+    def svg_path(self, key):
+        return self.directory / f"{key}.svg"
+
+    def svg_for(self, expression, environment=None, tex_template=None):
+        """Path of the compiled SVG for an expression, compiling it on a miss."""
+        code, tex_template = tex_code(expression, environment, tex_template)
+        key = tex_key(code, tex_template)
+        svg = self.svg_path(key)
+        if self._touch(svg):
+            self.hits += 1
+            return svg
+
+        with file_lock(self.directory / "locks" / f"{key}.lock"):
+            if self._touch(svg):
+                # Another process compiled it while we waited
+                self.hits += 1
+                return svg
+            self._compile(code, tex_template, svg)
+            self.misses += 1
+        self.evict()
+        return svg
+
+    def _touch(self, svg):
+        """Mark the SVG as just used; False if it is not (or no longer) there."""
+        try:
+            # mtime doubles as the last-use time; evict() spares recent ones,
+            # so the SVG stays while manim reads it
+            os.utime(svg)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _compile(self, code, tex_template, svg):
+        from manim.utils.tex_file_writing import (
+            convert_to_svg,
+            make_tex_compilation_command,
+            print_all_tex_errors,
+        )
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        workdir = Path(tempfile.mkdtemp(prefix="tex-", dir=self.directory))
+        try:
+            tex_file = workdir / f"{svg.stem}.tex"
+            tex_file.write_text(code, encoding="utf-8")
+            # Not compile_tex: it writes to config.tex_dir, not next to the .tex
+            compiler, output_format = tex_template.tex_compiler, tex_template.output_format
+            command = make_tex_compilation_command(compiler, output_format, tex_file, workdir)
+            latex = subprocess.run(command, stdout=subprocess.DEVNULL)
+            dvi_file = tex_file.with_suffix(output_format)
+            if latex.returncode != 0 or not dvi_file.exists():
+                log_file = tex_file.with_suffix(".log")
+                print_all_tex_errors(log_file, compiler, tex_file)
+                raise ValueError(f"{compiler} error converting to {output_format[1:]}: {log_file}")
+            compiled = convert_to_svg(dvi_file, output_format)
+            os.replace(compiled, svg)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def entries(self):
+        """(mtime, size, path) of every stored SVG, oldest first."""
+        if not self.directory.exists():
+            return []
+        found = []
+        for path in self.directory.glob("*.svg"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, path))
+        return sorted(found)
+
+    def evict(self, budget=None):
+        """Delete least recently used SVGs until the cache fits the budget. Returns bytes freed."""
+        budget = budget if budget is not None else (self.budget or budget_bytes())
+        freed = 0
+        with file_lock(self.directory / "locks" / "gc.lock"):
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= budget:
+                    break
+                try:
+                    # Checked again now: a reader may have used it since the listing
+                    if time.time() - path.stat().st_mtime < MIN_EVICT_AGE:
+                        continue
+                except FileNotFoundError:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+                freed += size
+        return freed
+
+    def flush_stats(self):
+        """Add this process's hit/miss counts to the shared statistics file."""
+        if not (self.hits or self.misses):
+            return
+        path = self.directory / STATS_NAME
+        with file_lock(self.directory / "locks" / "stats.lock"):
+            stats = self.stats()
+            stats["hits"] += self.hits
+            stats["misses"] += self.misses
+            stats["updated"] = time.time()
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+            os.replace(tmp, path)
+        self.hits = self.misses = 0
+
+    def stats(self):
+        path = self.directory / STATS_NAME
+        if path.exists():
+            stats = json.loads(path.read_text(encoding="utf-8"))
+        else:
+            stats = {"hits": 0, "misses": 0}
+        entries = self.entries()
+        stats["entries"] = len(entries)
+        stats["size_mb"] = round(sum(size for _, size, _ in entries) / (1024 * 1024), 2)
+        return stats
+
+
+TEX_CACHE = TexCache()
+
+
+def install(cache=TEX_CACHE):
+    """Route manim's MathTex/Tex compilation through the shared cache."""
+    from manim.mobject.text import tex_mobject
+
+    if getattr(tex_mobject.tex_to_svg_file, "shared_cache", None) is cache:
+        return
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        return cache.svg_for(expression, environment, tex_template)
+
+    tex_to_svg_file.shared_cache = cache
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+    atexit.register(cache.flush_stats)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or trim the shared Tex cache.")
+    parser.add_argument("--gc", type=float, metavar="MB", help="Evict least recently used SVGs down to MB")
+    args = parser.parse_args(argv)
+
+    if args.gc is not None:
+        freed = TEX_CACHE.evict(int(args.gc * 1024 * 1024))
+        print(f"🧹 Freed {freed / (1024 * 1024):.1f} MB")
+    stats = TEX_CACHE.stats()
+    lookups = stats["hits"] + stats["misses"]
+    rate = 100 * stats["hits"] / lookups if lookups else 0
+    print(f"🧮 Tex cache: {stats['entries']} SVGs, {stats['size_mb']} MB")
+    print(f"   Hits: {stats['hits']}  Misses: {stats['misses']}  Hit rate: {rate:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Text Outline Cache
+Build each distinct Text once per project instead of once per call.
+
+Every Text() runs Pango (or at least re-parses manim's cached SVG) even when
+the same string at the same size was built a moment ago, e.g. the "✓" at
+font_size=32 inside the CICD loop. cached_text() keeps the glyph outlines:
+
+- in memory, in an LRU keyed on (text, font, size, weight, slant, spacing),
+- on disk in .cache/text/<key>.npz, shared by every scene and process; after
+  a render the least recently used files are evicted until the directory
+  fits PIPELINE_TEXT_CACHE_MB (default 64).
+
+Color is not part of the key; it is applied to a fresh copy on every call:
+
+    check = cached_text("✓", font_size=32, color=GREEN)
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, NORMAL, WHITE, Text, VGroup, VMobject
+
+from pipeline.locks import file_lock
+from pipeline.paths import PROJECT_ROOT
+from pipeline.scene_cache import manim_version
+from pipeline.settings import TEXT_CACHE_MB_ENV
+
+TEXT_CACHE_DIR = PROJECT_ROOT / ".cache" / "text"
+DEFAULT_BUDGET_MB = 64
+# Files used this recently are never evicted
+MIN_EVICT_AGE = 60
+
+# Distinct strings kept in memory per process
+MEMORY_ITEMS = 512
+
+# Bump to invalidate every stored outline
+KEY_VERSION = "1"
+
+# Looked up once: text_key runs on every cached_text call
+MANIM_VERSION = manim_version()
+
+
+def budget_bytes():
+    return int(float(os.environ.get(TEXT_CACHE_MB_ENV) or DEFAULT_BUDGET_MB) * 1024 * 1024)
+
+
+def text_key(text, font="", font_size=DEFAULT_FONT_SIZE, weight=NORMAL, slant=NORMAL, line_spacing=-1):
+    """Content key for a Text's outlines (color-independent)."""
+    material = json.dumps(
+        [KEY_VERSION, MANIM_VERSION, text, font, float(font_size), str(weight), str(slant), float(line_spacing)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+class CachedText(VGroup):
+    """A Text rebuilt from cached glyph outlines: one filled VMobject per glyph."""
+
+    def __init__(self, outlines, text="", color=WHITE, fill_opacity=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.text = text
+        for points in outlines:
+            glyph = VMobject(fill_color=color, fill_opacity=fill_opacity, stroke_width=0)
+            glyph.points = points.copy()
+            self.add(glyph)
+
+
+class TextOutlineCache:
+    """Memory LRU in front of a directory of .npz glyph outlines."""
+
+    def __init__(self, directory=TEXT_CACHE_DIR, max_items=MEMORY_ITEMS, budget=None):
+        self.directory = directory
+        self.max_items = max_items
+        self.budget = budget
+        self._memory = OrderedDict()
+        self.stats = {"memory": 0, "disk": 0, "rendered": 0}
+
+    def _path(self, key):
+        return self.directory / f"{key}.npz"
+
+    def _remember(self, key, outlines):
+        self._memory[key] = outlines
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+        return outlines
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            # mtime is the last-use time for eviction
+            os.utime(path)
+            with np.load(path) as data:
+                return tuple(data[f"arr_{i}"] for i in range(len(data.files)))
+        except FileNotFoundError:
+            # Never stored, or evicted meanwhile
+            return None
+
+    def _save(self, key, outlines):
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, *outlines)
+        os.replace(tmp, path)
+
+    def evict(self, budget=None):
+        """Delete least recently used outlines until the cache fits the budget. Returns bytes freed."""
+        budget = budget if budget is not None else (self.budget or budget_bytes())
+        freed = 0
+        with file_lock(self.directory / "gc.lock"):
+            entries = []
+            for path in self.directory.glob("*.npz"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= budget:
+                    break
+                try:
+                    # Checked again now: a reader may have used it since the listing
+                    if time.time() - path.stat().st_mtime < MIN_EVICT_AGE:
+                        continue
+                except FileNotFoundError:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+                freed += size
+        return freed
+
+    def outlines(self, text, **style):
+        """Glyph outline points for a Text, rendering it at most once per project."""
+        key = text_key(text, **style)
+        if key in self._memory:
+            self.stats["memory"] += 1
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        outlines = self._load(key)
+        rendered = False
+        if outlines is None:
+            # One process renders; the others wait and then read its file
+            with file_lock(self.directory / f"{key}.lock"):
+                outlines = self._load(key)
+                if outlines is None:
+                    mobject = Text(text, **style)
+                    outlines = tuple(m.points.copy() for m in mobject.family_members_with_points())
+                    self._save(key, outlines)
+                    self.stats["rendered"] += 1
+                    rendered = True
+            if rendered:
+                self.evict()
+                return self._remember(key, outlines)
+        self.stats["disk"] += 1
+        return self._remember(key, outlines)
+
+
+TEXT_CACHE = TextOutlineCache()
+
+
+def cached_text(text, font_size=DEFAULT_FONT_SIZE, color=WHITE, font="", weight=NORMAL,
+                slant=NORMAL, line_spacing=-1, fill_opacity=1.0, cache=TEXT_CACHE):
+    """Drop-in for the plain Text(...) calls in the scenes, served from the outline cache."""
+    outlines = cache.outlines(
+        text, font=font, font_size=font_size, weight=weight, slant=slant, line_spacing=line_spacing,
+    )
+    return CachedText(outlines, text=text, color=color, fill_opacity=fill_opacity)
@@ -0,0 +1,116 @@
+"""
+Timeline Segments
+Render a run of short play()/wait() calls as one continuous partial movie.
+
+Normally every play() opens its own partial movie file (its own encoder
+session) and the files are concatenated at the end. Inside a timeline
+block the first play opens the stream, later plays keep writing into it,
+and the stream is closed when the block exits:
+
+    with self.timeline():
+        for stage in stages:
+            self.play(FadeIn(stage), run_time=0.5)
+            self.play(Create(arrow), run_time=0.4)
+
+The segment is always re-encoded (per-play partial-movie reuse does not
+apply inside the block); unchanged scenes are skipped by the scene cache.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+_PATCHED = ("is_already_cached", "add_partial_movie_file", "begin_animation", "end_animation")
+
+
+def partial_movie_files(file_writer):
+    """The current section's list of partial movie files."""
+    sections = getattr(file_writer, "sections", None)
+    if sections:
+        return sections[-1].partial_movie_files
+    return file_writer.partial_movie_files
+
+
+def _file_lists(file_writer):
+    # manim concatenates file_writer.partial_movie_files into the movie and
+    # each section's own list into its section video; both name the file
+    lists = [getattr(file_writer, "partial_movie_files", None)]
+    lists += [section.partial_movie_files for section in getattr(file_writer, "sections", None) or []]
+    return [files for files in lists if files is not None]
+
+
+class TimelineSegment:
+    """Context manager that merges the plays inside it into one partial movie."""
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.file_writer = scene.renderer.file_writer
+        self.hashes = []
+        self.path = None
+        self.opened = False
+        self.nested = False
+
+    def __enter__(self):
+        fw = self.file_writer
+        if getattr(fw, "timeline_segment", None) is not None or getattr(fw, "streams_whole_scene", False):
+            # Already inside a timeline (or streaming the whole scene); nothing to merge
+            self.nested = True
+            return self
+
+        self._originals = {name: getattr(fw, name) for name in _PATCHED}
+        fw.is_already_cached = lambda hash_invocation: False
+        fw.add_partial_movie_file = self._add_partial_movie_file
+        fw.begin_animation = self._begin_animation
+        fw.end_animation = self._end_animation
+        fw.timeline_segment = self
+        return self
+
+    def _add_partial_movie_file(self, hash_animation):
+        self.hashes.append(hash_animation)
+        files = partial_movie_files(self.file_writer)
+        before = len(files)
+        if self.path is None and hash_animation is not None:
+            self._originals["add_partial_movie_file"](f"timeline_{hash_animation}")
+            if len(files) > before:
+                self.path = files[-1]
+        else:
+            # Keep one entry per play so manim's indexes stay aligned
+            self._originals["add_partial_movie_file"](None)
+
+    def _begin_animation(self, allow_write=False, file_path=None):
+        if allow_write and self.path is not None and not self.opened:
+            self._originals["begin_animation"](allow_write, file_path=file_path)
+            self.opened = True
+
+    def _end_animation(self, allow_write=False):
+        # The stream stays open until the block exits
+        pass
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.nested:
+            return False
+
+        fw = self.file_writer
+        for name, original in self._originals.items():
+            setattr(fw, name, original)
+        fw.timeline_segment = None
+
+        if self.opened:
+            fw.end_animation(allow_write=True)
+            if exc_type is None:
+                self._rename_by_content()
+        return False
+
+    def _rename_by_content(self):
+        # Name the file after every play in the segment, not just the first
+        digest = hashlib.sha256("|".join(map(str, self.hashes)).encode()).hexdigest()[:24]
+        path = Path(self.path)
+        final = path.with_name(f"timeline_{digest}{path.suffix}")
+        if not path.exists():
+            return
+        os.replace(path, final)
+        for files in _file_lists(self.file_writer):
+            for index, entry in enumerate(files):
+                if entry is not None and str(entry) == str(self.path):
+                    files[index] = str(final)
+        self.path = str(final)
@@ -0,0 +1,165 @@
+"""
+Scene Variants
+Render many parameter sets of one scene class in a few warm processes.
+
+A variant spec names the scene and lists class attributes to override:
+
+    scene: 3_Simulation/video_animations.py:NumberCounterAnimation
+    quality: h
+    variants:
+      - name: q3
+        data: 3_Simulation/input/stats.yaml    # a data file ...
+      - name: q4
+        data:                                  # ... or the rows inline
+          title: "Q4 in Numbers"
+          stats: [{label: "Workflows Built", value: 310, color: BLUE}]
+
+Each variant becomes a subclass `<Scene>_<name>` with those attributes and
+renders to media/videos/<module>/<quality>/<Scene>_<name>.mp4. Workers
+import manim and the scene module once and then render variant after
+variant, so the Text outlines, Tex SVGs and template trees the variants
+share are built once per worker instead of once per variant.
+
+    python -m pipeline.variants 3_Simulation/input/variants.yaml -j 2
+"""
+
+import argparse
+import multiprocessing
+import re
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+
+from pipeline.paths import MEDIA_DIR
+from pipeline.warm import QUALITY_NAMES, load_module, render_scene, warm_up
+
+
+@dataclass
+class VariantResult:
+    """Outcome of one variant render."""
+
+    name: str
+    status: str
+    wall_seconds: float = 0.0
+    output: str = ""
+    error: str = ""
+
+
+def load_spec(path):
+    """Read a variant spec (YAML or JSON)."""
+    from pipeline.templates import load_rows
+
+    spec = load_rows(path)
+    if ":" not in spec.get("scene", ""):
+        raise ValueError(f"{path}: 'scene' must be module.py:SceneName")
+    names = [v["name"] for v in spec.get("variants", [])]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{path}: variant names must be unique")
+    return spec
+
+
+def variant_class(base, name, overrides):
+    """Subclass of `base` with `overrides` as class attributes."""
+    suffix = re.sub(r"\W", "_", str(name))
+    return type(f"{base.__name__}_{suffix}", (base,), dict(overrides))
+
+
+# Worker side: one warm process renders many variants
+
+_modules = {}
+
+
+def _init_worker():
+    warm_up()
+
+
+def _render_variant(task):
+    target, variant, quality, media_dir = task
+    module_path, scene_name = target.rsplit(":", 1)
+    overrides = {k: v for k, v in variant.items() if k != "name"}
+    try:
+        # Imported once per worker; every variant shares its module state
+        if module_path not in _modules:
+            _modules[module_path] = load_module(module_path)
+        base = getattr(_modules[module_path], scene_name)
+        scene_class = variant_class(base, variant["name"], overrides)
+        output, wall = render_scene(scene_class, module_path, quality, media_dir)
+        return VariantResult(variant["name"], "ok", round(wall, 2), str(output))
+    except Exception:
+        return VariantResult(variant["name"], "failed", error=traceback.format_exc())
+
+
+def render_variants(target, variants, quality="h", media_dir=MEDIA_DIR, workers=1, on_result=None):
+    """
+    Render every variant of `target` ("module.py:Scene").
+    workers=1 renders in this process; more start that many warm processes.
+    """
+    tasks = [(target, variant, quality, str(media_dir)) for variant in variants]
+    results = []
+    if workers <= 1:
+        _init_worker()
+        for task in tasks:
+            results.append(_render_variant(task))
+            if on_result:
+                on_result(results[-1])
+        return results
+
+    # spawn: each worker imports manim itself instead of inheriting a forked,
+    # half-initialised copy of this process
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(min(workers, len(tasks)), initializer=_init_worker) as pool:
+        for result in pool.imap_unordered(_render_variant, tasks):
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
+
+def print_summary(results, wall_seconds):
+    print("\n" + "=" * 60)
+    for r in results:
+        icon = "✅" if r.status == "ok" else "❌"
+        print(f"{icon} {r.name:<30} {r.wall_seconds:>7.1f}s  {r.output}")
+    failed = sum(r.status == "failed" for r in results)
+    print("=" * 60)
+    print(f"Variants: {len(results)}  Failed: {failed}  Wall time: {wall_seconds:.1f}s")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Render variants of one scene in warm processes.")
+    parser.add_argument("spec", type=Path, help="Variant spec (.yaml or .json)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_NAMES), default=None, help="Overrides the spec's quality")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Warm worker processes (default: 1, this process)")
+    parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    parser.add_argument("--only", nargs="*", default=None, help="Render only these variant names")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    spec = load_spec(args.spec.resolve())
+    variants = spec["variants"]
+    if args.only is not None:
+        variants = [v for v in variants if v["name"] in args.only]
+    if not variants:
+        print("No variants to render")
+        return 0
+
+    quality = args.quality or spec.get("quality", "h")
+    print(f"🎨 Rendering {len(variants)} variants of {spec['scene']} in {max(args.jobs, 1)} warm process(es)")
+    start = time.perf_counter()
+    results = render_variants(
+        spec["scene"], variants, quality, args.media_dir.resolve(), args.jobs,
+        on_result=lambda r: print(f"[{r.status}] {r.name} ({r.wall_seconds:.1f}s)"),
+    )
+    print_summary(results, time.perf_counter() - start)
+    for r in results:
+        if r.status == "failed":
+            print(f"\n❌ {r.name}\n{r.error}")
+    return 1 if any(r.status == "failed" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
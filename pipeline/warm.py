@@ -0,0 +1,137 @@
+"""
+In-Process Rendering
+Render scenes inside an already running Python process.
+
+A `manim` command pays for importing manim, reading manim.cfg, discovering
+fonts and building a renderer before its first frame. The helpers here do
+that once per process (warm_up) and then render any number of scenes with
+per-render settings applied through manim's tempconfig. The in-memory Text
+and Tex caches stay warm between renders.
+
+Used by the variant batch renderer, the render server and watch mode.
+"""
+
+import importlib.util
+import itertools
+import os
+import sys
+import time
+from pathlib import Path
+
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT, inside_root
+
+# manim quality flag -> config value
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+_module_ids = itertools.count()
+
+
+def warm_up():
+    """Import manim and the project helpers from the project root, once per process."""
+    os.chdir(PROJECT_ROOT)  # manim.cfg is read from the working directory
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    import manim  # noqa: F401
+    import manimpango
+
+    import pipeline.scene  # noqa: F401  (installs the shared Tex cache)
+
+    # Font discovery happens on first use; do it now instead of mid-render
+    manimpango.list_fonts()
+
+
+def load_module(path):
+    """
+    Import a scene module from its file, always re-reading the source.
+    Each load gets a fresh module object, so edits are picked up without
+    restarting the process.
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    name = f"_scene_module_{path.stem}_{next(_module_ids)}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _project_file(module, root):
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    path = Path(path).resolve()
+    if not inside_root(path, root) or "site-packages" in path.parts:
+        return None
+    return path
+
+
+def reload_project_modules(changed_files, root=PROJECT_ROOT):
+    """
+    Forget the imported project modules (pipeline.* and friends) if any of
+    `changed_files` is one of them, so the next load_module imports them
+    fresh. All of them go, since the unchanged ones hold references into the
+    edited one. Returns the names that were dropped.
+    """
+    root = Path(root).resolve()
+    loaded = {name: _project_file(module, root) for name, module in list(sys.modules.items())}
+    loaded = {name: path for name, path in loaded.items() if path is not None and name != "__main__"}
+    changed = {Path(f).resolve() for f in changed_files}
+    if not changed & set(loaded.values()):
+        return []
+    for name in loaded:
+        del sys.modules[name]
+    return sorted(loaded)
+
+
+def render_scene(scene_class, module_path, quality="h", media_dir=MEDIA_DIR, options=None, progress=None):
+    """
+    Render one scene class in this process and return (output path, wall seconds).
+    `options` are extra manim config values; `progress(event)` is called after
+    every play() with a dict describing it.
+    """
+    from manim import tempconfig
+
+    module_path = Path(module_path)
+    if not module_path.is_absolute():
+        module_path = PROJECT_ROOT / module_path
+    config = {
+        "quality": QUALITY_NAMES[quality],
+        "media_dir": str(media_dir),
+        "input_file": str(module_path),
+        "format": "mp4",
+        "preview": False,
+        "write_to_movie": True,
+        **(options or {}),
+    }
+
+    start = time.perf_counter()
+    with tempconfig(config):
+        scene = scene_class()
+        if progress is not None:
+            _report_plays(scene, progress)
+        scene.render()
+        output = Path(scene.renderer.file_writer.movie_file_path)
+    return output, time.perf_counter() - start
+
+
+def _report_plays(scene, progress):
+    # wait() goes through play(), so every segment is reported
+    play = scene.play
+
+    def tracked(*args, **kwargs):
+        play(*args, **kwargs)
+        progress({
+            "event": "play",
+            "scene": type(scene).__name__,
+            "play": scene.renderer.num_plays,
+            "time": round(scene.renderer.time, 3),
+        })
+
+    scene.play = tracked
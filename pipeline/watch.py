@@ -0,0 +1,188 @@
+"""
+Watch Mode
+Re-render only the scenes an edit affects, a preview first and full quality after.
+
+    python -m pipeline.watch                                 # every scene
+    python -m pipeline.watch 3_Simulation/video_animations.py
+    python -m pipeline.watch GitCloneAnimation --no-hq
+
+Each scene depends on its own class, the module-level code around it, the
+project modules it imports and the input files it names (the same inputs as
+its scene cache key). On save, the watcher re-keys the scenes whose files
+changed; only scenes whose key moved are rendered. Editing one line of
+GitCloneAnimation re-renders GitCloneAnimation alone, and comment or
+whitespace edits render nothing.
+
+Previews render at -ql in this process, which keeps manim warm between
+saves, into media/preview/. Scene files are re-read on every preview; an
+edit to a project module (pipeline/*) makes the next preview import the
+project modules afresh. manim's partial movie cache there reuses every
+play() whose animations did not change, so only the edited segments are
+encoded again. After a preview, the orchestrator refreshes the full quality
+video in the background; a newer save restarts it.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from pipeline.discovery import discover_scenes, select_scenes
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT
+from pipeline.scene_cache import scene_dependencies, scene_key
+from pipeline.settings import ENCODER_ENV
+from pipeline.warm import load_module, reload_project_modules, render_scene, warm_up
+
+PREVIEW_DIR = MEDIA_DIR / "preview"
+HQ_LOG = MEDIA_DIR / "logs" / "pipeline" / "watch_hq.log"
+
+
+class Watcher:
+    """Polls the files the selected scenes depend on and reports changed scenes."""
+
+    def __init__(self, targets, quality="l"):
+        self.targets = targets
+        self.quality = quality
+        self.scenes, self.keys, self.mtimes = [], {}, {}
+        self.changed = set()  # changed files not yet handed to a preview
+        self.refresh()
+
+    def _mtimes(self, files):
+        mtimes = {}
+        for path in files:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
+
+    def _watched_files(self):
+        # Module files too, so new scene classes are picked up
+        files = {(PROJECT_ROOT / s.module).resolve() for s in self.scenes}
+        for scene in self.scenes:
+            files |= scene_dependencies(scene)
+        return files
+
+    def refresh(self):
+        """Re-discover the scenes and re-key them; return the scenes whose key changed."""
+        scenes = select_scenes(discover_scenes(), self.targets)
+        keys = {s.target: scene_key(s, self.quality) for s in scenes}
+        changed = [s for s in scenes if self.keys.get(s.target) != keys[s.target]]
+        self.scenes, self.keys = scenes, keys
+        self.mtimes = self._mtimes(self._watched_files())
+        return changed
+
+    def changed_files(self):
+        return [p for p, mtime in self._mtimes(self.mtimes).items() if mtime != self.mtimes[p]]
+
+    def wait_for_change(self, interval=0.5):
+        """Block until watched files change and settle; return the affected scenes."""
+        while True:
+            time.sleep(interval)
+            if not self.changed_files():
+                continue
+            # Editors often write in several steps; wait until the files settle
+            while True:
+                before = self._mtimes(self.mtimes)
+                time.sleep(interval)
+                if self._mtimes(self.mtimes) == before:
+                    break
+            self.changed |= set(self.changed_files())
+            try:
+                return self.refresh()
+            except SyntaxError as exc:
+                print(f"⚠️  {exc.filename}:{exc.lineno}: {exc.msg} (waiting for the next save)")
+                self.mtimes = self._mtimes(self.mtimes)
+
+
+class HighQualityRefresh:
+    """The background orchestrator run that re-renders changed scenes at full quality."""
+
+    def __init__(self, quality="h", media_dir=MEDIA_DIR):
+        self.quality = quality
+        self.media_dir = media_dir
+        self.process = None
+        self.pending = set()
+
+    def start(self, targets):
+        # A newer save makes the running refresh stale: restart it with every
+        # scene that has not been refreshed yet
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+        elif self.process is not None and self.process.returncode == 0:
+            self.pending.clear()
+        self.pending |= set(targets)
+
+        HQ_LOG.parent.mkdir(parents=True, exist_ok=True)
+        command = [
+            sys.executable, "-m", "pipeline.orchestrator",
+            "-q", self.quality, "--media-dir", str(self.media_dir), *sorted(self.pending),
+        ]
+        with open(HQ_LOG, "w", encoding="utf-8") as log:
+            self.process = subprocess.Popen(command, cwd=PROJECT_ROOT, stdout=log, stderr=subprocess.STDOUT)
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+
+def preview(scenes, quality="l", media_dir=PREVIEW_DIR, changed_files=()):
+    """Render scenes in this process; return the targets that rendered."""
+    # Scene modules are re-read by load_module; imported project modules are not
+    reloaded = reload_project_modules(changed_files)
+    if reloaded:
+        print(f"♻️  Reloading {len(reloaded)} project modules")
+    rendered = []
+    for scene in scenes:
+        print(f"🎬 Preview {scene.target}")
+        try:
+            scene_class = getattr(load_module(scene.module), scene.name)
+            output, wall = render_scene(scene_class, scene.module, quality, media_dir)
+        except Exception as exc:  # keep watching; the next save may fix it
+            print(f"❌ {scene.target}: {type(exc).__name__}: {exc}")
+            continue
+        print(f"✅ {output} ({wall:.1f}s)")
+        rendered.append(scene.target)
+    return rendered
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Re-render affected scenes on save.")
+    parser.add_argument("targets", nargs="*", help="Scene names, module paths or module.py:Scene")
+    parser.add_argument("-q", "--quality", choices=["l", "m"], default="l", help="Preview quality")
+    parser.add_argument("--hq-quality", choices=["h", "p", "k"], default="h")
+    parser.add_argument("--no-hq", action="store_true", help="Only render previews")
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between polls")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    watcher = Watcher(args.targets, args.quality)
+    hq = HighQualityRefresh(args.hq_quality)
+
+    # The streaming encoder skips manim's per-play cache, which previews rely on
+    os.environ.pop(ENCODER_ENV, None)
+    warm_up()
+    print(f"👀 Watching {len(watcher.mtimes)} files for {len(watcher.scenes)} scenes (Ctrl+C to stop)")
+    try:
+        while True:
+            changed = watcher.wait_for_change(args.interval)
+            if not changed:
+                continue
+            rendered = preview(changed, args.quality, changed_files=watcher.changed)
+            watcher.changed = set()
+            if rendered and not args.no_hq:
+                hq.start(rendered)
+                print(f"🔄 Refreshing {len(hq.pending)} scenes at -q{args.hq_quality} in the background ({HQ_LOG})")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        hq.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
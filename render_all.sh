@@ -20,47 +20,21 @@ fi
 echo "✅ Manim is installed"
 echo ""
 
-# Array of animations to render
-declare -a animations=(
-    "1_Real_Unknown/goal.py:GoalAnimation"
-    "2_Environment/read_files.py:FileReadAnimation"
-    "3_Simulation/simulation.py:SimulationAnimation"
-    "4_Formula/formula.py:FormulaAnimation"
-    "5_Symbols/code.py:CodeAnimation"
-    "6_Semblance/errors.py:ErrorAnimation"
-    "7_Testing_known/testing.py:TestingAnimation"
-)
-
-# Create output directory
-mkdir -p media/videos
+# Render every scene discovered in the numbered modules in parallel.
+# Extra arguments are passed through, e.g.:
+#   ./render_all.sh -j 8                      # cap concurrent renders
+#   ./render_all.sh 4_Formula/formula.py      # one module only
+#   ./render_all.sh GitCloneAnimation         # one scene only
+#   ./render_all.sh --tiers l                 # plus 480p15 review copies, same run
+cd "$(dirname "$0")" || exit 1
 
 echo "Starting rendering process..."
 echo ""
 
-# Counter
-total=${#animations[@]}
-current=0
-
-# Render each animation
-for animation in "${animations[@]}"; do
-    current=$((current + 1))
-    IFS=':' read -r file scene <<< "$animation"
-    
-    echo "[$current/$total] Rendering: $scene from $file"
-    echo "----------------------------------------"
-    
-    # Render with high quality settings
-    manim -qh --format=mp4 --media_dir ./media "$file" "$scene"
-    
-    if [ $? -eq 0 ]; then
-        echo "✅ Successfully rendered: $scene"
-    else
-        echo "❌ Failed to render: $scene"
-    fi
-    
-    echo ""
-done
+python3 -m pipeline.orchestrator -q h --media-dir ./media "$@"
+status=$?
 
+echo ""
 echo "============================"
 echo "✨ Rendering complete!"
 echo ""
@@ -73,3 +47,5 @@ echo "3. Edit and enhance your animations"
 echo "4. Export your final video"
 echo ""
 echo "For more information, see DAVINCI_RESOLVE.md"
+
+exit $status
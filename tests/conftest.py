@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pipeline package lives at the project root, like for the scene modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from pipeline.animations import BatchTransform
+
+
+def squares():
+    return manim.VGroup(*[manim.Square(side_length=0.5).shift(i * manim.RIGHT) for i in range(3)])
+
+
+def unbatched(group, alpha, **kwargs):
+    # The per-object animations BatchTransform replaces
+    for member in group:
+        animation = member.animate(**kwargs).scale(0.1).shift(manim.UP).set_opacity(0).build()
+        animation.begin()
+        animation.interpolate(alpha)
+
+
+@pytest.mark.parametrize("alpha", [0.25, 0.5, 0.8])
+@pytest.mark.parametrize("rate_func", [None, manim.linear, manim.rush_into])
+def test_matches_unbatched_animations(alpha, rate_func):
+    kwargs = {} if rate_func is None else {"rate_func": rate_func}
+    expected, batched = squares(), squares()
+    unbatched(expected, alpha, **kwargs)
+
+    animation = BatchTransform(batched, scale=0.1, shift=manim.UP, opacity=0, **kwargs)
+    animation.begin()
+    animation.interpolate(alpha)
+
+    for want, got in zip(expected, batched):
+        np.testing.assert_allclose(got.points, want.points, atol=1e-6)
+        np.testing.assert_allclose(got.get_stroke_opacity(), want.get_stroke_opacity(), atol=1e-6)
@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+from pipeline.assets import (
+    AssetEntry, AssetQueue, BackendError, MANIFEST_NAME, default_budget, load_manifest, manifest_spent,
+)
+
+COSTS = {"test/model": {"per_request": 1.0}}
+
+
+class ScriptedBackend:
+    """Answers each request with the next scripted outcome: an error or a file."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def generate(self, entry):
+        self.calls += 1
+        await asyncio.sleep(0.01)  # requests overlap, as on a real backend
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if isinstance(outcome, Exception):
+            raise outcome
+        return b"png", "image/png"
+
+
+def entry(prompt="a dot"):
+    return AssetEntry(id="a1", name="dot", kind="image", priority="HIGH", prompt=prompt, model="test/model", seed=1)
+
+
+def run(tmp_path, backend, budget=10.0, entries=None):
+    queue = AssetQueue(backend, budget, tmp_path, workers=2, retries=3, backoff=0, costs=COSTS)
+    results = asyncio.run(queue.run(entries or [entry()]))
+    return queue, results
+
+
+def test_regenerating_a_changed_entry_keeps_the_earlier_spend(tmp_path):
+    run(tmp_path, ScriptedBackend())
+    queue, results = run(tmp_path, ScriptedBackend(), entries=[entry("a bigger dot")])
+    assert results[0].status == "ok"
+    assert queue.spent == 2.0
+    assert manifest_spent(load_manifest(tmp_path)) == 2.0
+
+
+def test_budget_stop_holds_across_runs(tmp_path):
+    run(tmp_path, ScriptedBackend(), budget=1.5)
+    backend = ScriptedBackend()
+    _, results = run(tmp_path, backend, budget=1.5, entries=[entry("a bigger dot")])
+    assert results[0].status == "over_budget"
+    assert backend.calls == 0
+
+
+def test_possibly_billed_failures_are_charged_and_rate_limits_refunded(tmp_path):
+    backend = ScriptedBackend(
+        BackendError("timed out"),
+        BackendError("HTTP 503", billed=True),
+        BackendError("HTTP 429", billed=False),
+    )
+    queue, results = run(tmp_path, backend)
+    assert results[0].status == "ok" and results[0].attempts == 4
+    # Timeout, 503 and the success are paid; the rate-limited attempt is not
+    assert queue.spent == results[0].cost == 3.0
+    assert manifest_spent(load_manifest(tmp_path)) == 3.0
+
+
+def test_retries_stop_at_the_budget(tmp_path):
+    backend = ScriptedBackend(*[BackendError("HTTP 500")] * 4)
+    queue, results = run(tmp_path, backend, budget=2.0)
+    assert results[0].status == "over_budget"
+    assert backend.calls == 2 and queue.spent == 2.0
+
+
+def test_manifests_without_a_ledger_keep_their_spend(tmp_path):
+    old = {"a1": {"request": "abc", "path": str(tmp_path / "a1.png"), "cost": 0.25}}
+    (tmp_path / MANIFEST_NAME).write_text(json.dumps(old), encoding="utf-8")
+    manifest = load_manifest(tmp_path)
+    assert manifest["assets"] == old
+    assert manifest_spent(manifest) == 0.25
+
+
+def test_default_budget_comes_from_the_first_loaded_source(tmp_path):
+    queue_file = tmp_path / "queue.yaml"
+    queue_file.write_text("# Budget: $7.50\nimages: []\n", encoding="utf-8")
+    assert default_budget([tmp_path / "missing.yaml", queue_file]) == 7.5
+
+
+def test_entries_wait_for_reserved_budget_to_settle(tmp_path):
+    entries = [
+        AssetEntry(id=f"a{i}", name="dot", kind="image", priority="HIGH", prompt="a dot", model="test/model", seed=i)
+        for i in range(3)
+    ]
+    # a0 is rejected unbilled while a1 is in flight; a2 waits for that room
+    backend = ScriptedBackend(BackendError("HTTP 400", retryable=False, billed=False))
+    queue, results = run(tmp_path, backend, budget=2.0, entries=entries)
+    assert [r.status for r in results] == ["failed", "ok", "ok"]
+    assert queue.spent == 2.0
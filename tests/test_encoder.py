@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+pytest.importorskip("av")
+
+from pipeline.scene import ProjectScene
+from pipeline.settings import ENCODER_ENV, OUTPUT_ENV, STREAM_MODE, TIERS_ENV
+
+
+class TwoPlays(ProjectScene):
+    def construct(self):
+        square = manim.Square()
+        self.play(manim.Create(square), run_time=0.5)
+        self.play(square.animate.shift(manim.RIGHT), run_time=0.5)
+
+
+def render(media_dir, quality="low_quality"):
+    options = {
+        "media_dir": str(media_dir),
+        "quality": quality,
+        "disable_caching": True,
+        "format": "mp4",
+        "write_to_movie": True,
+        "preview": False,
+        "input_file": __file__,
+    }
+    with manim.tempconfig(options):
+        scene = TwoPlays()
+        scene.render()
+        return scene.renderer.file_writer
+
+
+@pytest.mark.parametrize("env, suffix", [
+    ({ENCODER_ENV: STREAM_MODE}, ".mp4"),
+    ({OUTPUT_ENV: "prores"}, ".mov"),
+    ({OUTPUT_ENV: "qtrle"}, ".mov"),
+])
+def test_streamed_render_writes_the_movie(tmp_path, monkeypatch, env, suffix):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    file_writer = render(tmp_path)
+    movie = Path(file_writer.movie_file_path)
+    assert movie.suffix == suffix
+    assert movie.exists() and movie.stat().st_size > 0
+    assert file_writer.index_path.exists()
+
+
+def test_tiers_write_the_movie_and_the_lower_quality(tmp_path, monkeypatch):
+    monkeypatch.setenv(ENCODER_ENV, STREAM_MODE)
+    monkeypatch.setenv(TIERS_ENV, "l")
+    file_writer = render(tmp_path, quality="medium_quality")
+    movie = Path(file_writer.movie_file_path)
+    assert movie.exists() and movie.stat().st_size > 0
+    tier = movie.parent.parent / "480p15" / movie.name
+    assert tier.exists() and tier.stat().st_size > 0
+
+
+def png_writer(tmp_path, name):
+    from pipeline.encoder import StreamingFileWriter
+
+    # Just enough of a writer to run the PNG encoder thread
+    writer = StreamingFileWriter.__new__(StreamingFileWriter)
+    writer.output = "png"
+    writer.output_name = name
+    writer.movie_file_path = str(tmp_path / f"{name}.mov")
+    writer.stream_frames = 0
+    writer._keyframe_next = False
+    writer._current = {}
+    writer._container = None
+    writer.tiers = []
+    writer.reused_frames = 0
+    return writer
+
+
+def test_writer_failure_is_raised_instead_of_blocking(tmp_path, monkeypatch):
+    writer = png_writer(tmp_path, "Failing")
+
+    def full_disk(frame, num_frames, pts):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(writer, "_write_pngs", full_disk)
+    frame = np.zeros((4, 4, 4), dtype=np.uint8)
+    with manim.tempconfig({"write_to_movie": True}):
+        writer._open_stream()
+        with pytest.raises(OSError, match="No space left"):
+            # More frames than the queue holds: a dead writer must not block this
+            for _ in range(200):
+                writer.write_frame(frame)
+        with pytest.raises(OSError, match="No space left"):
+            writer.close_stream()
+
+
+def test_drain_waits_for_queued_frames(tmp_path, monkeypatch):
+    import time
+
+    writer = png_writer(tmp_path, "Draining")
+    written = []
+
+    def slow_disk(frame, num_frames, pts):
+        time.sleep(0.01)
+        written.append(pts)
+        return pts + num_frames
+
+    monkeypatch.setattr(writer, "_write_pngs", slow_disk)
+    frame = np.zeros((4, 4, 4), dtype=np.uint8)
+    with manim.tempconfig({"write_to_movie": True}):
+        writer._open_stream()
+        for _ in range(20):
+            writer.write_frame(frame)
+        writer.drain()
+        assert len(written) == 20
+        writer.close_stream()
+
+
+def test_qtrle_frames_are_all_keyframes(tmp_path, monkeypatch):
+    import av
+
+    from pipeline.encoder import add_video_stream
+
+    monkeypatch.setenv(OUTPUT_ENV, "qtrle")
+    path = tmp_path / "overlay.mov"
+    with av.open(str(path), mode="w") as container:
+        stream = add_video_stream(container, 30, 64, 64)
+        for pts in range(40):
+            frame = av.VideoFrame.from_ndarray(np.full((64, 64, 4), pts, dtype=np.uint8), format="rgba")
+            frame.pts = pts
+            container.mux(stream.encode(frame))
+        container.mux(stream.encode())
+    # Resume splices and section cuts may start on any of them
+    with av.open(str(path)) as container:
+        packets = [p for p in container.demux(container.streams.video[0]) if p.pts is not None]
+    assert len(packets) == 40 and all(p.is_keyframe for p in packets)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from pipeline.layers import LayeredCairoRenderer
+
+
+class Recording:
+    """Keeps a copy of every frame the renderer sends to the file writer."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frames = []
+        self.layered = []
+
+    def add_frame(self, frame, num_frames=1):
+        self.frames.append(frame.copy())
+        self.layered.append(getattr(self, "layer_plan", None) is not None)
+        super().add_frame(frame, num_frames)
+
+
+class RecordingCairo(Recording, CairoRenderer):
+    pass
+
+
+class RecordingLayered(Recording, LayeredCairoRenderer):
+    pass
+
+
+class MovingUnderStatic(manim.Scene):
+    def construct(self):
+        # Drawn first, so manim has no static mobjects and no static image
+        mover = manim.Square(fill_opacity=1, color=manim.BLUE).shift(3 * manim.LEFT)
+        between = [
+            manim.Triangle(fill_opacity=0.7, color=manim.ORANGE).scale(0.4).shift(manim.RIGHT * (i - 2))
+            for i in range(4)
+        ]
+        circles = manim.VGroup(*[
+            manim.Circle(radius=0.6, fill_opacity=0.5, color=color).shift(manim.RIGHT * (i - 2) + manim.DOWN)
+            for i, color in enumerate([manim.RED, manim.GREEN, manim.YELLOW, manim.PINK, manim.TEAL])
+        ])
+        above = [
+            manim.Square(side_length=0.8, fill_opacity=0.4, color=manim.WHITE).shift(manim.RIGHT * (i - 2) + manim.UP)
+            for i in range(5)
+        ]
+        # Runs: mover, static layer, moving circles, static layer
+        self.add(mover, *between, circles, *above)
+        self.play(mover.animate.shift(6 * manim.RIGHT).rotate(1), circles.animate.shift(manim.UP), run_time=1)
+
+
+def render(renderer_class):
+    options = {"quality": "low_quality", "write_to_movie": False, "disable_caching": True, "preview": False}
+    with manim.tempconfig(options):
+        renderer = renderer_class()
+        MovingUnderStatic(renderer=renderer).render()
+    return renderer
+
+
+def test_layered_frames_match_direct_drawing():
+    plain = render(RecordingCairo)
+    layered = render(RecordingLayered)
+    # The static runs between and above the moving mobjects were composited as layers
+    assert any(layered.layered)
+    assert len(plain.frames) == len(layered.frames)
+    for direct, composited in zip(plain.frames, layered.frames):
+        # Premultiplied OVER rounds differently from drawing in place by at most a step or two
+        assert np.abs(direct.astype(int) - composited.astype(int)).max() <= 2
@@ -0,0 +1,27 @@
+from pipeline.discovery import discover_scenes, select_scenes
+from pipeline.orchestrator import RenderJob
+from pipeline.settings import OUTPUT_ENV, TIERS_ENV
+
+SCENES = {scene.target: scene for scene in discover_scenes()}
+
+
+def test_plain_scenes_ignore_project_scene_settings():
+    env = {OUTPUT_ENV: "prores", TIERS_ENV: "l"}
+    plain = RenderJob(scene=SCENES["5_Symbols/examples.py:HelloWorld"], env=env)
+    assert not plain.scene.project
+    assert plain.output_path.suffix == ".mp4"
+    assert plain.tier_paths == {}
+    assert OUTPUT_ENV not in plain.pipeline_env
+
+    project = RenderJob(scene=SCENES["2_Environment/read_files.py:FileReadAnimation"], env=env)
+    assert project.scene.project
+    assert project.output_path.suffix == ".mov"
+    assert set(project.tier_paths) == {"l"}
+
+
+def test_caption_track_renders_only_when_named():
+    scenes = list(SCENES.values())
+    caption = "3_Simulation/captions.py:CaptionTrackAnimation"
+    assert caption not in {s.target for s in select_scenes(scenes, [])}
+    assert [s.target for s in select_scenes(scenes, ["CaptionTrackAnimation"])] == [caption]
+    assert [s.target for s in select_scenes(scenes, ["3_Simulation/captions.py"])] == [caption]
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from pipeline.discovery import scenes_in_file
+from pipeline.scene_cache import SceneCache, scene_key
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_tiers_are_stored_and_restored_with_the_movie(tmp_path):
+    cache = SceneCache(tmp_path / "cache")
+    movie = write(tmp_path / "1080p60" / "Scene.mp4", b"main")
+    tier = write(tmp_path / "480p15" / "Scene.mp4", b"tier of the same render")
+    assert cache.store("key", movie, tiers={"l": tier})
+
+    movie.write_bytes(b"a newer render")
+    tier.unlink()
+    assert cache.restore("key", movie, {"l": tier})
+    assert movie.read_bytes() == b"main"
+    assert tier.read_bytes() == b"tier of the same render"
+
+
+def test_entries_without_the_requested_tier_miss(tmp_path):
+    cache = SceneCache(tmp_path / "cache")
+    movie = write(tmp_path / "1080p60" / "Scene.mp4", b"main")
+    assert cache.store("key", movie)
+    tier = tmp_path / "480p15" / "Scene.mp4"
+    assert not cache.restore("key", movie, {"l": tier})
+    assert not tier.exists()
+    # Nor is a render stored whose tier is missing
+    assert not cache.store("other", movie, tiers={"l": tier})
+    assert cache.lookup("other") is None
+
+
+SCENES = """
+from manim import *
+
+class Pulse(Animation):
+    RATE = {rate}
+
+class Intro(Scene):
+    def construct(self):
+        self.play(Pulse(Dot()))
+
+class Outro(Scene):
+    def construct(self):
+        self.wait({wait})
+"""
+
+
+def test_key_follows_helper_classes_but_not_other_scenes(tmp_path):
+    module = tmp_path / "1_Intro" / "scenes.py"
+
+    def key(rate=1, wait=1):
+        write(module, SCENES.format(rate=rate, wait=wait).encode())
+        intro = next(s for s in scenes_in_file(module, tmp_path) if s.name == "Intro")
+        return scene_key(intro, root=tmp_path)
+
+    base = key()
+    assert key(rate=2) != base
+    assert key(wait=2) == base
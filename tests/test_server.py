@@ -0,0 +1,63 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from pipeline.discovery import discover_scenes
+from pipeline.paths import MEDIA_DIR, PROJECT_ROOT
+from pipeline.server import RenderHandler, RenderQueue, validate_request
+
+SCENE = discover_scenes()[0]
+
+
+def request(**overrides):
+    return {"target": SCENE.target, "quality": "l", "media_dir": str(MEDIA_DIR), "env": {}, "options": {}, **overrides}
+
+
+def test_project_scene_is_accepted():
+    job = validate_request(request(target=f"{PROJECT_ROOT / SCENE.module}:{SCENE.name}", env={"PIPELINE_ENCODER": "stream"}))
+    assert job["target"] == SCENE.target
+    assert job["env"] == {"PIPELINE_ENCODER": "stream"}
+
+
+@pytest.mark.parametrize("overrides", [
+    {"target": "/tmp/evil.py:Scene"},
+    {"target": f"{SCENE.module.as_posix()}:NotAScene"},
+    {"target": "pipeline/server.py:RenderQueue"},
+    {"env": {"PYTHONPATH": "/tmp"}},
+    {"env": {"LD_PRELOAD": "/tmp/x.so"}},
+    {"media_dir": "/tmp/media"},
+    {"media_dir": str(PROJECT_ROOT / ".." / "media")},
+    {"options": {"media_dir": "/tmp"}},
+    {"quality": "x"},
+])
+def test_anything_else_is_refused(overrides):
+    with pytest.raises(ValueError):
+        validate_request(request(**overrides))
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RenderHandler)
+    httpd.render_queue = RenderQueue()  # no render thread: nothing here gets rendered
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/render"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("headers, status", [
+    ({"Content-Type": "text/plain"}, 415),
+    ({"Content-Type": "application/x-www-form-urlencoded"}, 415),
+    ({"Content-Type": "application/json", "Origin": "https://example.com"}, 403),
+    ({"Content-Type": "application/json"}, 400),  # valid JSON, refused target
+])
+def test_post_checks(server, headers, status):
+    body = json.dumps(request(target="/tmp/evil.py:Scene")).encode("utf-8")
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        urllib.request.urlopen(urllib.request.Request(server, data=body, headers=headers))
+    assert exc.value.code == status
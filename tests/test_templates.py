@@ -0,0 +1,26 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from pipeline.templates import centered_origin, color, grid_columns
+
+
+@pytest.mark.parametrize("count, columns", [(4, 4), (5, 5), (8, 4), (20, 7), (50, 13)])
+def test_card_columns_follow_the_count_and_the_frame(count, columns):
+    assert grid_columns(count, 3.3, 3.8, cell_width=3, cell_height=3.5) == columns
+
+
+def test_stat_columns_keep_the_square_layout_for_four():
+    assert grid_columns(4, 4.5, 2.5, cell_width=3, cell_height=1.5) == 2
+
+
+def test_centered_origin_mirrors_the_last_cell():
+    origin = centered_origin(6, 3, 2.0, 1.0)
+    assert origin[0] == -2.0 and origin[1] == pytest.approx(0.5 - 0.2)
+
+
+def test_color_names_only_resolve_to_colors():
+    assert color("orange") == manim.ORANGE
+    assert color("#FF8800") == manim.ManimColor("#FF8800")
+    with pytest.raises(ValueError):
+        color("left")
@@ -0,0 +1,22 @@
+import shutil
+
+import pytest
+
+pytest.importorskip("manim")
+if not (shutil.which("latex") and shutil.which("dvisvgm")):
+    pytest.skip("latex and dvisvgm are required", allow_module_level=True)
+
+from pipeline.tex_cache import TexCache
+
+
+def test_uncached_formula_compiles_into_the_cache(tmp_path):
+    cache = TexCache(tmp_path / "tex")
+    svg = cache.svg_for(r"e^{i\pi} + 1 = 0", "align*")
+    assert svg.parent == cache.directory
+    assert svg.exists() and svg.read_text(encoding="utf-8").lstrip().startswith("<?xml")
+    assert (cache.hits, cache.misses) == (0, 1)
+    # Only the published SVG is left behind
+    assert [p.name for p in cache.directory.iterdir() if p.name != "locks"] == [svg.name]
+
+    assert cache.svg_for(r"e^{i\pi} + 1 = 0", "align*") == svg
+    assert (cache.hits, cache.misses) == (1, 1)
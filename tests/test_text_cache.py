@@ -0,0 +1,27 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from pipeline.text_cache import TextOutlineCache
+
+
+def test_least_recently_used_outlines_are_evicted(tmp_path):
+    cache = TextOutlineCache(tmp_path, budget=1)
+    outlines = (np.zeros((4, 3)),)
+    now = time.time()
+    for age, key in [(3600, "old"), (1800, "used"), (0, "fresh")]:
+        cache._save(key, outlines)
+        os.utime(cache._path(key), (now - age, now - age))
+
+    # Loading marks an entry as used
+    assert cache._load("used") is not None
+    cache.evict()
+    assert not cache._path("old").exists()
+    # Used within the last minute, so kept over budget
+    assert cache._path("used").exists()
+    assert cache._path("fresh").exists()
+    assert cache._load("old") is None
@@ -0,0 +1,43 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from pipeline.timeline import TimelineSegment
+
+
+class FakeFileWriter:
+    """The parts of manim's SceneFileWriter a timeline touches."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.partial_movie_files = []
+        self.sections = [SimpleNamespace(partial_movie_files=[])]
+
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def add_partial_movie_file(self, hash_animation):
+        path = None if hash_animation is None else str(self.directory / f"{hash_animation}.mp4")
+        self.partial_movie_files.append(path)
+        self.sections[-1].partial_movie_files.append(path)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self.open = self.partial_movie_files[0]
+
+    def end_animation(self, allow_write=False):
+        Path(self.open).write_bytes(b"segment")
+
+
+def test_renamed_segment_is_what_gets_concatenated(tmp_path):
+    fw = FakeFileWriter(tmp_path)
+    scene = SimpleNamespace(renderer=SimpleNamespace(file_writer=fw))
+    with TimelineSegment(scene):
+        for hash_animation in ("a", "b", "c"):
+            fw.add_partial_movie_file(hash_animation)
+            fw.begin_animation(allow_write=True)
+            fw.end_animation(allow_write=True)
+
+    movie_files = [f for f in fw.partial_movie_files if f is not None]
+    assert len(movie_files) == 1
+    assert Path(movie_files[0]).exists()
+    assert Path(movie_files[0]).name.startswith("timeline_")
+    assert [f for f in fw.sections[-1].partial_movie_files if f is not None] == movie_files
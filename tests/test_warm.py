@@ -0,0 +1,37 @@
+import sys
+import types
+
+import pytest
+
+from pipeline.paths import PROJECT_ROOT
+from pipeline.warm import reload_project_modules
+
+
+@pytest.fixture(autouse=True)
+def restore_modules():
+    saved = dict(sys.modules)
+    yield
+    sys.modules.update(saved)
+
+
+def fake_module(monkeypatch, name, path):
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+def test_project_module_edit_drops_every_project_module(monkeypatch):
+    fake_module(monkeypatch, "pipeline._edited", PROJECT_ROOT / "pipeline" / "_edited.py")
+    fake_module(monkeypatch, "pipeline._user", PROJECT_ROOT / "pipeline" / "_user.py")
+    fake_module(monkeypatch, "_outside", "/usr/lib/python3/_outside.py")
+
+    dropped = reload_project_modules([PROJECT_ROOT / "pipeline" / "_edited.py"])
+    assert {"pipeline._edited", "pipeline._user", "pipeline.warm"} <= set(dropped)
+    assert "pipeline._edited" not in sys.modules and "pipeline._user" not in sys.modules
+    assert "_outside" in sys.modules
+
+
+def test_other_edits_keep_the_modules(monkeypatch):
+    fake_module(monkeypatch, "pipeline._kept", PROJECT_ROOT / "pipeline" / "_kept.py")
+    assert reload_project_modules([PROJECT_ROOT / "3_Simulation" / "captions.py"]) == []
+    assert "pipeline._kept" in sys.modules